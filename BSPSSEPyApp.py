@@ -350,12 +350,12 @@ class BSPSSEPyApp(App[None]):  # Inheriting from the Textual App class
         elif event.button.id == "StopButton":
             self.RunWorker.cancel()
             self.StopButton.disabled = True
-            self.CaseTree.disabled = False
+            self.RunButton.disabled = True
+            self.CaseTree.disabled = True
             app.DummyRun = False
 
-            # fix the line below for me plz
-            if self.CaseTree.cursor_node and str(self.CaseTree.cursor_node.label).lower().endswith(".sav"):
-                self.RunButton.disabled = False
+            # Run and the CaseTree are enabled again once the PSSE worker thread has finished its current call
+            self.run_worker(self.EnableAfterStop())
 
             # if str(self.CaseTree.selectednode.label).lower().endswith(".sav"):
             #     self.RunButton.disabled = False
@@ -375,6 +375,17 @@ class BSPSSEPyApp(App[None]):  # Inheriting from the Textual App class
 
             
 
+    async def EnableAfterStop(self) -> None:
+        """
+        Enables the CaseTree (and Run, for a selected .sav file) after Stop, once the in-flight psspy call is done.
+        """
+        from Functions.BSPSSEPy.PSSE.PSSE import WaitForPSSE
+        await WaitForPSSE()
+
+        self.CaseTree.disabled = False
+        if self.CaseTree.cursor_node and str(self.CaseTree.cursor_node.label).lower().endswith(".sav"):
+            self.RunButton.disabled = False
+
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         """
         Handles the event when a tree node (file or folder) is selected.
@@ -400,7 +411,8 @@ class BSPSSEPyApp(App[None]):  # Inheriting from the Textual App class
                 app.SAVFilePath = os.path.join(self.CaseFolderPath, *FullPathParts)
                 app.ConfigPath = f"{app.SAVFilePath[:-4]}_Config.py"
 
-                # Update GUI Tables
+                # Update GUI Tables (Run is enabled again once the tables are updated)
+                self.RunButton.disabled = True
                 from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import UpdateBSPSSEPyAppGUI
                 self.RunWorker = self.run_worker(UpdateBSPSSEPyAppGUI(app=self, ResetTables=True))
 
@@ -0,0 +1,57 @@
+# ===========================================================
+#   BSPSSEPy Application - GUI Table Diff Kernel
+# ===========================================================
+#   This module holds the cell-by-cell scan used to find the
+#   changed cells of the numeric columns of a GUI table between
+#   two refreshes. It is compiled with Numba when Numba is
+#   installed; otherwise the same code runs as plain Python/NumPy.
+#
+#   Last Updated: BSPSSEPy Ver 0.4 (11 Feb 2025)
+#   Copyright (c) 2024-2025, Ilyas Farhat
+#   Contact: ilyas.farhat@outlook.com
+# ===========================================================
+
+import numpy as np
+from Functions.BSPSSEPy.BSPSSEPyNumba import njit
+
+
+@njit(cache=True)
+def DiffScan(Old, New, ChangedRows, ChangedCols):
+    """
+    Finds the cells that differ between two numeric tables of the same shape.
+
+    Two cells are considered equal when they would be displayed with the same text, i.e.,
+    NaN equals NaN and 0.0 differs from -0.0.
+
+    Parameters:
+        Old (np.ndarray[float64, 2D]): Values currently shown in the GUI table.
+        New (np.ndarray[float64, 2D]): New values of the same cells.
+        ChangedRows (np.ndarray[int64]): Output - row positions of the changed cells (size >= Old.size, filled in place).
+        ChangedCols (np.ndarray[int64]): Output - column positions of the changed cells (filled in place).
+
+    Returns:
+        int: Number of changed cells (the first Count entries of ChangedRows/ChangedCols are valid), in row-major order.
+    """
+    Count = 0
+    for i in range(Old.shape[0]):
+        for j in range(Old.shape[1]):
+            a = Old[i, j]
+            b = New[i, j]
+            if a != b:
+                if a != a and b != b:
+                    continue  # Both NaN
+            elif a != 0.0 or np.signbit(a) == np.signbit(b):
+                continue  # Same value (and same sign for zeros)
+            ChangedRows[Count] = i
+            ChangedCols[Count] = j
+            Count += 1
+    return Count
+
+
+def WarmUpDiffKernel():
+    """
+    Calls DiffScan once with empty arrays so that Numba compiles (or loads from its cache) the kernel
+    before the first GUI table update.
+    """
+    Empty = np.zeros((0, 0), dtype=np.float64)
+    DiffScan(Empty, Empty, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
@@ -4,11 +4,36 @@ from rich.text import Text
 from textual.app import App
 from textual import events
 from textual.widgets import Tree, DataTable
+import numpy as np
 import pandas as pd
 import asyncio  # Used for async operations
+import functools
 import time
 import psse3601
 import psspy
+from Functions.BSPSSEPy.App.BSPSSEPyAppDiffKernel import DiffScan
+
+# Map of the control sequence Action Status to the emoji shown in the Progress column
+ActionStatusEmoji = {
+    0: " 🔴 ",  # Not started
+    1: " ⏳ ",  # Running/Loading (sand watch)
+    2: " ✅ ",  # Completed (green check)
+    -999: "⚠︎ ",  # Skipped
+}
+
+# Fixed emoji vocabulary of the Progress column (stored as a categorical: one small integer code per row)
+ActionStatusEmojiDType = pd.CategoricalDtype(list(ActionStatusEmoji.values()) + [" ☠️ "])  # Last: unexpected status (error)
+
+# GUI tables: (table name, displayed columns, attribute of the DataTable widget on the app)
+BSPSSEPyAppTableSpecs = (
+    ("Progress", ("Progress", "Control Sequence", "Device Type", "ID Type", "ID Value", "Action Type", "Action Time", "Action Status"), "ProgressTable"),
+    ("AGC", ("Gen Name", "Alpha", "ΔPᴳ", "Δf"), "AGCTable"),
+    ("Generator", ("Gen Name", "Bus #", "Bus Name", "Δf", "Pᴱ", "Pᴹ", "Qᴱ", "Gᴿᴱꟳ", "Vᴿᴱꟳ"), "GeneratorTable"),
+    ("Load", ("Load Name", "Bus #", "Bus Name", "Power Array [PL, QL, IP, IQ, YP, YQ, PG, QG]", "Status"), "LoadTable"),
+    ("Bus", ("Bus #", "Bus Name", "Type", "Status"), "BusTable"),
+    ("Branch", ("Branch Name", "From Bus #", "To Bus #", "From Bus Name", "To Bus Name", "Status"), "BranchTable"),
+    ("Transformer", ("Trans. Name", "From Bus #", "To Bus #", "From Bus Name", "To Bus Name", "Status"), "TransformerTable"),
+)
 # from textual.widgets
 
 async def GetBSPSSEPyAppDFs(
@@ -29,7 +54,9 @@ async def GetBSPSSEPyAppDFs(
     RoundDigit = 3
     
 
+    # Read the GUI settings once (widget attribute access is not free)
     DebugPrint = app.DebugCheckBox.value
+    SleepTime = app.bsprintasynciotime
 
     # Debugging information
     if DebugPrint:
@@ -56,7 +83,7 @@ async def GetBSPSSEPyAppDFs(
         
         from Functions.BSPSSEPy.App.BSPSSEPyAppRun import RunSimulation
         await RunSimulation(app=app, DummyRun = True)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        await asyncio.sleep(SleepTime)
 
         
         # await asyncio.sleep(0)
@@ -78,180 +105,137 @@ async def GetBSPSSEPyAppDFs(
     if DebugPrint:
         bsprint("Shortcut to simulation dataframes acquired", app=app)
 
-    # Define a function to map Action Status to emojis
-    def MapStatusToEmoji(status):
-        if status == 0:
-            return " 🔴 "  # Not started
-        elif status == 1:
-            return " ⏳ "  # Running/Loading (sand watch)
-        elif status == 2:
-            return " ✅ "  # Completed (green check)
-        elif status == -999:
-            return "⚠︎ "  # Skipped
-        else:
-            return " ☠️ "  # Unexpected status (error)
-        
+    # Tables that only change when their source columns change are rebuilt only when their change token changes.
+    # The token is (Sim object, hash of the source columns), so a new simulation always rebuilds them.
+    Sim = app.myBSPSSEPy.Sim
+    TableCache = getattr(app, "BSPSSEPyTableCache", None)
+    if TableCache is None:
+        TableCache = app.BSPSSEPyTableCache = {}
+
+    def CachedTable(TableName, SourceToken, BuildTable):
+        """Returns the cached table DataFrame if its source token did not change, otherwise rebuilds it with BuildTable()."""
+        Token = (Sim, SourceToken)
+        Cached = TableCache.get(TableName)
+        if Cached is not None and Cached[0] == Token:
+            return Cached[1]
+        TableDF = ShrinkDataFrame(BuildTable())
+        TableCache[TableName] = (Token, TableDF)
+        return TableDF
+
     def ActionTimeMinSec(ActionTime, InSeconds = False):
         """
-        Converts an action time in minutes to a formatted string with both minutes and seconds.
+        Converts a column of action times in minutes to formatted strings with both minutes and seconds.
         
         If the seconds value is a whole number, it is displayed as an integer without decimals.
         
         Parameters:
-            ActionTime (float | int): The action time in minutes.
+            ActionTime (pd.Series): The action times in minutes (or in seconds if InSeconds is True).
 
         Returns:
-            str: Formatted string in the format "X min (Ys)".
+            list[str]: Formatted strings in the format "X min (Ys)".
         """
+        ActionTime = ActionTime.to_numpy(dtype=np.float64)
         if InSeconds:
             ActionTime = ActionTime / 60 # Convert to Minuts first
         
         TotalSeconds = ActionTime * 60  # Convert to seconds
 
         # ✅ If seconds are whole (integer), display as int
-        SecondsFormatted = int(TotalSeconds) if TotalSeconds.is_integer() else round(TotalSeconds, 1)
+        IsWhole = (np.isfinite(TotalSeconds) & (TotalSeconds == np.floor(TotalSeconds))).tolist()
+        SecondsRounded = np.round(TotalSeconds, 1).tolist()
+        MinutesRounded = np.round(ActionTime, RoundDigit).tolist()
 
-        return f"{round(ActionTime, RoundDigit)} min ({SecondsFormatted}s)"
+        return [
+            f"{Minutes} min ({int(Seconds) if Whole else SecondsR}s)"
+            for Minutes, Seconds, Whole, SecondsR in zip(MinutesRounded, TotalSeconds.tolist(), IsWhole, SecondsRounded)
+        ]
 
 
     
 
-    # Define the ProgressDF DataFrame with mapped columns
-    ProgressDF = pd.DataFrame({
-        "Progress": BSPSSEPySequence["Action Status"].apply(MapStatusToEmoji),  # Initially all actions are not started
-        "Control Sequence": BSPSSEPySequence["Control Sequence"],  # All set to zero for now
-        "Device Type": BSPSSEPySequence["Device Type"],  # Mapped from BSPSSEPySequence
-        "ID Type": BSPSSEPySequence["Identification Type"],  # Mapped from BSPSSEPySequence
-        "ID Value": BSPSSEPySequence["Identification Value"],  # Mapped from BSPSSEPySequence
-        "Action Type": BSPSSEPySequence["Action Type"],  # Mapped from BSPSSEPySequence
-        "Action Time": BSPSSEPySequence["Action Time"].apply(ActionTimeMinSec),  # Mapped from BSPSSEPySequence
-        "Start Time": BSPSSEPySequence["Start Time"].apply(lambda x: ActionTimeMinSec(x, InSeconds=True)),
-        "End Time": BSPSSEPySequence["End Time"].apply(lambda x: ActionTimeMinSec(x, InSeconds=True)),
-        "Action Status": BSPSSEPySequence["Action Status"],  # Mapped from BSPSSEPySequence
-    })
+    # Define the ProgressDF DataFrame with mapped columns (rebuilt only when the action progress/times change)
+    ProgressDF = CachedTable("Progress", TableToken(BSPSSEPySequence, ["Action Status", "Control Sequence", "Action Time", "Start Time", "End Time"]), lambda: BuildTableDataFrame({
+            "Progress": BSPSSEPySequence["Action Status"].map(ActionStatusEmoji).fillna(" ☠️ ").astype(ActionStatusEmojiDType),  # Unexpected status (error) if not in the map
+            "Control Sequence": BSPSSEPySequence["Control Sequence"],  # All set to zero for now
+            "Device Type": BSPSSEPySequence["Device Type"],  # Mapped from BSPSSEPySequence
+            "ID Type": BSPSSEPySequence["Identification Type"],  # Mapped from BSPSSEPySequence
+            "ID Value": BSPSSEPySequence["Identification Value"],  # Mapped from BSPSSEPySequence
+            "Action Type": BSPSSEPySequence["Action Type"],  # Mapped from BSPSSEPySequence
+            "Action Time": ActionTimeMinSec(BSPSSEPySequence["Action Time"]),  # Mapped from BSPSSEPySequence
+            "Start Time": ActionTimeMinSec(BSPSSEPySequence["Start Time"], InSeconds=True),
+            "End Time": ActionTimeMinSec(BSPSSEPySequence["End Time"], InSeconds=True),
+            "Action Status": BSPSSEPySequence["Action Status"],  # Mapped from BSPSSEPySequence
+        }, Index=BSPSSEPySequence.index))
 
 
 
     AGCDF = BSPSSEPyAGC
-    AGCDF["ΔPᴳ"] = AGCDF["ΔPᴳ"].apply(lambda x: round(x, RoundDigit))
-    AGCDF["Δf (Hz)"] = AGCDF["Δf (Hz)"].apply(lambda x: round(x, RoundDigit))
-    AGCDF["Δf' (Hz/s)"] = AGCDF["Δf' (Hz/s)"].apply(lambda x: round(x, RoundDigit))
-
-
-    # Fetch all required channel values asynchronously
-    PELECValues, PMECHValues, QELECValues, GREFValues, VREFValues = await FetchGeneratorChannelValues(BSPSSEPyGen, DebugPrint, app)
-
-    # Fetch the MVA base for each generator
-    MVA_Base_List = []
-    for idx, GeneratorRow in BSPSSEPyGen.iterrows():
-        GeneratorID = GeneratorRow["ID"]
-        BusNumber = GeneratorRow["NUMBER"]
-
-        # Get the base MVA value
-        ierr, GeneratorMVA_Base = psspy.macdat(BusNumber, GeneratorID, 'MBASE')
-
-        if ierr == 0:
-            if DebugPrint:
-                bsprint(f"[DEBUG] Retrieved MVA Base for Generator at Bus {BusNumber}, ID {GeneratorID}: {GeneratorMVA_Base} MVA", app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        else:
-            bsprint(f"[ERROR] Could not retrieve MVA Base for Generator at Bus {BusNumber}, ID {GeneratorID}. Error code: {ierr}", app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-
-        MVA_Base_List.append(GeneratorMVA_Base)
-
-    # System_MVA_BASE = psspy.get_sbase()
-    # Convert PU to MW/MVar for each generator
-    PELEC_MW = [round(pe * mb, RoundDigit) for pe, mb in zip(PELECValues, [100]*len(PELECValues))]
-    PELEC_PU = [round(pe, RoundDigit) for pe in PELECValues]
-
-    PMECH_MW = [round(pm * mb, RoundDigit) for pm, mb in zip(PMECHValues, MVA_Base_List)]
-    PMECH_PU = [round(pm, RoundDigit) for pm in PMECHValues]
+    AGCDF["ΔPᴳ"] = np.round(AGCDF["ΔPᴳ"].to_numpy(dtype=np.float64), RoundDigit)
+    AGCDF["Δf (Hz)"] = np.round(AGCDF["Δf (Hz)"].to_numpy(dtype=np.float64), RoundDigit)
+    AGCDF["Δf' (Hz/s)"] = np.round(AGCDF["Δf' (Hz/s)"].to_numpy(dtype=np.float64), RoundDigit)
 
-    QELEC_MVar = [round(qe * mb, RoundDigit) for qe, mb in zip(QELECValues, [100]*len(PELECValues))]
-    QELEC_PU = [round(qe, RoundDigit) for qe in QELECValues]
 
-    # Handle GREF scaling (assuming it follows the same rule as power)
-    GREF_MW = [round(gr * mb, RoundDigit) for gr, mb in zip(GREFValues, MVA_Base_List)]
-    GREF_PU = [round(gr, RoundDigit) for gr in GREFValues]
-
-    # Voltage remains in PU
-    VREF_PU = [round(vr, RoundDigit) for vr in VREFValues]
-
-    # Create the DataFrame with formatted values
-    GenDF = pd.DataFrame({
-        "Gen Name": BSPSSEPyGen["MCNAME"],
-        "Bus #" : BSPSSEPyGen["NUMBER"],
-        "Bus Name": BSPSSEPyGen["NAME"],
-        "Δf": BSPSSEPyAGC["Δf (Hz)"],  # Assuming already in correct format
-        "Pᴱ MW (p.u.)": [f"{mw} MW ({pu} p.u.)" for mw, pu in zip(PELEC_MW, PELEC_PU)],
-        "Pᴹ MW (p.u.)": [f"{mw} MW ({pu} p.u.)" for mw, pu in zip(PMECH_MW, PMECH_PU)],
-        "Qᴱ MVar (p.u.)": [f"{mvar} MVar ({pu} p.u.)" for mvar, pu in zip(QELEC_MVar, QELEC_PU)],
-        "Gᴿᴱꟳ MW (p.u.)": [f"{mw} MW ({pu} p.u.)" for mw, pu in zip(GREF_MW, GREF_PU)],
-        "Vᴿᴱꟳ (p.u.)": VREF_PU,  # Voltage remains in PU
-    })
-
-
-
-    
     from Functions.BSPSSEPy.Sim.BSPSSEPyLoadFunctions import GetLoadInfo
-    LoadDFtemp = await GetLoadInfo(["LOADNAME", "NUMBER", "NAME", "MVAACT", "ILACT", "YLACT", "LDGNACT", "STATUS"], DebugPrint=DebugPrint, app=app)
-    # bsprint(LoadDFtemp, app=app)
-    # Create the DataFrame
-    RoundDigit = 3
-    LoadDF = pd.DataFrame({
-        "Load Name": LoadDFtemp["LOADNAME"],
-        "Bus #": LoadDFtemp["NUMBER"],
-        "Bus Name": LoadDFtemp["NAME"],
-        "Power Array [PL, QL, IP, IQ, YP, YQ, PG, QG]": LoadDFtemp.apply(lambda row: [
-            round(row["MVAACT"].real, RoundDigit), round(row["MVAACT"].imag, RoundDigit),
-            round(row["ILACT"].real, RoundDigit), round(row["ILACT"].imag, RoundDigit),
-            round(row["YLACT"].real, RoundDigit), round(row["YLACT"].imag, RoundDigit),
-            round(row["LDGNACT"].real, RoundDigit), round(row["LDGNACT"].imag, RoundDigit)
-        ], axis=1),
-        "Status": LoadDFtemp["STATUS"]
-    })
-
-
-
-    
     from Functions.BSPSSEPy.Sim.BSPSSEPyBusFunctions import GetBusInfo
-    BusDFtemp = await GetBusInfo(["NUMBER", "NAME", "TYPE"], DebugPrint=DebugPrint, app=app)
-    BusStatus = await GetBusInfo(["BSPSSEPyStatus"], BSPSSEPyBus=BSPSSEPyBus, DebugPrint=DebugPrint, app=app)
 
-    BusDF = pd.DataFrame({
+    # Fetch the generator channel values, the generator MVA bases (one bulk call), the load and the bus data together
+    (
+        (PELECValues, PMECHValues, QELECValues, GREFValues, VREFValues),
+        MVA_Base_List,
+        LoadDFtemp,
+        BusDFtemp,
+        BusStatus,
+    ) = await asyncio.gather(
+        FetchGeneratorChannelValues(BSPSSEPyGen, DebugPrint, app),
+        FetchGeneratorMVABase(BSPSSEPyGen, DebugPrint, app),
+        GetLoadInfo(["LOADNAME", "NUMBER", "NAME", "MVAACT", "ILACT", "YLACT", "LDGNACT", "STATUS"], DebugPrint=DebugPrint, app=app),
+        GetBusInfo(["NUMBER", "NAME", "TYPE"], DebugPrint=DebugPrint, app=app),
+        GetBusInfo(["BSPSSEPyStatus"], BSPSSEPyBus=BSPSSEPyBus, DebugPrint=DebugPrint, app=app),
+    )
+
+    # System_MVA_BASE = psspy.get_sbase()
+    # Generator and load tables (shared with BSPSSEPyAppResetTables)
+    # All generator values are computed once as NumPy arrays; the display strings are only rebuilt when any of these
+    # values changed since the previous refresh
+    GenNumeric = GeneratorNumericArrays(BSPSSEPyGen, BSPSSEPyAGC, (PELECValues, PMECHValues, QELECValues, GREFValues, VREFValues), MVA_Base_List, RoundDigit=RoundDigit)
+    GenDF = CachedTable("Generator", b"".join(Values.tobytes() for Values in GenNumeric.values()), lambda: BuildGeneratorDataFrame(BSPSSEPyGen, GenNumeric))
+    LoadDF = BuildLoadDataFrame(LoadDFtemp, RoundDigit=RoundDigit)
+
+    BusDF = BuildTableDataFrame({
         "Bus #": BusDFtemp["NUMBER"],
         "Bus Name": BusDFtemp["NAME"],
         "Type": BusDFtemp["TYPE"],
         "Status": BusStatus,
-    })
+    }, Index=BusDFtemp.index)
     
-    BrnDF = pd.DataFrame({
-        "Branch Name": BSPSSEPyBrn["BRANCHNAME"],
-        "From Bus #": BSPSSEPyBrn["FROMNUMBER"],
-        "To Bus #": BSPSSEPyBrn["TONUMBER"],
-        "From Bus Name": BSPSSEPyBrn["FROMNAME"],
-        "To Bus Name": BSPSSEPyBrn["TONAME"],
-        "Status": BSPSSEPyBrn["STATUS"],  
-    })
-
-
-    TrnDF = pd.DataFrame({
-        "Trans. Name": BSPSSEPyTrn["XFRNAME"],
-        "From Bus #": BSPSSEPyTrn["FROMNUMBER"],
-        "To Bus #": BSPSSEPyTrn["TONUMBER"],
-        "From Bus Name": BSPSSEPyTrn["FROMNAME"],
-        "To Bus Name": BSPSSEPyTrn["TONAME"],
-        "Status": BSPSSEPyTrn["STATUS"],
-    })
+    BrnDF = CachedTable("Branch", TableToken(BSPSSEPyBrn, ["STATUS"]), lambda: BuildTableDataFrame({
+            "Branch Name": BSPSSEPyBrn["BRANCHNAME"],
+            "From Bus #": BSPSSEPyBrn["FROMNUMBER"],
+            "To Bus #": BSPSSEPyBrn["TONUMBER"],
+            "From Bus Name": BSPSSEPyBrn["FROMNAME"],
+            "To Bus Name": BSPSSEPyBrn["TONAME"],
+            "Status": BSPSSEPyBrn["STATUS"],  
+        }, Index=BSPSSEPyBrn.index))
+
+
+    TrnDF = CachedTable("Transformer", TableToken(BSPSSEPyTrn, ["STATUS"]), lambda: BuildTableDataFrame({
+            "Trans. Name": BSPSSEPyTrn["XFRNAME"],
+            "From Bus #": BSPSSEPyTrn["FROMNUMBER"],
+            "To Bus #": BSPSSEPyTrn["TONUMBER"],
+            "From Bus Name": BSPSSEPyTrn["FROMNAME"],
+            "To Bus Name": BSPSSEPyTrn["TONAME"],
+            "Status": BSPSSEPyTrn["STATUS"],
+        }, Index=BSPSSEPyTrn.index))
 
     
+    # Narrow the dtypes of the display tables (the cached tables are already narrowed).
+    # AGCDF is the simulation's own DataFrame (updated in place), so the GUI gets a snapshot of it.
     DataFrames = {
         "Progress": ProgressDF,
-        "AGC": AGCDF,
+        "AGC": AGCDF.copy(),
         "Generator": GenDF,
-        "Load": LoadDF,
-        "Bus": BusDF,
+        "Load": ShrinkDataFrame(LoadDF),
+        "Bus": ShrinkDataFrame(BusDF),
         "Branch": BrnDF,
         "Transformer": TrnDF,
     }
@@ -261,7 +245,10 @@ async def GetBSPSSEPyAppDFs(
 
 async def UpdateBSPSSEPyAppGUI(app: App, ResetTables: bool | None = False):
     
+    DebugPrint = app.DebugCheckBox.value
+
     if ResetTables:
+        app.LastGUIDataFrames = None  # The GUI tables are cleared, so the cached table data is no longer valid
         app.ProgressTable.clear(columns=True)
         app.AGCTable.clear(columns=True)
         app.GeneratorTable.clear(columns=True)
@@ -310,7 +297,7 @@ async def UpdateBSPSSEPyAppGUI(app: App, ResetTables: bool | None = False):
     # await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
 
-    if app.DebugCheckBox.value:
+    if DebugPrint:
         bsprint("[DEBUG] BSPSSEPyApp tables initialized.", app=app)
         # await asyncio.sleep(app.bsprintasynciotime if app else 0)    
     app.ProgressTable.loading = False
@@ -383,15 +370,7 @@ def GetDataFramesFromGUITables(app: App) -> dict:
     """
     DebugPrint = app.DebugCheckBox.value
 
-    Tables = {
-        "Progress": app.ProgressTable,
-        "AGC": app.AGCTable,
-        "Generator": app.GeneratorTable,
-        "Load": app.LoadTable,
-        "Bus": app.BusTable,
-        "Branch": app.BranchTable,
-        "Transformer": app.TransformerTable,
-    }
+    Tables = {TableName: getattr(app, TableAttribute) for TableName, _, TableAttribute in BSPSSEPyAppTableSpecs}
 
     GUIDataFrames = {}
 
@@ -426,25 +405,117 @@ def CompareDataFrames(df1: pd.DataFrame, df2: pd.DataFrame) -> dict:
             - "changes": List of tuples (row_index, column_name, old_value, new_value) for modified cells.
             - "reset_required": Boolean indicating if table dimensions or column names don't match.
     """
-    changes = []
-
     # ✅ Check if dimensions OR column names are different
     reset_required = (df1.shape != df2.shape) or (list(df1.columns) != list(df2.columns))
 
     if reset_required:
         return {"changes": [], "reset_required": True}
 
-    # ✅ Compare only if column names and shape match
-    for row in range(len(df1)):
-        for col in df1.columns:
-            if str(df1.at[row, col]) != str(df2.at[row, col]):  # Convert to string for comparison
-                changes.append((row, col, df1.at[row, col], df2.at[row, col]))
+    # ✅ Compare only if column names and shape match (by position)
+    # Columns that are numeric (same kind: integer or float) in both frames, and categorical columns with the same
+    # categories in both frames (compared by their integer codes), are scanned by the DiffScan kernel without any
+    # string conversion. The other (object) columns are compared natively and only differing cells are stringified.
+    NumericKind = {"i": "int", "u": "int", "f": "float"}
+    Kinds1 = [("category", tuple(DType.categories)) if isinstance(DType, pd.CategoricalDtype) else NumericKind.get(DType.kind) for DType in df1.dtypes]
+    Kinds2 = [("category", tuple(DType.categories)) if isinstance(DType, pd.CategoricalDtype) else NumericKind.get(DType.kind) for DType in df2.dtypes]
+    IsNumeric = np.array([Kind1 is not None and Kind1 == Kind2 for Kind1, Kind2 in zip(Kinds1, Kinds2)], dtype=bool)
+    NumericCols = np.flatnonzero(IsNumeric)
+    OtherCols = np.flatnonzero(~IsNumeric)
+
+    ChangedMask = np.zeros(df1.shape, dtype=bool)
+
+    if len(NumericCols):
+        Old = NumericBlock(df1, NumericCols)
+        New = NumericBlock(df2, NumericCols)
+        ChangedRows = np.empty(Old.size, dtype=np.int64)
+        ChangedCols = np.empty(Old.size, dtype=np.int64)
+        Count = DiffScan(Old, New, ChangedRows, ChangedCols)
+        ChangedMask[ChangedRows[:Count], NumericCols[ChangedCols[:Count]]] = True
+
+    if len(OtherCols):
+        # Native (object) comparison first; only the cells that differ are converted to their displayed strings to
+        # confirm the change (e.g., a GUI Text object vs. a str, or NaN vs. NaN)
+        Old = df1.iloc[:, OtherCols].to_numpy(dtype=object)
+        New = df2.iloc[:, OtherCols].to_numpy(dtype=object)
+        CandidateRows, CandidateCols = np.nonzero(np.asarray(Old != New, dtype=bool))
+        if len(CandidateRows):
+            Confirmed = np.array([
+                str(OldValue) != str(NewValue)
+                for OldValue, NewValue in zip(Old[CandidateRows, CandidateCols].tolist(), New[CandidateRows, CandidateCols].tolist())
+            ], dtype=bool)
+            ChangedMask[CandidateRows[Confirmed], OtherCols[CandidateCols[Confirmed]]] = True
+
+    if not ChangedMask.any():
+        return {"changes": [], "reset_required": False}
+
+    Rows, Cols = np.nonzero(ChangedMask)  # Row-major order (same as looping rows then columns)
+    changes = list(zip(
+        Rows.tolist(),
+        df1.columns[Cols].tolist(),
+        df1.to_numpy(dtype=object)[Rows, Cols].tolist(),
+        df2.to_numpy(dtype=object)[Rows, Cols].tolist(),
+    ))
 
     return {"changes": changes, "reset_required": False}
 
 
 
 
+def NumericBlock(DataFrame: pd.DataFrame, Cols: np.ndarray) -> np.ndarray:
+    """
+    Returns the given (numeric or categorical) columns of a DataFrame as a 2D float64 array (categoricals as their codes).
+
+    Parameters:
+        DataFrame (pd.DataFrame): The table DataFrame.
+        Cols (np.ndarray): Positions of the columns.
+
+    Returns:
+        np.ndarray: float64 array of shape (rows, len(Cols)).
+    """
+    Block = np.empty((len(DataFrame), len(Cols)), dtype=np.float64)
+    for j, Col in enumerate(Cols):
+        Column = DataFrame.iloc[:, Col]
+        Block[:, j] = Column.cat.codes.to_numpy() if isinstance(Column.dtype, pd.CategoricalDtype) else Column.to_numpy(dtype=np.float64)
+    return Block
+
+
+def GetTableKeys(Table: DataTable) -> tuple:
+    """
+    Returns the row keys and the column name --> column key map of a GUI table.
+
+    The keys are cached on the table (Table.BSPSSEPyTableKeys) and only rebuilt when the table was cleared
+    or its number of rows/columns changed.
+
+    Parameters:
+        Table (DataTable): The GUI table.
+
+    Returns:
+        tuple: (RowKeys (list), ColKeys (dict))
+    """
+    TableKeys = getattr(Table, "BSPSSEPyTableKeys", None)
+    if TableKeys is None or len(TableKeys[0]) != len(Table.rows) or len(TableKeys[1]) != len(Table.columns):
+        RowKeys = list(Table.rows.keys())  # Extract row keys
+        ColKeys = {col.label.plain: col.key for col in Table.columns.values()}  # Map column names to keys
+        TableKeys = (RowKeys, ColKeys)
+        Table.BSPSSEPyTableKeys = TableKeys
+    return TableKeys
+
+
+def RestoreTableView(Table: DataTable, Row: int, ScrollX: float, ScrollY: float) -> None:
+    """
+    Moves the cursor of a GUI table to the given row and restores its scroll position (used after cell updates).
+
+    Parameters:
+        Table (DataTable): The GUI table.
+        Row (int): Row to move the cursor to.
+        ScrollX (float): Horizontal scroll position to restore.
+        ScrollY (float): Vertical scroll position to restore.
+    """
+    Table.move_cursor(row=Row)
+    Table.scroll_x = ScrollX
+    Table.scroll_y = ScrollY
+
+
 def UpdateGUITables(app: App, DataFrames: dict):
     """
     Updates GUI tables by comparing current GUI data with new DataFrames and applying only changes.
@@ -457,29 +528,28 @@ def UpdateGUITables(app: App, DataFrames: dict):
     
     DebugPrint = app.DebugCheckBox.value
 
-    CurrentGUIData = GetDataFramesFromGUITables(app)
+    # Compare against the DataFrames written in the previous update (cached on the app) instead of reading every
+    # cell back from the GUI tables. The GUI tables are only read after they were reset (no cached data).
+    CurrentGUIData = getattr(app, "LastGUIDataFrames", None)
+    if CurrentGUIData is None:
+        CurrentGUIData = GetDataFramesFromGUITables(app)
+    app.LastGUIDataFrames = CurrentGUIData
 
-    Tables = {
-        "Progress": app.ProgressTable,
-        "AGC": app.AGCTable,
-        "Generator": app.GeneratorTable,
-        "Load": app.LoadTable,
-        "Bus": app.BusTable,
-        "Branch": app.BranchTable,
-        "Transformer": app.TransformerTable,
-    }
+    Tables = {TableName: getattr(app, TableAttribute) for TableName, _, TableAttribute in BSPSSEPyAppTableSpecs}
 
     for TableName, NewDF in DataFrames.items():
         if TableName in CurrentGUIData:
                 
             CurrentDF = CurrentGUIData[TableName]
+            if NewDF is CurrentDF:
+                continue  # Same (cached) table DataFrame as the one already shown --> nothing changed
+
             ComparisonResult = CompareDataFrames(CurrentDF, NewDF)
 
             Table: DataTable = Tables[TableName]
             
-            # Get row and column mappings from keys
-            RowKeys = list(Table.rows.keys())  # Extract row keys
-            ColKeys = {col.label.plain: col.key for col in Table.columns.values()}  # Map column names to keys
+            # Get row and column mappings from keys (cached on the table)
+            RowKeys, ColKeys = GetTableKeys(Table)
 
             
             # if TableName == "Transformer":
@@ -499,17 +569,22 @@ def UpdateGUITables(app: App, DataFrames: dict):
                 if DebugPrint:
                     bsprint(f"[INFO] Resetting table {TableName} due to column or shape mismatch.", app=app)
                 Table.clear(columns=True)
+                Table.BSPSSEPyTableKeys = None
 
                 # Add new columns
                 for col in NewDF.columns:
                     Table.add_column(col, width=None)
                 # Add new rows
                 for _, row in NewDF.iterrows():
-                    Table.add_row(*[Text(str(cell), justify="center") for cell in row])
+                    Table.add_row(*[CenteredText(str(cell)) for cell in row])
 
             else:
                 
-                
+                # Snapshot the scroll position once; the cursor/scroll are restored once after all cells are updated
+                CurrentScrollX = Table.scroll_x
+                CurrentScrollY = Table.scroll_y
+                LastUpdatedRow = None
+
                 # Apply only changed values with correct row and column keys
                 for row_idx, col_name, old_value, new_value in ComparisonResult["changes"]:
                     if row_idx < len(RowKeys) and col_name in ColKeys:
@@ -517,69 +592,33 @@ def UpdateGUITables(app: App, DataFrames: dict):
                         col_key = ColKeys[col_name]  # Get actual ColumnKey
 
                         # Measure the new content width
-                        NewText = Text(str(new_value), justify="center")
-                        NewContentWidth = len(str(new_value))  # Estimate content width
+                        NewText = CenteredText(str(new_value))
+                        NewContentWidth = NewText.cell_len  # Content width in terminal cells
                         CurrentColumn = Table.columns[col_key]
 
-                        # Check if new content exceeds column width
-                        if NewContentWidth > CurrentColumn.width:
-                            # Rebuild the entire table with adjusted column widths
+                        # Widen only this column (in place) if the new content does not fit anymore
+                        ResizeColumn = NewContentWidth > CurrentColumn.width
+                        if ResizeColumn:
                             if DebugPrint:
                                 bsprint(f"[INFO] Column '{col_name}' is too small. Resizing...", app=app)
+                            CurrentColumn.width = NewContentWidth
 
-                            # Clear & re-add table with resized columns
-                            Columns = list(NewDF.columns)
-                            Table.clear(columns=True)
-
-                            # Rebuild columns with increased width
-                            for col in Columns:
-                                # Find max width between content and column name
-                                MaxContentWidth = max(len(str(val)) for val in NewDF[col])  # Find max content width
-                                ColumnNameWidth = len(str(col))  # Get column name width
-                                FinalWidth = max(MaxContentWidth, ColumnNameWidth) + 0  # Ensure padding
-
-                                Table.add_column(col, width=FinalWidth)  # Add column with adjusted width
-
-
-                            # Re-add rows with updated content
-                            for _, row in NewDF.iterrows():
-                                Table.add_row(*[Text(str(cell), justify="center") for cell in row])
-
-
-                            # app.call_later(lambda: Table.refresh())
-                            # app.call_later(lambda: Table.post_message(events.Idle()))  # Force recalculation
-
-                            return  # Exit loop early since table was rebuilt
-
-                        # If content fits, just update normally
+                        # Update the cell with the new value
                         if DebugPrint:
                             bsprint(f"Updating: row_key={row_key}, col_key={col_key}, old={old_value}, new={new_value}", app=app)
 
-                        # CurrentScrollX = Table.scroll_x
-                        # CurrentScrollY = Table.scroll_y
-                        # # Table.move_cursor(row=row_idx)
-                        # Table.update_cell(row_key, col_key, NewText)
-                        # app.call_later(lambda: Table.move_cursor(row=row_idx))
-                        # put in call later
-                        # Table.scroll_x = CurrentScrollX
-                        # Table.scroll_y = CurrentScrollY
-                        
-                        CurrentScrollX = Table.scroll_x
-                        CurrentScrollY = Table.scroll_y
-
-                        # Update the cell
-                        Table.update_cell(row_key, col_key, NewText)
-
-                        # bsprint(f"moving cursor to row: {row_idx} on Table: {TableName}")
-                        
-                        # Use call_later to move the cursor after the update
-                        app.call_later(lambda: Table.move_cursor(row=row_idx))
-
-                        # Restore scroll position after the cursor move
-                        app.call_later(lambda: setattr(Table, 'scroll_x', CurrentScrollX))
-                        app.call_later(lambda: setattr(Table, 'scroll_y', CurrentScrollY))
-                        
-                        
+                        # Update the cell (and the table dimensions if the column was resized)
+                        Table.update_cell(row_key, col_key, NewText, update_width=ResizeColumn)
+                        LastUpdatedRow = row_idx
+
+                if LastUpdatedRow is not None:
+                    # One deferred callback per table: move the cursor to the last updated row, then restore the scroll
+                    # position (arguments are bound now, not when the callback runs)
+                    app.call_later(RestoreTableView, Table, LastUpdatedRow, CurrentScrollX, CurrentScrollY)
+
+            # Remember what is now shown in the table for the next update
+            # (the DataFrames from GetBSPSSEPyAppDFs are not modified afterwards, so no copy is needed)
+            CurrentGUIData[TableName] = NewDF
 
             # Force table refresh
             # app.call_later(lambda: Table.refresh())
@@ -602,7 +641,7 @@ async def BSPSSEPyAppResetTables(
 
     This function is called when all required simulation data is collected (e.g., after `SimInit` is run).
     If the simulation has not started yet (`app.myBSPSSEPy` is not generated), it initializes the tables 
-    with empty DataFrames.
+    with their column headers only.
 
     Future plan:
         - Add functionality to update tables (or some of them) when a SAV file is selected before the Run starts.
@@ -615,15 +654,12 @@ async def BSPSSEPyAppResetTables(
         None
 
     Notes:
-        - Uses a dictionary for cleaner, scalable table reset handling.
+        - The tables, their columns, and their app attributes are listed once in `BSPSSEPyAppTableSpecs`.
         - Calls `BSPSSEPyAppResetTable` for each table dynamically.
-        - If `app.myBSPSSEPy` is not initialized, resets tables with empty data.
+        - If `app.myBSPSSEPy` is not initialized, resets tables with their column headers only.
         - Debug information is logged via `bsprint` when `app.DebugCheckBox.value` is `True`.
     """
 
-    from Functions.BSPSSEPy.Sim.BSPSSEPyChannels import FetchChannelValue
-
-
     if app is None:
         # bsprint("[ERROR] App instance is missing.", app=app)
         return
@@ -643,30 +679,30 @@ async def BSPSSEPyAppResetTables(
 
 
     # Debugging information
-    if app.DebugCheckBox.value:
+    if DebugPrint:
         bsprint("[DEBUG] Resetting all BSPSSEPyApp tables...", app=app)
 
     # Check if the simulation has started (i.e., if `app.myBSPSSEPy` exists)
     SimulationStarted = hasattr(app, "myBSPSSEPy") and app.myBSPSSEPy is not None
 
-    # If the simulation has not started, use empty DataFrames
+    # If the simulation has not started, reset the tables with headers only
     if not SimulationStarted:
-        bsprint("[INFO] No active simulation detected. Initializing tables with empty DataFrames.", app=app)
+        bsprint("[INFO] No active simulation detected. Initializing tables with column headers only.", app=app)
 
     # Retrieve or initialize DataFrames
     if SimulationStarted:
         
-        # Define the ProgressDF DataFrame with mapped columns
-        ProgressDF = pd.DataFrame({
+        # Define the Progress table columns (plain lists: the table is only displayed, no pandas needed)
+        ProgressDF = {
             "Progress": [" 🔴"] * len(BSPSSEPySequence),  # Initially all actions are not started
             "Control Sequence": [0] * len(BSPSSEPySequence),  # All set to zero for now
-            "Device Type": BSPSSEPySequence["Device Type"],  # Mapped from BSPSSEPySequence
-            "ID Type": BSPSSEPySequence["Identification Type"],  # Mapped from BSPSSEPySequence
-            "ID Value": BSPSSEPySequence["Identification Value"],  # Mapped from BSPSSEPySequence
-            "Action Type": BSPSSEPySequence["Action Type"],  # Mapped from BSPSSEPySequence
-            "Action Time": BSPSSEPySequence["Action Time"],  # Mapped from BSPSSEPySequence
-            "Action Status": BSPSSEPySequence["Action Status"],  # Mapped from BSPSSEPySequence
-        })
+            "Device Type": BSPSSEPySequence["Device Type"].tolist(),  # Mapped from BSPSSEPySequence
+            "ID Type": BSPSSEPySequence["Identification Type"].tolist(),  # Mapped from BSPSSEPySequence
+            "ID Value": BSPSSEPySequence["Identification Value"].tolist(),  # Mapped from BSPSSEPySequence
+            "Action Type": BSPSSEPySequence["Action Type"].tolist(),  # Mapped from BSPSSEPySequence
+            "Action Time": BSPSSEPySequence["Action Time"].tolist(),  # Mapped from BSPSSEPySequence
+            "Action Status": BSPSSEPySequence["Action Status"].tolist(),  # Mapped from BSPSSEPySequence
+        }
 
         AGCDF = BSPSSEPyAGCDF
 
@@ -674,42 +710,13 @@ async def BSPSSEPyAppResetTables(
         PELECValues, PMECHValues, QELECValues, GREFValues, VREFValues = await FetchGeneratorChannelValues(BSPSSEPyGen, DebugPrint, app)
 
 
-        # ✅ Apply rounding to all numeric lists
-        PELECValues = [round(val, RoundDigit) for val in PELECValues]
-        PMECHValues = [round(val, RoundDigit) for val in PMECHValues]
-        QELECValues = [round(val, RoundDigit) for val in QELECValues]
-        GREFValues = [round(val, RoundDigit) for val in GREFValues]
-        VREFValues = [round(val, RoundDigit) for val in VREFValues]
+        # Generator (p.u. values only) and load tables (shared with GetBSPSSEPyAppDFs)
+        GenNumeric = GeneratorNumericArrays(BSPSSEPyGen, BSPSSEPyAGCDF, (PELECValues, PMECHValues, QELECValues, GREFValues, VREFValues), RoundDigit=RoundDigit)
+        GenDF = BuildGeneratorDataFrame(BSPSSEPyGen, GenNumeric)
 
-        GenDF = pd.DataFrame({
-            "Gen Name": BSPSSEPyGen["MCNAME"],
-            "Bus #" : BSPSSEPyGen["NUMBER"],
-            "Bus Name": BSPSSEPyGen["NAME"],
-            "Δf": BSPSSEPyAGCDF["Δf (Hz)"],
-            "Pᴱ": PELECValues,
-            "Pᴹ": PMECHValues,
-            "Qᴱ": QELECValues,
-            "Gᴿᴱꟳ": GREFValues,
-            "Vᴿᴱꟳ": VREFValues,
-        })
-        
         from Functions.BSPSSEPy.Sim.BSPSSEPyLoadFunctions import GetLoadInfo
         LoadDFtemp = await GetLoadInfo(["LOADNAME", "NUMBER", "NAME", "MVAACT", "ILACT", "YLACT", "LDGNACT", "STATUS"], DebugPrint=DebugPrint, app=app)
-        # bsprint(LoadDFtemp, app=app)
-        # Create the DataFrame
-        LoadDF = pd.DataFrame({
-            "Load Name": LoadDFtemp["LOADNAME"],
-            "Bus #": LoadDFtemp["NUMBER"],
-            "Bus Name": LoadDFtemp["NAME"],
-            "Power Array [PL, QL, IP, IQ, YP, YQ, PG, QG]": LoadDFtemp.apply(lambda row: [
-                round(row["MVAACT"].real, RoundDigit), round(row["MVAACT"].imag, RoundDigit),
-                round(row["ILACT"].real, RoundDigit), round(row["ILACT"].imag, RoundDigit),
-                round(row["YLACT"].real, RoundDigit), round(row["YLACT"].imag, RoundDigit),
-                round(row["LDGNACT"].real, RoundDigit), round(row["LDGNACT"].imag, RoundDigit)
-            ], axis=1),
-            "Status": LoadDFtemp["STATUS"]
-        })
-
+        LoadDF = BuildLoadDataFrame(LoadDFtemp, RoundDigit=RoundDigit)
 
 
         
@@ -724,36 +731,32 @@ async def BSPSSEPyAppResetTables(
             "Status": BusStatus,
         })
         
-        BrnDF = pd.DataFrame({
-            "Branch Name": BSPSSEPyBrn["BRANCHNAME"],
-            "From Bus #": BSPSSEPyBrn["FROMNUMBER"],
-            "To Bus #": BSPSSEPyBrn["TONUMBER"],
-            "From Bus Name": BSPSSEPyBrn["FROMNAME"],
-            "To Bus Name": BSPSSEPyBrn["TONAME"],
-            "Status": BSPSSEPyBrn["STATUS"],  
-        })
+        # Branch and transformer tables: plain column lists (all columns come from one DataFrame, no alignment needed)
+        BrnDF = {
+            "Branch Name": BSPSSEPyBrn["BRANCHNAME"].tolist(),
+            "From Bus #": BSPSSEPyBrn["FROMNUMBER"].tolist(),
+            "To Bus #": BSPSSEPyBrn["TONUMBER"].tolist(),
+            "From Bus Name": BSPSSEPyBrn["FROMNAME"].tolist(),
+            "To Bus Name": BSPSSEPyBrn["TONAME"].tolist(),
+            "Status": BSPSSEPyBrn["STATUS"].tolist(),  
+        }
 
 
-        TrnDF = pd.DataFrame({
-            "Trans. Name": BSPSSEPyTrn["XFRNAME"],
-            "From Bus #": BSPSSEPyTrn["FROMNUMBER"],
-            "To Bus #": BSPSSEPyTrn["TONUMBER"],
-            "From Bus Name": BSPSSEPyTrn["FROMNAME"],
-            "To Bus Name": BSPSSEPyTrn["TONAME"],
-            "Status": BSPSSEPyTrn["STATUS"],  
-        })
+        TrnDF = {
+            "Trans. Name": BSPSSEPyTrn["XFRNAME"].tolist(),
+            "From Bus #": BSPSSEPyTrn["FROMNUMBER"].tolist(),
+            "To Bus #": BSPSSEPyTrn["TONUMBER"].tolist(),
+            "From Bus Name": BSPSSEPyTrn["FROMNAME"].tolist(),
+            "To Bus Name": BSPSSEPyTrn["TONAME"].tolist(),
+            "Status": BSPSSEPyTrn["STATUS"].tolist(),  
+        }
 
 
 
         # TrnDF = pd.DataFrame()
     else:
-        ProgressDF = pd.DataFrame()
-        AGCDF = pd.DataFrame()
-        GenDF = pd.DataFrame()
-        LoadDF = pd.DataFrame()
-        BusDF = pd.DataFrame()
-        BrnDF = pd.DataFrame()
-        TrnDF = pd.DataFrame()
+        # No data yet: the tables are reset with their column headers only
+        ProgressDF = AGCDF = GenDF = LoadDF = BusDF = BrnDF = TrnDF = None
 
 
     
@@ -767,47 +770,15 @@ async def BSPSSEPyAppResetTables(
         "Transformer": TrnDF,
     }
 
-    # Dictionary to map table names, column structures, and app table objects
-    Tables = {
-        "Progress": {
-            "columns": ["Progress", "Control Sequence", "Device Type", "ID Type", "ID Value", "Action Type", "Action Time", "Action Status"],
-            "AppTable": app.ProgressTable,
-        },
-        "AGC": {
-            "columns": ["Gen Name", "Alpha", "ΔPᴳ", "Δf"],
-            "AppTable": app.AGCTable,
-        },
-        "Generator": {
-            "columns": ["Gen Name", "Bus #", "Bus Name", "Δf", "Pᴱ", "Pᴹ", "Qᴱ", "Gᴿᴱꟳ", "Vᴿᴱꟳ"],
-            "AppTable": app.GeneratorTable,
-        },
-        "Load": {
-            "columns": ["Load Name", "Bus #", "Bus Name", "Power Array [PL, QL, IP, IQ, YP, YQ, PG, QG]", "Status"],
-            "AppTable": app.LoadTable,
-        },
-        "Bus": {
-            "columns": ["Bus #", "Bus Name", "Type", "Status"],
-            "AppTable": app.BusTable,
-        },
-        "Branch": {
-            "columns": ["Branch Name", "From Bus #", "To Bus #", "From Bus Name", "To Bus Name", "Status"],
-            "AppTable": app.BranchTable,
-        },
-        "Transformer": {
-            "columns": ["Trans. Name", "From Bus #", "To Bus #", "From Bus Name", "To Bus Name", "Status"],
-            "AppTable": app.TransformerTable,
-        }
-    }
-
     # Loop through all tables and reset them dynamically
-    for TableName, TableInfo in Tables.items():
+    for TableName, TableCol, TableAttribute in BSPSSEPyAppTableSpecs:
         bsprint(f"[INFO] Resetting {TableName} table...", app=app)
 
         BSPSSEPyAppResetTable(
             BSPSSEPyDataFrame=DataFrames[TableName],
-            TableCol=TableInfo["columns"],
+            TableCol=TableCol,
             app=app,
-            appTable=TableInfo["AppTable"],
+            appTable=getattr(app, TableAttribute),
             UseConfigOnly=UseConfigOnly
         )
         # await asyncio.sleep(app.bsprintasynciotime if app else 0)
@@ -817,7 +788,7 @@ async def BSPSSEPyAppResetTables(
     # await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
 
-    if app.DebugCheckBox.value:
+    if DebugPrint:
         bsprint("[DEBUG] BSPSSEPyApp tables initialized.", app=app)
         # await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
@@ -825,18 +796,20 @@ async def BSPSSEPyAppResetTables(
 
 
 def BSPSSEPyAppResetTable(
-        BSPSSEPyDataFrame: pd.DataFrame,  # DataFrame containing the source data for the table
-        TableCol: list[str],           # List of column names to be displayed in the table (can include computed columns)
+        BSPSSEPyDataFrame: pd.DataFrame | dict[str, list] | None,  # Source data: DataFrame or column name --> list (None for headers only)
+        TableCol: tuple[str, ...],     # Column names to be displayed in the table (can include computed columns)
         app: App,                # The Textual app instance (needed for UI updates)
         appTable: DataTable,           # The specific table widget in the GUI to be updated (e.g., app.MyTable)
         UseConfigOnly: bool | None = False, # Flag to determine if only configuration-based columns should be used
 ) -> None:
     """
-    Resets and updates a Textual DataTable using the provided DataFrame.
+    Resets and updates a Textual DataTable using the provided DataFrame (or plain column lists).
 
     Parameters:
-        BSPSSEPyDataFrame (pd.DataFrame): The DataFrame containing the source data.
-        TableCol (list of str): List of column names to include in the table.
+        BSPSSEPyDataFrame (pd.DataFrame | dict | None): The source data, either a DataFrame or a dict of
+            column name --> list of values (all lists of the same length).
+            - If None, the table is reset with its column headers only (no rows).
+        TableCol (tuple of str): Column names to include in the table.
             - This list may contain columns that are not in BSPSSEPyDataFrame but will be computed dynamically.
         app (textual.app.App): The Textual app instance required for UI updates.
         appTable (textual.widgets.DataTable): The specific table widget to be updated.
@@ -856,39 +829,47 @@ def BSPSSEPyAppResetTable(
         bsprint("[ERROR] App instance or table reference is missing.", app=app)
         return
 
-    if BSPSSEPyDataFrame is None or TableCol is None:
-        bsprint("[ERROR] DataFrame or TableCol list is missing.", app=app)
+    if TableCol is None:
+        bsprint("[ERROR] TableCol list is missing.", app=app)
         return
 
+    DebugPrint = app.DebugCheckBox.value
+
     # Clear existing table data before updating
     appTable.clear(columns=True)
+    appTable.BSPSSEPyTableKeys = None
+    app.LastGUIDataFrames = None  # The GUI tables no longer match the cached table data
 
     # Debugging information
-    if app.DebugCheckBox.value:
+    if DebugPrint:
         bsprint(f"[DEBUG] Resetting table {appTable.id} with columns: {TableCol}", app=app)
 
-    # Add columns to the table
-    for Column in TableCol:
-        appTable.add_column(Column)  # No need to set justify here, we do it per cell
+    # Add all columns to the table at once, before any row (no need to set justify here, we do it per cell)
+    appTable.add_columns(*TableCol)
     # Debugging information
-    if app.DebugCheckBox.value:
+    if DebugPrint:
         bsprint(f"[DEBUG] Added columns: {TableCol} (content will be centered)", app=app)
 
-    # Populate the table with rows from the DataFrame
-    for _, Row in BSPSSEPyDataFrame.iterrows():
-        RowData = []
-
-        for Column in TableCol:
-            if Column in BSPSSEPyDataFrame.columns:
-                cell_value = Row[Column]  # Get the original value
-            else:
-                cell_value = ""  # Default empty value for unknown computed columns
+    if BSPSSEPyDataFrame is not None:
+        # Extract every displayed column once as a list (no per-row Series); unknown computed columns are shown empty
+        if isinstance(BSPSSEPyDataFrame, pd.DataFrame):
+            NumberOfRows = len(BSPSSEPyDataFrame)
+            ColumnValues = [
+                BSPSSEPyDataFrame[Column].tolist() if Column in BSPSSEPyDataFrame.columns else [""] * NumberOfRows
+                for Column in TableCol
+            ]
+        else:
+            NumberOfRows = max((len(Values) for Values in BSPSSEPyDataFrame.values()), default=0)
+            ColumnValues = [BSPSSEPyDataFrame.get(Column, [""] * NumberOfRows) for Column in TableCol]
 
-            # Convert value to `Text` object with center alignment
-            RowData.append(Text(str(cell_value), justify="center"))
+        # Convert every value to a `Text` object with center alignment (strings are used as they are)
+        AllRows = [
+            [CenteredText(cell_value if type(cell_value) is str else str(cell_value)) for cell_value in RowValues]
+            for RowValues in zip(*ColumnValues)
+        ]
 
-        # Add the row to the table
-        appTable.add_row(*RowData)
+        # Populate the table with all rows from the DataFrame in one call
+        appTable.add_rows(AllRows)
     # Force a UI refresh to reflect changes
     app.call_later(appTable.refresh)
     # app.refresh()
@@ -896,7 +877,7 @@ def BSPSSEPyAppResetTable(
     bsprint("[INFO] Table successfully reset and updated.", app=app)
 
     # Debugging information
-    if app.DebugCheckBox.value:
+    if DebugPrint:
         bsprint("[DEBUG] Table update completed.", app=app)
 
     
@@ -915,6 +896,212 @@ def BSPSSEPyAppUpdateTables(
 
 
 
+def ValuePUString(Value: np.ndarray, ValuePU: np.ndarray, Unit: str, Index) -> pd.Series:
+    """
+    Builds the "X Unit (Y p.u.)" display strings of a whole column with vectorized string concatenation.
+
+    Parameters:
+        Value (np.ndarray): Rounded values in Unit (e.g., MW).
+        ValuePU (np.ndarray): Rounded values in p.u.
+        Unit (str): Unit label (e.g., "MW", "MVar").
+        Index (pd.Index): Row index of the returned Series.
+
+    Returns:
+        pd.Series: The display strings.
+    """
+    ValueStr = pd.Series(Value.astype(str), index=Index)
+    ValuePUStr = pd.Series(ValuePU.astype(str), index=Index)
+    return ValueStr + f" {Unit} (" + ValuePUStr + " p.u.)"
+
+
+def GeneratorNumericArrays(BSPSSEPyGen: pd.DataFrame, BSPSSEPyAGCDF: pd.DataFrame, ChannelValues: tuple, MVA_Base_List: list | None = None, RoundDigit: int = 3) -> dict:
+    """
+    Computes all (rounded) numeric values shown in the Generator GUI table as NumPy arrays (one conversion/rounding per field).
+
+    Parameters:
+        BSPSSEPyGen (pd.DataFrame): Generator DataFrame (row order of the arrays).
+        BSPSSEPyAGCDF (pd.DataFrame): AGC DataFrame (for the "Δf (Hz)" values).
+        ChannelValues (tuple): (PELECValues, PMECHValues, QELECValues, GREFValues, VREFValues) in p.u.
+        MVA_Base_List (list, optional): MBASE of every generator. If given, the MW/MVar values are computed too.
+        RoundDigit (int): Number of digits to round to.
+
+    Returns:
+        dict: Field name --> float64 array ("Δf", "Pᴱ_PU", "Pᴹ_PU", "Qᴱ_PU", "Gᴿᴱꟳ_PU", "Vᴿᴱꟳ_PU" and, if MVA_Base_List
+        is given, "Pᴱ_MW", "Pᴹ_MW", "Qᴱ_MVar", "Gᴿᴱꟳ_MW").
+    """
+    PELEC, PMECH, QELEC, GREF, VREF = (np.asarray(Values, dtype=np.float64) for Values in ChannelValues)
+
+    GenNumeric = {
+        "Δf": BSPSSEPyAGCDF["Δf (Hz)"].reindex(BSPSSEPyGen.index).to_numpy(dtype=np.float64),
+        "Pᴱ_PU": np.round(PELEC, RoundDigit),
+        "Pᴹ_PU": np.round(PMECH, RoundDigit),
+        "Qᴱ_PU": np.round(QELEC, RoundDigit),
+        "Gᴿᴱꟳ_PU": np.round(GREF, RoundDigit),
+        "Vᴿᴱꟳ_PU": np.round(VREF, RoundDigit),  # Voltage remains in PU
+    }
+
+    if MVA_Base_List is not None:
+        # Convert PU to MW/MVar for all generators at once
+        MVABase = np.asarray(MVA_Base_List, dtype=np.float64)
+        GenNumeric["Pᴱ_MW"] = np.round(PELEC * 100.0, RoundDigit)
+        GenNumeric["Pᴹ_MW"] = np.round(PMECH * MVABase, RoundDigit)
+        GenNumeric["Qᴱ_MVar"] = np.round(QELEC * 100.0, RoundDigit)
+        # Handle GREF scaling (assuming it follows the same rule as power)
+        GenNumeric["Gᴿᴱꟳ_MW"] = np.round(GREF * MVABase, RoundDigit)
+
+    return GenNumeric
+
+
+def BuildGeneratorDataFrame(BSPSSEPyGen: pd.DataFrame, GenNumeric: dict) -> pd.DataFrame:
+    """
+    Builds the Generator GUI table from the numeric arrays returned by GeneratorNumericArrays.
+
+    Parameters:
+        BSPSSEPyGen (pd.DataFrame): Generator DataFrame.
+        GenNumeric (dict): Numeric arrays of the table. If the MW/MVar values are included, the table shows
+            "MW (p.u.)" columns, otherwise it shows the p.u. values only (layout used when the tables are reset).
+
+    Returns:
+        pd.DataFrame: The Generator table DataFrame.
+    """
+    Index = BSPSSEPyGen.index
+
+    if "Pᴱ_MW" not in GenNumeric:
+        return BuildTableDataFrame({
+            "Gen Name": BSPSSEPyGen["MCNAME"],
+            "Bus #" : BSPSSEPyGen["NUMBER"],
+            "Bus Name": BSPSSEPyGen["NAME"],
+            "Δf": GenNumeric["Δf"],
+            "Pᴱ": GenNumeric["Pᴱ_PU"],
+            "Pᴹ": GenNumeric["Pᴹ_PU"],
+            "Qᴱ": GenNumeric["Qᴱ_PU"],
+            "Gᴿᴱꟳ": GenNumeric["Gᴿᴱꟳ_PU"],
+            "Vᴿᴱꟳ": GenNumeric["Vᴿᴱꟳ_PU"],
+        }, Index=Index)
+
+    # Create the DataFrame with formatted values
+    return BuildTableDataFrame({
+        "Gen Name": BSPSSEPyGen["MCNAME"],
+        "Bus #" : BSPSSEPyGen["NUMBER"],
+        "Bus Name": BSPSSEPyGen["NAME"],
+        "Δf": GenNumeric["Δf"],  # Assuming already in correct format
+        "Pᴱ MW (p.u.)": ValuePUString(GenNumeric["Pᴱ_MW"], GenNumeric["Pᴱ_PU"], "MW", Index),
+        "Pᴹ MW (p.u.)": ValuePUString(GenNumeric["Pᴹ_MW"], GenNumeric["Pᴹ_PU"], "MW", Index),
+        "Qᴱ MVar (p.u.)": ValuePUString(GenNumeric["Qᴱ_MVar"], GenNumeric["Qᴱ_PU"], "MVar", Index),
+        "Gᴿᴱꟳ MW (p.u.)": ValuePUString(GenNumeric["Gᴿᴱꟳ_MW"], GenNumeric["Gᴿᴱꟳ_PU"], "MW", Index),
+        "Vᴿᴱꟳ (p.u.)": GenNumeric["Vᴿᴱꟳ_PU"],  # Voltage remains in PU
+    }, Index=Index)
+
+
+def BuildLoadDataFrame(LoadDFtemp: pd.DataFrame, RoundDigit: int = 3) -> pd.DataFrame:
+    """
+    Builds the Load GUI table from the load information returned by GetLoadInfo.
+
+    Parameters:
+        LoadDFtemp (pd.DataFrame): Load information with the "LOADNAME", "NUMBER", "NAME", "MVAACT", "ILACT",
+            "YLACT", "LDGNACT" and "STATUS" columns.
+        RoundDigit (int): Number of digits to round to.
+
+    Returns:
+        pd.DataFrame: The Load table DataFrame.
+    """
+    # Stack the real/imag parts of the complex load columns into one (N, 8) array and round it once
+    LoadComplex = LoadDFtemp[["MVAACT", "ILACT", "YLACT", "LDGNACT"]].to_numpy(dtype=np.complex128)
+    LoadPowerArray = np.round(np.stack([LoadComplex.real, LoadComplex.imag], axis=2).reshape(len(LoadComplex), 8), RoundDigit)
+
+    # Preformat the display string of every row ("[PL, QL, ...]", same text as str() of the list) instead of storing one list per row
+    LoadPowerParts = [pd.Series(Part, index=LoadDFtemp.index) for Part in LoadPowerArray.astype(str).T]
+    LoadPowerStr = "[" + LoadPowerParts[0].str.cat(LoadPowerParts[1:], sep=", ") + "]"
+
+    return BuildTableDataFrame({
+        "Load Name": LoadDFtemp["LOADNAME"],
+        "Bus #": LoadDFtemp["NUMBER"],
+        "Bus Name": LoadDFtemp["NAME"],
+        "Power Array [PL, QL, IP, IQ, YP, YQ, PG, QG]": LoadPowerStr,
+        "Status": LoadDFtemp["STATUS"]
+    }, Index=LoadDFtemp.index)
+
+
+def TableToken(DataFrame: pd.DataFrame, Columns: list[str]) -> bytes:
+    """
+    Returns a change token of the given columns of a DataFrame (hash of the values and the index).
+
+    Parameters:
+        DataFrame (pd.DataFrame): The source DataFrame.
+        Columns (list of str): The (hashable-valued) columns the token depends on.
+
+    Returns:
+        bytes: Token that changes whenever any of the values (or rows) changes.
+    """
+    return pd.util.hash_pandas_object(DataFrame[Columns], index=True).to_numpy().tobytes()
+
+
+def BuildTableDataFrame(Columns: dict, Index) -> pd.DataFrame:
+    """
+    Builds a GUI table DataFrame from typed column Series joined with a single pd.concat.
+
+    Parameters:
+        Columns (dict): Column name --> column values (pd.Series, np.ndarray, list or scalar).
+        Index (pd.Index): Row index used for the values that are not already a pd.Series.
+
+    Returns:
+        pd.DataFrame: The table DataFrame (columns in the order of the Columns dict).
+
+    Notes:
+        - NumPy arrays keep their dtype (no per-cell boxing), Series keep their own index and dtype.
+    """
+    return pd.concat(
+        [
+            Values.rename(Name) if isinstance(Values, pd.Series) else pd.Series(Values, index=Index, name=Name)
+            for Name, Values in Columns.items()
+        ],
+        axis=1,
+    )
+
+
+
+# Low-cardinality (enum-like) table columns that are stored as pandas categories
+CategoryColumns = ("Device Type", "ID Type", "Action Type", "Type", "Status")
+
+def ShrinkDataFrame(DataFrame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Narrows the dtypes of a GUI table DataFrame in place to reduce its memory footprint.
+
+    Parameters:
+        DataFrame (pd.DataFrame): The table DataFrame.
+
+    Returns:
+        pd.DataFrame: The same DataFrame with integer columns downcast to the smallest integer type and
+        the enum-like columns listed in CategoryColumns converted to categories.
+
+    Notes:
+        - Float columns are kept as float64 so that the displayed (rounded) values do not change.
+    """
+    for Column in DataFrame.columns:
+        ColumnDType = DataFrame[Column].dtype
+        if pd.api.types.is_integer_dtype(ColumnDType):
+            DataFrame[Column] = pd.to_numeric(DataFrame[Column], downcast="integer")
+        elif Column in CategoryColumns and not pd.api.types.is_numeric_dtype(ColumnDType) and not isinstance(ColumnDType, pd.CategoricalDtype):
+            DataFrame[Column] = DataFrame[Column].astype("category")
+    return DataFrame
+
+
+
+@functools.lru_cache(maxsize=1024)
+def CenteredText(Content: str) -> Text:
+    """
+    Returns a center-aligned `Text` for a GUI table cell, shared between all cells with the same content.
+
+    Parameters:
+        Content (str): The cell text.
+
+    Returns:
+        Text: The center-aligned Text (must not be modified, as it may be shown in several cells).
+    """
+    return Text(Content, justify="center")
+
+
+
 async def FetchGeneratorChannelValues(BSPSSEPyGen, DebugPrint, app):
     """
     Asynchronously fetches channel values for all generators in BSPSSEPyGen.
@@ -928,31 +1115,74 @@ async def FetchGeneratorChannelValues(BSPSSEPyGen, DebugPrint, app):
         Tuple of lists: (PELECValues, PMECHValues, QELECValues, GREFValues, VREFValues)
     """
 
-    async def fetch_row_channels(row):
-        from Functions.BSPSSEPy.Sim.BSPSSEPyChannels import FetchChannelValue
-        """
-        Fetches channel values for a single generator row asynchronously.
-        """
-        return (
-            await FetchChannelValue(int(row["PELECChannel"]), DebugPrint=DebugPrint, app=app),
-            await FetchChannelValue(int(row["PMECHChannel"]), DebugPrint=DebugPrint, app=app),
-            await FetchChannelValue(int(row["QELECChannel"]), DebugPrint=DebugPrint, app=app),
-            await FetchChannelValue(int(row["GREFChannel"]), DebugPrint=DebugPrint, app=app),
-            await FetchChannelValue(int(row["VREFChannel"]), DebugPrint=DebugPrint, app=app)
-        )
+    from Functions.BSPSSEPy.Sim.BSPSSEPyChannels import FetchChannelValue  # Imported here (once per call): BSPSSEPyChannels imports bsprint from this module
 
-    # Use `asyncio.gather()` to fetch all generator data in parallel
-    results = await asyncio.gather(*(fetch_row_channels(row) for _, row in BSPSSEPyGen.iterrows()))
+    # Channel indices of all generators, one block per quantity: [PELEC..., PMECH..., QELEC..., GREF..., VREF...]
+    ChannelColumns = ["PELECChannel", "PMECHChannel", "QELECChannel", "GREFChannel", "VREFChannel"]
+    ChannelIndices = np.concatenate([BSPSSEPyGen[Column].to_numpy(dtype=int) for Column in ChannelColumns]).tolist()
 
-    # Unpack results into separate lists
-    PELECValues, PMECHValues, QELECValues, GREFValues, VREFValues = zip(*results)
+    # Use a single `asyncio.gather()` over every channel of every generator
+    results = await asyncio.gather(*(FetchChannelValue(ChannelIndex, DebugPrint=DebugPrint, app=app) for ChannelIndex in ChannelIndices))
 
-    return list(PELECValues), list(PMECHValues), list(QELECValues), list(GREFValues), list(VREFValues)
+    # Slice the results back into one list per quantity
+    NumberOfGenerators = len(BSPSSEPyGen)
+    PELECValues, PMECHValues, QELECValues, GREFValues, VREFValues = (
+        results[k * NumberOfGenerators:(k + 1) * NumberOfGenerators] for k in range(len(ChannelColumns))
+    )
+
+    return PELECValues, PMECHValues, QELECValues, GREFValues, VREFValues
 
 
 
     
 
+async def FetchGeneratorMVABase(BSPSSEPyGen, DebugPrint, app):
+    """
+    Fetches the machine MVA base (MBASE) of all generators in BSPSSEPyGen using PSSE's bulk
+    machine data API (one amachint/amachchar/amachreal call each) instead of one psspy.macdat call per generator.
+
+    Parameters:
+        BSPSSEPyGen (pd.DataFrame): Generator DataFrame (uses the "NUMBER" and "ID" columns).
+        DebugPrint (bool): Enable debug output.
+        app (App): The BSPSSEPy application instance.
+
+    Returns:
+        list[float]: MBASE of every generator, aligned with the rows of BSPSSEPyGen (None if not found).
+    """
+    SleepTime = app.bsprintasynciotime if app else 0
+
+    # The data is unpacked only after the error codes are checked (the data may be empty on error)
+    ierrNumber, NumberData = psspy.amachint(-1, 4, ['NUMBER'])
+    ierrID, IDData = psspy.amachchar(-1, 4, ['ID'])
+    ierrMBASE, MBASEData = psspy.amachreal(-1, 4, ['MBASE'])
+
+    if ierrNumber or ierrID or ierrMBASE or not (NumberData and IDData and MBASEData):
+        bsprint(f"[ERROR] Could not retrieve MVA Base of the generators. Error codes: {ierrNumber}, {ierrID}, {ierrMBASE}", app=app)
+        await asyncio.sleep(SleepTime)
+        return [None] * len(BSPSSEPyGen)
+
+    Buses, IDs, MBASEs = NumberData[0], IDData[0], MBASEData[0]
+
+    # (Bus Number, Machine ID) --> MBASE
+    MVABaseMap = dict(zip(zip(Buses, (GenID.strip() for GenID in IDs)), MBASEs))
+
+    GeneratorKeys = list(zip(BSPSSEPyGen["NUMBER"].tolist(), (str(GenID).strip() for GenID in BSPSSEPyGen["ID"].tolist())))
+    MVA_Base_List = [MVABaseMap.get(GeneratorKey) for GeneratorKey in GeneratorKeys]
+
+    # Report all generators without an MVA base in one message (no per-generator print/sleep)
+    MissingGenerators = [GeneratorKey for GeneratorKey, MVABase in zip(GeneratorKeys, MVA_Base_List) if MVABase is None]
+    if MissingGenerators:
+        bsprint(f"[ERROR] Could not retrieve MVA Base for Generator(s) (Bus, ID): {MissingGenerators}", app=app)
+        await asyncio.sleep(SleepTime)
+
+    if DebugPrint:
+        bsprint(f"[DEBUG] Retrieved MVA Base of {len(MVA_Base_List)} generators: {MVA_Base_List}", app=app)
+        await asyncio.sleep(SleepTime)
+
+    return MVA_Base_List
+
+
+
 def bsprint(*args, app=None, type: str | None = None, sep="\n", end=""):
     """
     Prints messages to the DetailsTextArea in the app if available.
@@ -976,23 +1206,64 @@ def bsprint(*args, app=None, type: str | None = None, sep="\n", end=""):
         app = args[-1]
         args = args[:-1]
 
-    Message = sep.join(map(str, args)) + end  # Join all arguments into a single string
-
     if app:
         
         if app.DummyRun:
             return
-        if type:
-            # If DebugCheckBox is checked, allow debug messages
-            if type.lower() in ["d", "debug"] and not app.DebugCheckBox.value:
-                return  # ✅ Skip debug messages if debugging is disabled
-            
-        AppendToDetailsTextArea(app.DetailsTextArea, Message,app=app)
+        IsDebugMessage = type is not None and type.lower() in ("d", "debug")
+        # If DebugCheckBox is checked, allow debug messages
+        if IsDebugMessage and not app.DebugCheckBox.value:
+            return  # ✅ Skip debug messages if debugging is disabled
+
+        # The arguments are only converted to text for messages that are actually shown
+        Message = sep.join(map(str, args)) + end  # Join all arguments into a single string
+
+        # Queue the message; all messages printed before the next event-loop tick are written in one insert
+        PendingMessages = getattr(app, "BSPSSEPyPendingMessages", None)
+        if PendingMessages is None:
+            PendingMessages = app.BSPSSEPyPendingMessages = []
+        if not PendingMessages:
+            app.call_later(FlushDetailsTextArea, app)  # First message of the batch schedules the flush
+        PendingMessages.append(Message)
 
         
     else:
-        print(Message)  # ✅ Fallback to terminal output when no GUI is available
+        print(sep.join(map(str, args)) + end)  # ✅ Fallback to terminal output when no GUI is available
+
+
+
+def DebugEnabled(DebugPrint, app=None):
+    """
+    Tells whether debug messages would actually be shown, so that callers can skip building them.
 
+    Parameters:
+        DebugPrint (bool): The DebugPrint flag of the caller.
+        app (BSPSSEPyApp, optional): The Textual app instance (default is None).
+
+    Returns:
+        bool: True if DebugPrint is set and, with the GUI, the Debug checkbox is checked and the run is not a dummy run.
+    """
+    return bool(DebugPrint) and (app is None or (app.DebugCheckBox.value and not app.DummyRun))
+
+
+
+def FlushDetailsTextArea(app):
+    """
+    Writes all messages queued by `bsprint` to the DetailsTextArea with a single insert and scroll.
+
+    Parameters:
+        app (BSPSSEPyApp): The Textual app instance holding the queued messages.
+
+    Notes:
+        - Each queued message is written on its own line, exactly as if it had been inserted separately.
+    """
+    PendingMessages = getattr(app, "BSPSSEPyPendingMessages", None)
+    if not PendingMessages:
+        return
+
+    Messages = "\n".join(PendingMessages)
+    PendingMessages.clear()
+    AppendToDetailsTextArea(app.DetailsTextArea, Messages, app=app)
 
 
 def AppendToDetailsTextArea(DetailsTextArea, Message,app=None):
@@ -1004,15 +1275,17 @@ def AppendToDetailsTextArea(DetailsTextArea, Message,app=None):
         Message (str): The message to append.
     """
     if DetailsTextArea:
-        if DetailsTextArea.document.line_count > 5000:  # ✅ Prevents UI lag by clearing old messages
+        LineCount = DetailsTextArea.document.line_count
+        if LineCount > 5000:  # ✅ Prevents UI lag by clearing old messages
             DetailsTextArea.clear()
             DetailsTextArea.insert(text="[LOG CLEARED - TOO LONG]\n")
+            LineCount = DetailsTextArea.document.line_count
 
 
         # Append new text at the last line
         DetailsTextArea.insert(
             text=f"{Message}",
-            location=(DetailsTextArea.document.line_count, 0),  # Move to last line
+            location=(LineCount, 0),  # Move to last line
             maintain_selection_offset=True
         )
 
@@ -1050,22 +1323,32 @@ def ProgressBarUpdate(ProgressBar, CurrentTime, TotalTime, App=None, label=None)
     if TotalTime <= 0:
         return
 
-    # Calculate progress percentage
-    ProgressPercentage = min((CurrentTime / TotalTime) * 100, 100)  # Cap at 100%
-    
-    ProgressBar.update(total=100, progress=ProgressPercentage)  # Update the progress bar
-    
+    # Calculate progress percentage (0.1% resolution)
+    ProgressPercentage = round(min((CurrentTime / TotalTime) * 100, 100), 1)  # Cap at 100%
+
+    # Only update the progress bar when the displayed percentage changes (the value is kept on the widget)
+    if getattr(ProgressBar, "BSPSSEPyLastProgress", None) != ProgressPercentage:
+        ProgressBar.BSPSSEPyLastProgress = ProgressPercentage
+        ProgressBar.update(total=100, progress=ProgressPercentage)  # Update the progress bar
+
+    # The label shows whole seconds only: skip it when the second has not changed
+    if not label:
+        return
+    WholeSeconds = int(CurrentTime)
+    if getattr(label, "BSPSSEPyLastSecond", None) == WholeSeconds:
+        return
+    label.BSPSSEPyLastSecond = WholeSeconds
+
     # Format the time display with hours, minutes, and seconds
-    hours = CurrentTime // 3600
-    minutes = (CurrentTime % 3600) // 60
-    seconds = CurrentTime % 60
+    minutes, seconds = divmod(WholeSeconds, 60)
+    hours, minutes = divmod(minutes, 60)
 
     if hours > 0:
-        TimeDisplay = f"t = {int(hours)}h {int(minutes)}m {int(seconds)}s"
+        TimeDisplay = f"t = {hours}h {minutes}m {seconds}s"
     elif minutes > 0:
-        TimeDisplay = f"t = {int(minutes)}m {int(seconds)}s"
+        TimeDisplay = f"t = {minutes}m {seconds}s"
     else:
-        TimeDisplay = f"t = {int(seconds)}s"
+        TimeDisplay = f"t = {seconds}s"
 
     # Format the time display
     # TimeDisplay = f"t = {int(CurrentTime)}s" if CurrentTime < 60 else f"t = {int(CurrentTime//60)}m {int(CurrentTime%60)}s"
@@ -1074,28 +1357,35 @@ def ProgressBarUpdate(ProgressBar, CurrentTime, TotalTime, App=None, label=None)
     # if App:
     #     App.call_later(AppendToDetailsTextArea, App.DetailsTextArea, f"Progress: {ProgressPercentage}%")
     
-    if label:
-        App.call_later(label.update, TimeDisplay)  # ✅ Properly schedules label update
+    App.call_later(label.update, TimeDisplay)  # ✅ Properly schedules label update
 
 
 def AddSavFilesToTree(ParentNode, FolderPath):
     """
-    Recursively scans the given folder and adds .sav files as leaves 
+    Scans the given folder (and all its subfolders) and adds .sav files as leaves 
     and subfolders as expandable nodes in the tree.
 
     Parameters:
         ParentNode (Tree.Node): The parent node where items will be added.
         FolderPath (str): The path of the folder to scan.
+
+    Notes:
+        - Subfolders are scanned with an explicit stack of (node, path) pairs instead of recursion.
     """
-    try:
-        # Get a sorted list of all items (files & directories) in the folder
-        for Entry in sorted(os.scandir(FolderPath), key=lambda E: E.name.lower()):
-            if Entry.is_dir():
-                # If it's a folder, add it as a node and recurse into it
-                FolderNode = ParentNode.add(Entry.name, expand=False)
-                AddSavFilesToTree(FolderNode, Entry.path)
-            elif Entry.is_file() and Entry.name.endswith(".sav"):
+    FoldersToScan = [(ParentNode, FolderPath)]
+    while FoldersToScan:
+        FolderNode, FolderPath = FoldersToScan.pop()
+        try:
+            # Get a sorted list of all items (files & directories) in the folder
+            with os.scandir(FolderPath) as Entries:
+                SortedEntries = sorted(Entries, key=lambda E: E.name.lower())
+        except PermissionError:
+            continue  # If permission is denied, just skip that folder
+
+        for Entry in SortedEntries:
+            if Entry.name.endswith(".sav") and Entry.is_file():
                 # If it's a .sav file, add it as a leaf
-                ParentNode.add_leaf(Entry.name)
-    except PermissionError:
-        pass  # If permission is denied, just skip that folder
\ No newline at end of file
+                FolderNode.add_leaf(Entry.name)
+            elif Entry.is_dir():
+                # If it's a folder, add it as a node and scan it later
+                FoldersToScan.append((FolderNode.add(Entry.name, expand=False), Entry.path))
\ No newline at end of file
@@ -3,6 +3,7 @@ import asyncio
 import random  # ✅ Used to generate random values for table updates
 
 import psspy
+from Functions.BSPSSEPy.PSSE.PSSE import WaitForPSSE
 
 async def RunSimulation(app, DummyRun: bool | None = False):
     """
@@ -21,6 +22,7 @@ async def RunSimulation(app, DummyRun: bool | None = False):
 
     if DummyRun:
         # Ensure no previous PSSE Setup is in memory - critical to empty channels and any other selected case-specific info not to be carried over unintentionally!
+        await WaitForPSSE()  # A cancelled run may still have a psspy call in the PSSE worker thread
         psspy.pssehalt_2()
 
         app.DummyRun = True
@@ -43,13 +45,17 @@ async def RunSimulation(app, DummyRun: bool | None = False):
     else:
 
         try:
+            app.CaseTree.disabled = True
+            app.StopButton.disabled = False
+            app.RunButton.disabled = True
+
             # Ensure no previous PSSE Setup is in memory - critical to empty channels and any other selected case-specific info not to be carried over unintentionally!
+            await WaitForPSSE()  # A cancelled run may still have a psspy call in the PSSE worker thread
             psspy.pssehalt_2()
 
             del app.myBSPSSEPy
-            app.StopButton.disabled = False
-            app.RunButton.disabled = True
 
+            FlushDetailsTextArea(app)  # Write queued bsprint messages first to keep the log in order
             AppendToDetailsTextArea(app.DetailsTextArea, f"Run Started")
             AppendToDetailsTextArea(app.DetailsTextArea, f"Config: {app.ConfigPath}")
 
@@ -241,6 +247,7 @@ async def RunSimulation(app, DummyRun: bool | None = False):
             # Simulation Completed
             # ==========================
             app.CaseTree.disabled = False
+            FlushDetailsTextArea(app)  # Write queued bsprint messages first to keep the log in order
             AppendToDetailsTextArea(app.DetailsTextArea, "Run Completed")
             app.StopButton.disabled = True
             app.RunButton.disabled = False
@@ -19,9 +19,21 @@ from .Sim.Sim import Sim
 from .Plot.Plot import *
 # from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import * # Importing custom helper functions
 from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import bsprint
+from .Sim.BSPSSEPyAGCKernel import WarmUpAGCKernel
+from .Sim.BSPSSEPyBrnKernel import WarmUpBrnKernel
+from Functions.BSPSSEPy.App.BSPSSEPyAppDiffKernel import WarmUpDiffKernel
 
 import asyncio
 
+def WarmUpNumericKernels():
+    """
+    Compiles (or loads from the Numba cache) the numeric kernels used during the simulation and the GUI updates.
+    """
+    WarmUpAGCKernel()
+    WarmUpBrnKernel()
+    WarmUpDiffKernel()
+
+
 class BSPSSEPy:
     def __init__(self, CaseName=None, Ver=None, ConfigPath=None, DebugPrint=None, app=None):
         self.ConfigPath = ConfigPath
@@ -57,42 +69,41 @@ class BSPSSEPy:
          
         if app:
             DebugPrint = app.DebugCheckBox.value
-        
-        if DebugPrint:
-            bsprint("[DEBUG] Entered BSPSSEPy Constructor",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            bsprint("[DEBUG] Initializing configuration settings...",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        # await asyncio.sleep(app.bsprintasynciotime if app else 0)
+
+        async def DebugMessages(*Messages):
+            # Debug messages of one init step: printed together (queued by bsprint in the GUI), then a single
+            # yield to the event loop so that they are shown (no per-message bsprintasynciotime delay)
+            if DebugPrint:
+                for Message in Messages:
+                    bsprint(Message, app=app)
+                await asyncio.sleep(0)
+
+        await DebugMessages("[DEBUG] Entered BSPSSEPy Constructor", "[DEBUG] Initializing configuration settings...")
+
+        # Compile (or load from the Numba cache) the AGC and GUI diff kernels in a worker thread while the
+        # configuration and PSSE are initialized. The kernels do not use PSSE, so they can run alongside it.
+        KernelWarmUp = asyncio.create_task(asyncio.to_thread(WarmUpNumericKernels))
+
         # Initialize configuration settings
         self.Config = Config()
         await self.Config.ConfigInit(CaseName=CaseName, Ver=Ver, ConfigPath=ConfigPath, DebugPrint=DebugPrint, app=app)
 
-        if DebugPrint:
-            bsprint("[DEBUG] Configuration settings initialized successfully.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            bsprint("[DEBUG] Initializing PSSE simulation module...",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        await DebugMessages("[DEBUG] Configuration settings initialized successfully.", "[DEBUG] Initializing PSSE simulation module...")
         
         # Initialize PSSE module
         self.PSSE = PSSE()
         await self.PSSE.PSSEInit(Config=self.Config, app = app)
         
-        if DebugPrint:
-            bsprint("[DEBUG] PSSE simulation module initialized successfully.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            bsprint("[DEBUG] Initializing Simulation logic...",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        await DebugMessages("[DEBUG] PSSE simulation module initialized successfully.", "[DEBUG] Initializing Simulation logic...")
+
+        # The simulation logic uses the AGC kernel: make sure the warm-up is done
+        await KernelWarmUp
 
         # Initialize simulation logic
         self.Sim = Sim()
         await self.Sim.SimInit(Config=self.Config, PSSE=self.PSSE, DebugPrint=DebugPrint,app=app)
         
-        if DebugPrint:
-            bsprint("[DEBUG] Simulation logic initialized successfully.", app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            bsprint("[DEBUG] BSPSSEPy Constructor completed.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        await DebugMessages("[DEBUG] Simulation logic initialized successfully.", "[DEBUG] BSPSSEPy Constructor completed.")
         
         self.InitializationCompleted = True
     
@@ -0,0 +1,21 @@
+# ===========================================================
+#   BSPSSEPy Application - Optional Numba Support
+# ===========================================================
+#   This module provides the njit decorator used by the BSPSSEPy
+#   numeric kernels. It is Numba's njit when Numba is installed;
+#   otherwise a fallback that leaves the decorated functions as
+#   plain Python/NumPy code.
+#
+#   Last Updated: BSPSSEPy Ver 0.4 (11 Feb 2025)
+#   Copyright (c) 2024-2025, Ilyas Farhat
+#   Contact: ilyas.farhat@outlook.com
+# ===========================================================
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed (returns the function unchanged)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda Function: Function
@@ -0,0 +1,440 @@
+# ===========================================================
+#   BSPSSEPy Application - Case Configuration Loader
+# ===========================================================
+#   This module parses a case configuration file once and keeps
+#   the result in a frozen CaseConfig object. Generator settings
+#   are stored column-wise (one NumPy array per field) instead of
+#   a list of dictionaries.
+#
+#   Case configurations can be written as Python (.py), TOML
+#   (.toml) or JSON (.json) files. All formats go through the
+#   same validation.
+#
+#   Parsed cases are memoized in-process (keyed by the resolved
+#   path and the file modification time) and pickled next to the
+#   config file ("<config file>.compiled"), so unchanged config
+#   files are not parsed again.
+#
+#   Last Updated: BSPSSEPy Ver 0.4 (11 Feb 2025)
+#   Copyright (c) 2024-2025, Ilyas Farhat
+#   Contact: ilyas.farhat@outlook.com
+# ===========================================================
+
+import json
+import types
+import pickle
+import functools
+import importlib.util
+from dataclasses import dataclass
+from typing import NamedTuple
+from pathlib import Path
+import numpy as np
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+
+# Bumped whenever the layout of CaseConfig changes, so stale ".compiled" caches are ignored
+CaseConfigCacheVersion = 6
+
+
+# Default generator settings (used when a key is missing from a GeneratorsConfig entry).
+# These match the defaults documented in ExtendBSPSSEPyGenDataFrame.
+GeneratorDefaults = {
+    "Status": 0,                    # 0: OFF, 1: Cranking, 2: Ramp-up, 3: Ready/active
+    "Load Name": "Default",         # Default --> load name is "L[Gen Name]"
+    "Cranking Time": 0.0,           # minutes
+    "Ramp Rate": 0.0,               # MW/min
+    "Generator Type": "NBS",        # NBS or BS
+    "Cranking Load Array": [1.0, 1.0, 0.0, 0.0, 0.0, 0.0],
+    "AGC Participation Factor": 0.0,
+    "Load Damping Constant": 0.0,   # D
+    "Effective Speed Droop": 0.05,  # R
+    "Bias Scaling": 1.0,            # Bias Scaling (Effective Bias = Bias * Bias Scaling)
+    "POPF": 0.0,                    # MW
+    "QOPF": 0.0,                    # MVAR
+    "UseGenRampRate": False,
+    "Load Enabled Response": False,
+    "LERPF": -1,
+}
+
+
+# Numeric generator settings, compiled once into a NumPy structured array (one record per generator).
+# Units are normalized at load time: CrankingTimeSec in seconds and RampRateMWPerSec in MW/s.
+GeneratorDType = np.dtype([
+    ("IsBS", bool),                     # True for black-start generators
+    ("Status", np.int8),                # Initial BSPSSEPy status (forced to 3 for BS generators)
+    ("CrankingTime", np.float64),       # minutes (as given in the config file)
+    ("CrankingTimeSec", np.float64),    # seconds
+    ("RampRate", np.float64),           # MW/min (as given in the config file)
+    ("RampRateMWPerSec", np.float64),   # MW/s
+    ("AGCAlpha", np.float64),           # AGC participation factor
+    ("LoadDampConstant", np.float64),   # D
+    ("EffectiveSpeedDroop", np.float64),  # R
+    ("BiasScaling", np.float64),
+    ("POPF", np.float64),               # MW
+    ("QOPF", np.float64),               # MVAR
+    ("UseGenRampRate", bool),
+    ("LoadEnabledResponse", bool),
+    ("LERPF", np.float64),
+])
+
+
+# Keys that must be present for every NBS generator (BS generators only need a name and a type)
+NBSRequiredKeys = ("Load Name", "Cranking Time", "Ramp Rate", "Cranking Load Array")
+
+
+@dataclass(frozen=True, slots=True)
+class GeneratorsTable:
+    """
+    Column-wise (struct-of-arrays) view of the GeneratorsConfig table.
+
+    Every attribute holds one entry per configured generator, in the order
+    they appear in the configuration file.
+
+    Attributes:
+        GenName (tuple): Generator names ("Generator Name").
+        BusName (tuple): Associated bus names ("Bus Name").
+        LoadName (tuple): Cranking load names ("Load Name").
+        GenType (tuple): "BS" or "NBS" ("Generator Type").
+        CrankingLoadArray (tuple): Cranking load power arrays [PL, QL, IP, IQ, YP, YQ(, Power Factor)].
+        Records (np.ndarray): Structured array (GeneratorDType) with the numeric settings.
+        Uniform (dict): Fields of Records that hold the same value for every generator, mapped to that value.
+
+    Notes:
+        - The fields of Records can be read directly as attributes, e.g. Generators.IsBS or
+          Generators.RampRateMWPerSec return the corresponding column of Records.
+        - Use Field(Name) when a scalar is enough for uniform fields (e.g., the same droop for all generators).
+    """
+    GenName: tuple
+    BusName: tuple
+    LoadName: tuple
+    GenType: tuple
+    CrankingLoadArray: tuple
+    Records: np.ndarray
+    Uniform: dict
+
+    def __len__(self):
+        return len(self.GenName)
+
+    def Field(self, Name):
+        """
+        Returns a numeric field as a scalar if it is uniform across all generators, otherwise as an array.
+
+        Parameters:
+            Name (str): Field name (see GeneratorDType).
+
+        Returns:
+            scalar or np.ndarray: The shared value, or one value per generator.
+        """
+        if Name in self.Uniform:
+            return self.Uniform[Name]
+        return self.Records[Name]
+
+    def __getattr__(self, Name):
+        if Name in GeneratorDType.names:
+            return self.Records[Name]
+        raise AttributeError(f"'GeneratorsTable' object has no attribute '{Name}'")
+
+
+@dataclass(frozen=True, slots=True)
+class CaseConfig:
+    """
+    Parsed case configuration.
+
+    Attributes:
+        ConfigPath (str): Resolved path of the configuration file.
+        Settings (dict): All user settings defined in the file (CaseName, Ver, SimulationTimeStep, ...).
+            BusesToMonitor_Voltage and BusesToMonitor_Frequency are stored as int32 arrays.
+        Generators (GeneratorsTable): Column-wise generator configuration.
+    """
+    ConfigPath: str
+    Settings: dict
+    Generators: GeneratorsTable
+
+
+class SimParams(NamedTuple):
+    """
+    Derived simulation quantities, computed once after the configuration is loaded.
+
+    Attributes:
+        FreqFilter (float): Frequency filtering time constant (Simulationfreqfilter) in seconds.
+        HardTimeLimitSec (float): Hard time limit in seconds.
+        FreqSafetyLow (float): Average frequencies below this value (in Hz) delay pending actions.
+        FreqSafetyHigh (float): Average frequencies above this value (in Hz) delay pending actions.
+        ProgressPrintSec (float): Interval between progress messages in seconds.
+    """
+    FreqFilter: float
+    HardTimeLimitSec: float
+    FreqSafetyLow: float
+    FreqSafetyHigh: float
+    ProgressPrintSec: float
+
+
+# Tolerance (Hz) used when checking the average frequency against the safety margin
+FreqSafetyTolerance = 1e-3
+
+
+def BuildSimParams(Config):
+    """
+    Computes the derived simulation quantities from a loaded Config object.
+
+    Parameters:
+        Config (Config): The loaded BSPSSEPy configuration.
+
+    Returns:
+        SimParams: The derived quantities.
+    """
+    HardTimeLimitSec = Config.BSPSSEPyHardTimeLimit * 60
+    ProgressPrintSec = Config.BSPSSEPyProgressPrintTime * 60
+
+    return SimParams(
+        FreqFilter=Config.Simulationfreqfilter,
+        HardTimeLimitSec=HardTimeLimitSec,
+        FreqSafetyLow=Config.FreqSafetyMarginMin - FreqSafetyTolerance,
+        FreqSafetyHigh=Config.FreqSafetyMarginMax + FreqSafetyTolerance,
+        ProgressPrintSec=ProgressPrintSec,
+    )
+
+
+def _AsIntArray(Buses):
+    """
+    Converts a bus specification (range, list, tuple or np.ndarray) into a contiguous int32 array.
+
+    TOML/JSON configs can also give a range as a table {"start": 1, "stop": 10, "step": 1} ("step" is optional).
+    """
+    if isinstance(Buses, dict):
+        Buses = range(Buses["start"], Buses["stop"], Buses.get("step", 1))
+    if isinstance(Buses, np.ndarray):
+        return np.ascontiguousarray(Buses, dtype=np.int32)
+    return np.asarray(list(Buses), dtype=np.int32)
+
+
+def ValidateGeneratorsConfig(GeneratorsConfig):
+    """
+    Checks a GeneratorsConfig list before it is compiled.
+
+    Parameters:
+        GeneratorsConfig (list): List of generator dictionaries as defined in the case config file.
+
+    Raises:
+        ValueError: If a generator has no name/bus name, an unknown "Generator Type", or if an
+            NBS generator is missing one of NBSRequiredKeys.
+    """
+    for GenIndex, Gen in enumerate(GeneratorsConfig):
+        GenLabel = Gen.get("Generator Name") or Gen.get("Bus Name")
+        if not GenLabel:
+            raise ValueError(f'GeneratorsConfig[{GenIndex}] needs a "Generator Name" or a "Bus Name".')
+
+        GenType = Gen.get("Generator Type", GeneratorDefaults["Generator Type"])
+        if GenType not in ("BS", "NBS"):
+            raise ValueError(f'Generator "{GenLabel}": "Generator Type" must be "BS" or "NBS" (got "{GenType}").')
+
+        if GenType == "NBS":
+            MissingKeys = [Key for Key in NBSRequiredKeys if Key not in Gen]
+            if MissingKeys:
+                raise ValueError(f'NBS generator "{GenLabel}" is missing: {", ".join(MissingKeys)}.')
+
+
+def _UniformFields(Records):
+    """
+    Finds the fields of a GeneratorDType structured array that hold the same value for every record.
+
+    Returns:
+        dict: {field name: shared value (Python scalar)}. Empty if there are no records.
+    """
+    if len(Records) == 0:
+        return {}
+    return {
+        Name: Records[Name][0].item()
+        for Name in GeneratorDType.names
+        if (Records[Name] == Records[Name][0]).all()
+    }
+
+
+def BuildGeneratorsTable(GeneratorsConfig):
+    """
+    Validates a GeneratorsConfig list of dictionaries and compiles it into a GeneratorsTable.
+
+    Parameters:
+        GeneratorsConfig (list): List of generator dictionaries as defined in the case config file.
+
+    Returns:
+        GeneratorsTable: Column-wise generator configuration, built in a single pass.
+
+    Raises:
+        ValueError: If GeneratorsConfig is invalid (see ValidateGeneratorsConfig).
+
+    Notes:
+        - Missing keys are filled from GeneratorDefaults.
+        - Black-start generators ("Generator Type" == "BS") always start with status 3.
+        - Cranking times are converted to seconds and ramp rates to MW/s once, here.
+    """
+    ValidateGeneratorsConfig(GeneratorsConfig)
+
+    Records = np.zeros(len(GeneratorsConfig), dtype=GeneratorDType)
+    GenNames = []
+    BusNames = []
+    LoadNames = []
+    GenTypes = []
+    CrankingLoadArrays = []
+
+    for GenIndex, Gen in enumerate(GeneratorsConfig):
+        GenNames.append(Gen.get("Generator Name"))
+        BusNames.append(Gen.get("Bus Name"))
+        Gen = {**GeneratorDefaults, **Gen}  # Fill missing keys with the defaults
+
+        LoadNames.append(Gen["Load Name"])
+        GenTypes.append(Gen["Generator Type"])
+        CrankingLoadArrays.append(list(Gen["Cranking Load Array"]))
+
+        IsBS = Gen["Generator Type"] == "BS"
+        Records[GenIndex] = (
+            IsBS,
+            3 if IsBS else Gen["Status"],
+            Gen["Cranking Time"],
+            Gen["Cranking Time"] * 60,
+            Gen["Ramp Rate"],
+            Gen["Ramp Rate"] / 60,
+            Gen["AGC Participation Factor"],
+            Gen["Load Damping Constant"],
+            Gen["Effective Speed Droop"],
+            Gen["Bias Scaling"],
+            Gen["POPF"],
+            Gen["QOPF"],
+            Gen["UseGenRampRate"],
+            Gen["Load Enabled Response"],
+            Gen["LERPF"],
+        )
+
+    return GeneratorsTable(
+        GenName=tuple(GenNames),
+        BusName=tuple(BusNames),
+        LoadName=tuple(LoadNames),
+        GenType=tuple(GenTypes),
+        CrankingLoadArray=tuple(CrankingLoadArrays),
+        Records=Records,
+        Uniform=_UniformFields(Records),
+    )
+
+
+def _ReadPythonConfig(ConfigPath):
+    """
+    Executes a Python config file and returns its user settings as a dictionary.
+
+    Modules, functions, classes and private names (starting with "_") are dropped.
+    """
+    spec = importlib.util.spec_from_file_location("ConfigModule", ConfigPath)
+    ConfigModule = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(ConfigModule)
+
+    return {
+        Key: Value
+        for Key, Value in ConfigModule.__dict__.items()
+        if not Key.startswith("_")
+        and not isinstance(Value, (types.ModuleType, types.FunctionType, type))
+    }
+
+
+def _ReadTomlConfig(ConfigPath):
+    """
+    Reads a TOML config file and returns its settings as a dictionary.
+
+    GeneratorsConfig is written as an array of tables ([[GeneratorsConfig]]) with quoted keys.
+    """
+    if tomllib is None:
+        raise ValueError("TOML configuration files require Python 3.11 or newer (tomllib).")
+    with open(ConfigPath, "rb") as f:
+        return tomllib.load(f)
+
+
+def _ReadJsonConfig(ConfigPath):
+    """
+    Reads a JSON config file (a single object) and returns its settings as a dictionary.
+    """
+    with open(ConfigPath, "r", encoding="utf-8") as f:
+        Settings = json.load(f)
+    if not isinstance(Settings, dict):
+        raise ValueError("A JSON configuration file must contain a single object.")
+    return Settings
+
+
+# Config file readers, by file suffix
+ConfigReaders = {
+    ".py": _ReadPythonConfig,
+    ".toml": _ReadTomlConfig,
+    ".json": _ReadJsonConfig,
+}
+
+
+def _CacheFile(ResolvedPath):
+    """Returns the on-disk cache file used for a given config path ("<config file>.compiled")."""
+    return Path(f"{ResolvedPath}.compiled")
+
+
+@functools.lru_cache(maxsize=None)
+def _LoadCaseConfigCached(ResolvedPath, MTime):
+    """
+    Parses a config file (or reads it back from the disk cache).
+
+    The (ResolvedPath, MTime) pair is the memoization key, so editing the
+    config file invalidates both the in-process and the on-disk cache. The
+    on-disk cache is also keyed on CaseConfigCacheVersion.
+    """
+    CacheFile = _CacheFile(ResolvedPath)
+    CacheKey = (ResolvedPath, MTime, CaseConfigCacheVersion)
+
+    if CacheFile.exists():
+        try:
+            with open(CacheFile, "rb") as f:
+                CachedKey, CachedCase = pickle.load(f)
+            if CachedKey == CacheKey:
+                return CachedCase
+        except Exception:
+            pass  # Corrupted or outdated cache --> parse the config file again
+
+    Reader = ConfigReaders.get(Path(ResolvedPath).suffix.lower())
+    if Reader is None:
+        raise ValueError(f"Unsupported configuration file type (expected one of {', '.join(ConfigReaders)}).")
+    Settings = Reader(ResolvedPath)
+
+    # Materialize the monitored buses (often given as range(...)) into int32 arrays
+    for Key in ("BusesToMonitor_Voltage", "BusesToMonitor_Frequency"):
+        if Key in Settings:
+            Settings[Key] = _AsIntArray(Settings[Key])
+
+    Case = CaseConfig(
+        ConfigPath=ResolvedPath,
+        Settings=Settings,
+        Generators=BuildGeneratorsTable(Settings.get("GeneratorsConfig", [])),
+    )
+
+    try:
+        with open(CacheFile, "wb") as f:
+            pickle.dump((CacheKey, Case), f)
+    except Exception:
+        pass  # The disk cache is an optimization only; never fail the load because of it
+
+    return Case
+
+
+def LoadCaseConfig(ConfigPath):
+    """
+    Loads a case configuration file into a CaseConfig object.
+
+    Parameters:
+        ConfigPath (str or Path): The path to the configuration file (.py, .toml or .json).
+
+    Returns:
+        CaseConfig: The parsed configuration (shared between calls, treat it as read-only).
+
+    Raises:
+        ValueError: If the file type is not supported, the file cannot be decoded, or the generator table is invalid.
+
+    Notes:
+        - The result is memoized on the resolved path and the file modification time.
+    """
+    ConfigPath = Path(ConfigPath).resolve()
+    return _LoadCaseConfigCached(str(ConfigPath), ConfigPath.stat().st_mtime_ns)
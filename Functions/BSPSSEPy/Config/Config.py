@@ -27,6 +27,7 @@
         BSPSSEPyHardTimeLimit (int): Enforces a hard time limit on simulation.
         BSPSSEPyTimeStep (int): Controls time-dependent actions execution rate.
         BSPSSEPyProgressPrintTime (int): Frequency of progress messages.
+        SimParams (SimParams): Derived simulation quantities (see CaseConfig.SimParams).
 """
 import os
 import asyncio
@@ -35,6 +36,7 @@ import importlib.util
 import datetime
 import pandas as pd
 from .LoadConfig import LoadConfig
+from .CaseConfig import BuildGeneratorsTable, BuildSimParams
 from .CSVControlPlanConfig import BSPSSEPyControlSequenceTable
 from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import bsprint
 
@@ -203,6 +205,10 @@ class Config:
         #   For BS Generators, the status should be "ON", and the rest of the parameters are all ignored.
         self.GeneratorsConfig = []  # Default is an empty list.
 
+        # Column-wise (struct-of-arrays) view of GeneratorsConfig, filled by LoadConfig.
+        # Each field is a NumPy array (or tuple of names) with one entry per configured generator.
+        self.Generators = BuildGeneratorsTable(self.GeneratorsConfig)
+
         self.EnforceActionLock = True  # Flag to enforce checking action lock logic
         
         self.ControlSequenceAsIs = False
@@ -257,6 +263,13 @@ class Config:
 
         if isinstance(ConfigPath, str):
             ConfigPath = Path(ConfigPath)
+
+        # Fall back to a TOML/JSON config file when the Python config file does not exist
+        if ConfigPath and not ConfigPath.exists():
+            for Suffix in (".toml", ".json"):
+                if ConfigPath.with_suffix(Suffix).exists():
+                    ConfigPath = ConfigPath.with_suffix(Suffix)
+                    break
         
 
         bsprint(f'Attempting to load configuration file "{ConfigPath.name}"', app=app)
@@ -285,6 +298,9 @@ class Config:
             
         DebugPrint = self.DebugPrint
 
+        # Derived simulation quantities (time-step ratios, limits in seconds, safety band), computed once
+        self.SimParams = BuildSimParams(self)
+
         # Prepare directories for the case
         self.CaseFolder = self.MainFolder / f"Case/{self.CaseName}"
         self.LogsFolder = self.CaseFolder / "Logs"
@@ -10,7 +10,8 @@
 # ===========================================================
 
 import os
-import importlib.util
+import sys
+from .CaseConfig import LoadCaseConfig
 from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import bsprint
 import asyncio
 
@@ -20,15 +21,16 @@ async def LoadConfig(self, ConfigPath, DebugPrint=False,app=None):
     
     Parameters:
         self (Config): The instance of the BSPSSEPy.Config class where values will be assigned.
-        ConfigPath (str): The path to the Python configuration file.
+        ConfigPath (str): The path to the configuration file (.py, .toml or .json).
         DebugPrint (bool): If True, prints detailed debug messages about the loading process.
     
-    This function dynamically imports the given config file, retrieves its variables, and assigns
-    them to the corresponding attributes in the Config class if they exist. Only defined attributes
-    in the class are updated to prevent unintended modifications.
+    This function parses the given config file (through the cached LoadCaseConfig loader), retrieves
+    its variables, and assigns them to the corresponding attributes in the Config class if they exist.
+    Only defined attributes in the class are updated to prevent unintended modifications.
+    The column-wise generator table is stored in `self.Generators`.
     
     Notes:
-        - The configuration file must be a valid Python script.
+        - The configuration file must be a valid Python script, or a TOML/JSON file with the same settings.
         - Variables in the configuration file should be named using uppercase letters.
     """
     if (DebugPrint is None) and app:
@@ -42,31 +44,32 @@ async def LoadConfig(self, ConfigPath, DebugPrint=False,app=None):
             bsprint(f"[DEBUG] Config file located at: {ConfigPath}",app=app)
             await asyncio.sleep(app.bsprintasynciotime if app else 0)
         
-        # Dynamically load the specified config file using the importlib module
-        # This approach allows you to import Python files (configuration files) at runtime.
-        spec = importlib.util.spec_from_file_location("ConfigModule", ConfigPath)
-        
-        # Create a module from the specification. This will act as the imported configuration file.
-        ConfigModule = importlib.util.module_from_spec(spec)
-        
-        # If DebugPrint is enabled, print a debug message indicating the import process has started.
+        # Parse the config file into a CaseConfig object.
+        # The result is cached on the file path and modification time, so an unchanged
+        # config file is not re-executed (see CaseConfig.LoadCaseConfig).
         if DebugPrint:
             bsprint("[DEBUG] Importing configuration module...",app=app)
             await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                
-        # Execute the module (import the configuration file) so that its contents become available.
-        spec.loader.exec_module(ConfigModule)
-        
+
+        try:
+            Case = LoadCaseConfig(ConfigPath)
+        except ValueError as e:
+            # The generator table failed validation (e.g., an NBS generator is missing a required field)
+            bsprint(f"[ERROR] Invalid configuration file {ConfigPath}: {e}",app=app)
+            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+            if app:
+                raise Exception("Error In LoadConfig function!")
+            else:
+                sys.exit(1)
+
         # If DebugPrint is enabled, print a debug message indicating the import process has finished.
         if DebugPrint:
             bsprint("[DEBUG] Configuration module imported successfully.",app=app)
             await asyncio.sleep(app.bsprintasynciotime if app else 0)
         
-        # Now that the config file is imported as a module (ConfigModule),
-        # loop over all items in the module's dictionary (its variables and values).
-        for Key, Value in ConfigModule.__dict__.items():
-            # Only assign values to the Config object's attributes if the key is uppercase 
-            # and if the attribute exists in the current Config object (self).
+        # Loop over all user settings defined in the config file.
+        for Key, Value in Case.Settings.items():
+            # Only assign values to the Config object's attributes if the attribute exists in the current Config object (self).
             if hasattr(self, Key):
                 # Update the attribute in the Config object with the value from the config file.
                 setattr(self, Key, Value)
@@ -75,6 +78,9 @@ async def LoadConfig(self, ConfigPath, DebugPrint=False,app=None):
                 if DebugPrint:
                     bsprint(f"[DEBUG] Assigned {Key} = {Value} to Config attribute.",app=app)
                     await asyncio.sleep(app.bsprintasynciotime if app else 0)
+
+        # Column-wise generator configuration (built once from GeneratorsConfig)
+        self.Generators = Case.Generators
     
     else:
         # If the provided config file does not exist at the specified path, print an error message.
@@ -17,7 +17,211 @@ from Functions.BSPSSEPy.Sim.BSPSSEPyDefaultVariables import BSPSSEPyDefaultVaria
 from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import bsprint
 import asyncio
 import io
-from contextlib import redirect_stdout
+import functools
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+
+
+# One worker thread for the blocking psspy calls of the initialization: the event loop stays responsive while PSSE
+# works, and the calls still run one at a time (psspy is not thread-safe)
+PSSEExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="BSPSSEPyPSSE")
+PSSEPending = set()  # Futures of the RunPSSE calls that have not finished yet
+
+# Fixed decoupled Newton-Raphson (FDNS) options of the initial power flow solution
+FDNSOptions = (0, 0, 0, 1, 1, 0, 99, 0)
+FDNSMaxRuns = 6  # Maximum number of FDNS runs before the final full Newton-Raphson (FNSL) solution
+
+
+async def RunPSSE(Function, *args):
+    """
+    Runs a blocking psspy function in the PSSE worker thread and waits for its result without blocking the event loop.
+
+    Parameters:
+        Function (callable): The psspy function (or a function making psspy calls).
+        *args: Arguments passed to Function.
+
+    Returns:
+        The return value of Function.
+
+    Notes:
+        A running psspy call cannot be interrupted. If the awaiting task is cancelled (Stop button), the cancellation
+        is only raised once the call has finished, so no other psspy call can start while the worker thread is still
+        inside PSSE.
+    """
+    Future = asyncio.get_running_loop().run_in_executor(PSSEExecutor, Function, *args)
+    PSSEPending.add(Future)
+    Future.add_done_callback(PSSEPending.discard)
+    try:
+        return await asyncio.shield(Future)
+    except asyncio.CancelledError:
+        while not Future.done():
+            try:
+                await asyncio.wait((Future,))
+            except asyncio.CancelledError:
+                continue
+        raise
+
+
+async def WaitForPSSE():
+    """
+    Waits until every psspy call started with RunPSSE has finished.
+    """
+    if PSSEPending:
+        await asyncio.wait(set(PSSEPending))
+
+
+def SolvePowerFlow():
+    """
+    Solves the initial power flow: up to FDNSMaxRuns FDNS runs (stopping as soon as the case is solved), then FNSL.
+
+    Notes:
+        - Runs in the PSSE worker thread (all iterations in one call).
+        - psspy.solved() returns 0 once the convergence tolerance is met; further FDNS runs would not change the solution.
+    """
+    Options = list(FDNSOptions)
+    for _ in range(FDNSMaxRuns):
+        psspy.fdns(Options)
+        if psspy.solved() == 0:
+            break
+    psspy.fnsl()
+
+
+@contextmanager
+def CaptureStdoutFD(CapturedOutput):
+    """
+    Redirects the process-level standard output (file descriptor 1) to a temporary file, so that the text written by
+    PSSE's native code (which bypasses sys.stdout) is captured too.
+
+    Parameters:
+        CapturedOutput (list): The captured text is appended to this list when the context exits.
+
+    Notes:
+        - A temporary file is used instead of a pipe, so a long output can never block the writer.
+        - Only used without the GUI: the Textual app also draws on file descriptor 1 (on Windows).
+    """
+    if sys.__stdout__:
+        sys.__stdout__.flush()  # Earlier buffered output belongs to the terminal, not to the capture
+    SavedFD = os.dup(1)
+    with tempfile.TemporaryFile() as TempFile:
+        os.dup2(TempFile.fileno(), 1)
+        try:
+            yield
+        finally:
+            if sys.__stdout__:
+                sys.__stdout__.flush()
+            os.dup2(SavedFD, 1)
+            os.close(SavedFD)
+            TempFile.seek(0)
+            CapturedOutput.append(TempFile.read().decode(errors="replace"))
+
+
+def PSSEInitCapturingOutput(NumberOfBuses, CaptureNativeOutput=False):
+    """
+    Calls psspy.psseinit while capturing what it prints.
+
+    Parameters:
+        NumberOfBuses (int): Bus size passed to psspy.psseinit.
+        CaptureNativeOutput (bool, optional): Also capture the output written directly to file descriptor 1 by PSSE's
+            native code (see CaptureStdoutFD). Default is False (Python-level sys.stdout only).
+
+    Returns:
+        tuple: (psseinit error code, captured output)
+    """
+    # Create a StringIO object to capture the output
+    output_capture = io.StringIO()
+    NativeOutput = []
+
+    # Use the context managers to capture the stdout (Python-level, and file descriptor level if requested)
+    with redirect_stdout(output_capture):
+        if CaptureNativeOutput:
+            with CaptureStdoutFD(NativeOutput):
+                CaseInitializationFlag = psspy.psseinit(NumberOfBuses)
+        else:
+            CaseInitializationFlag = psspy.psseinit(NumberOfBuses)
+    # Get the captured output
+    return CaseInitializationFlag, output_capture.getvalue() + "".join(NativeOutput)
+
+
+def CheckPSSEError(ierr, SuccessMessage, ErrorMessage, app=None):
+    """
+    Checks the error code returned by a PSSE API call.
+
+    Parameters:
+        ierr (int): Error code returned by psspy (0 means success).
+        SuccessMessage (str): Message printed when ierr is 0.
+        ErrorMessage (str): Message of the RuntimeError raised otherwise (the error code is appended to it).
+        app (BSPSSEPyApp, optional): The GUI application instance (None when running without the GUI).
+
+    Raises:
+        RuntimeError: If ierr is not 0.
+    """
+    if ierr:
+        raise RuntimeError(f"{ErrorMessage}. Error code: {ierr}")
+    bsprint(SuccessMessage, app=app)
+
+
+def RunPSSECalls(Calls):
+    """
+    Runs a sequence of psspy calls in one go, stopping at the first call that fails.
+
+    Parameters:
+        Calls (list): (Function, args) pairs, run in order.
+
+    Returns:
+        list: The error codes of the calls that were run (the last one is non-zero if a call failed).
+    """
+    Errors = []
+    for Function, args in Calls:
+        ierr = Function(*args)
+        Errors.append(ierr)
+        if ierr:
+            break
+    return Errors
+
+
+async def RunAndCheckPSSECalls(Calls, app=None):
+    """
+    Submits a sequence of psspy calls to the PSSE worker thread as one job, then checks their error codes in order.
+
+    Parameters:
+        Calls (list): (Function, args, SuccessMessage, ErrorMessage) tuples (messages as in CheckPSSEError).
+        app (BSPSSEPyApp, optional): The GUI application instance (None when running without the GUI).
+
+    Raises:
+        RuntimeError: If one of the calls fails (the calls after it are not run).
+    """
+    Errors = await RunPSSE(RunPSSECalls, [(Function, args) for Function, args, _, _ in Calls])
+    for ierr, (_, _, SuccessMessage, ErrorMessage) in zip(Errors, Calls):
+        CheckPSSEError(ierr, SuccessMessage, ErrorMessage, app)
+
+
+def StatOrNone(FilePath):
+    """
+    Returns the os.stat result of a file, or None if it does not exist (or cannot be accessed).
+
+    One stat gives both the existence and the modification time of the file.
+    """
+    try:
+        return os.stat(FilePath)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def LoadConvCode(ConvCodeFile, ModifiedTime):
+    """
+    Reads and compiles the case conversion script (ConvCodeFile).
+
+    Parameters:
+        ConvCodeFile (str): Path to the conversion script.
+        ModifiedTime (float): Modification time of the script (part of the cache key, so an edited script is recompiled).
+
+    Returns:
+        code: The compiled script, ready to be passed to exec().
+    """
+    with open(ConvCodeFile, "r") as file:
+        return compile(file.read(), ConvCodeFile, "exec")
 
 
 class PSSE:
@@ -52,29 +256,43 @@ class PSSE:
                 DebugPrint = app.DebugCheckBox.value
             else:
                 DebugPrint = Config.DebugPrint
-        
+
+        # Messages are printed without waiting; with the GUI, the event loop gets one yield per initialization phase
+        # (before the phase's blocking PSSE call) so that the queued messages are shown. Without the GUI there is
+        # nothing to show, so there is no yield at all
+        SleepTime = app.bsprintasynciotime if app else 0
 
         if DebugPrint:
             bsprint("[DEBUG] Entering PSSE Constructor...",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+            if app:
+                await asyncio.sleep(SleepTime)
 
         
         try:
+            # File paths (as strings for psspy) and names (for the messages), converted once
+            SAVPath, SAVName = str(Config.SAVFile), Config.SAVFile.name
+            DYRPath, DYRName = str(Config.DYRFile), Config.DYRFile.name
+            CNVPath, CNVName = str(Config.CNVFile), Config.CNVFile.name
+            SNPPath, SNPName = str(Config.SNPFile), Config.SNPFile.name
+            LogPath = str(Config.LogFile)
+
+            # Stat the CNV, SNP and conversion script files concurrently in worker threads while PSSE loads the case
+            # (one stat per file gives both existence and modification time; results used below)
+            FileStats = asyncio.gather(
+                asyncio.to_thread(StatOrNone, CNVPath),
+                asyncio.to_thread(StatOrNone, SNPPath),
+                asyncio.to_thread(StatOrNone, Config.ConvCodeFile),
+            )
+
             # ==========================
             #  Initialize PSSE
             # ==========================
+            self.LoadedDYRFile = None  # Path of the DYR file whose dynamics data is loaded in PSSE (None if none)
 
-            # Create a StringIO object to capture the output
-            output_capture = io.StringIO()
-
-            # Use the context manager to capture the stdout
-            with redirect_stdout(output_capture):
-                self.CaseInitializationFlag = psspy.psseinit(Config.NumberOfBuses)
-            # Get the captured output
-            captured_output = output_capture.getvalue()
+            # Initialize PSSE and capture its output
+            self.CaseInitializationFlag, captured_output = await RunPSSE(PSSEInitCapturingOutput, Config.NumberOfBuses, app is None)
             
             bsprint(captured_output, app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
             
             if self.CaseInitializationFlag != 0:
                 # if app:
@@ -84,11 +302,9 @@ class PSSE:
                     raise RuntimeError(f"PSSE initialization failed with error code {self.CaseInitializationFlag}.")
             else:
                 bsprint("PSSE initialized successfully.",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
             if DebugPrint:
                 bsprint(f"[DEBUG] Case Initialization Flag: {self.CaseInitializationFlag} (0 indicates no errors)",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
 
             # Retrieve default PSSE values for inputs
@@ -96,57 +312,51 @@ class PSSE:
             self.DefaultInt, self.DefaultReal, self.DefaultChar = BSPSSEPyDefaultVariablesFun()
             if DebugPrint:
                 bsprint("[DEBUG] Default PSSE values retrieved.",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-
-            # Redirect PSSE progress output to log file
-            psspy.progress_output(2,str(Config.LogFile),[0,0])
-            bsprint(f"Log file will be saved to: {Config.LogFile}",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
-            # ==========================
-            #  Load SAV File
-            # ==========================
-            bsprint("Loading SAV File",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            ierr = psspy.case(str(Config.SAVFile))
-            if ierr == 0:
-                bsprint(f"[SUCCESS] SAV file '{Config.SAVFile.name}' loaded successfully.",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
+            # Redirect PSSE progress output to log file (PSSE opens the file, so this also runs in the PSSE worker thread)
+            await RunPSSE(psspy.progress_output, 2, LogPath, [0, 0])
+            bsprint(f"Log file will be saved to: {LogPath}",app=app)
+
+            # Both the CNV and SNP files supersede the SAV/DYR files and the power flow solution: when they are available
+            # (and not ignored), the case goes straight to loading them
+            CNVFileStat, SNPFileStat, ConvCodeFileStat = await FileStats
+            # Which files are loaded and which are (re)created is decided once, here, for the rest of the initialization
+            LoadCNVFile = CNVFileStat is not None and not Config.IgnoreCNVFile
+            CreateSNPFile = SNPFileStat is None or Config.IgnoreSNPFile
+            if LoadCNVFile and not CreateSNPFile:
+                bsprint(f"CNV file '{CNVName}' and SNP file '{SNPName}' found. Skipping SAV/DYR loading and power flow solution.",app=app)
             else:
-                # if app:
-                #     raise Exception(f"[ERROR] Failed to load SAV file '{Config.SAVFile.name}'. Error code: {ierr}")
-                # else:
-                    raise RuntimeError(f"[ERROR] Failed to load SAV file '{Config.SAVFile.name}'. Error code: {ierr}")
-
-            # ==========================
-            #  Load DYR File
-            # ==========================
-            bsprint("Loading DYR File",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            # Starting indices (use defaults unless you know what you're doing)
-            startindx = [1, 1, 1, 1]
-            ierr = psspy.dyre_new_2(startindx, str(Config.DYRFile))  # Use CaseDYRFile directly
-
-            # Check for errors
-            if ierr == 0:
-                bsprint(f"[SUCCESS] DYR file '{Config.DYRFile.name}' loaded successfully.",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            else:
-                # if app:
-                #     raise Exception (f"[ERROR] Failed to load DYR file '{Config.DYRFile.name}'. Error code: {ierr}")
-                # else:
-                    raise RuntimeError(f"[ERROR] Failed to load DYR file '{Config.DYRFile.name}'. Error code: {ierr}")
+                # ==========================
+                #  Load SAV File
+                # ==========================
+                bsprint("Loading SAV File",app=app)
+                if app:
+                    await asyncio.sleep(SleepTime)
+                ierr = await RunPSSE(psspy.case, SAVPath)
+                CheckPSSEError(ierr, f"[SUCCESS] SAV file '{SAVName}' loaded successfully.", f"[ERROR] Failed to load SAV file '{SAVName}'", app)
+
+                # ==========================
+                #  Load DYR File
+                # ==========================
+                bsprint("Loading DYR File",app=app)
+                if app:
+                    await asyncio.sleep(SleepTime)
+                # Starting indices (use defaults unless you know what you're doing)
+                startindx = [1, 1, 1, 1]
+                ierr = await RunPSSE(psspy.dyre_new_2, startindx, DYRPath)  # Use CaseDYRFile directly
+
+                # Check for errors
+                CheckPSSEError(ierr, f"[SUCCESS] DYR file '{DYRName}' loaded successfully.", f"[ERROR] Failed to load DYR file '{DYRName}'", app)
+                self.LoadedDYRFile = DYRPath  # Dynamics data currently in PSSE memory
             
-            # ==========================
-            #  Power Flow Solution
-            # ==========================
-            bsprint("Running Power Flow Solution...",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            for _ in range(6):
-                psspy.fdns([0, 0, 0, 1, 1, 0, 99, 0])
-            psspy.fnsl()
-            bsprint("[SUCCESS] Power flow solved successfully.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+                # ==========================
+                #  Power Flow Solution
+                # ==========================
+                bsprint("Running Power Flow Solution...",app=app)
+                if app:
+                    await asyncio.sleep(SleepTime)
+                await RunPSSE(SolvePowerFlow)
+                bsprint("[SUCCESS] Power flow solved successfully.",app=app)
 
             
             
@@ -166,40 +376,30 @@ class PSSE:
             #  CNV File Handling
             # ==========================
             bsprint("Checking and Loading CNV File...",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            if os.path.exists(Config.CNVFile) and not Config.IgnoreCNVFile:
-                bsprint(f"CNV file '{Config.CNVFile.name}' found. Loading...",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                ierr = psspy.case(str(Config.CNVFile))  # Load the CNV File 
-                if ierr == 0:
-                    bsprint(f"[SUCCESS] CNV file '{Config.CNVFile.name}' loaded successfully.",app=app)
-                    await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                else:
-                    # if app:
-                    #     raise Exception(f"[ERROR] Failed to load CNV file '{Config.CNVFile.name}'. Error code: {ierr}")
-                    # else:
-                        raise RuntimeError(f"[ERROR] Failed to load CNV file '{Config.CNVFile.name}'. Error code: {ierr}")
+            if app:
+                await asyncio.sleep(SleepTime)
+            PendingPSSECalls = []  # File writes held back to be submitted to PSSE together with the SNP file creation
+            if LoadCNVFile:
+                bsprint(f"CNV file '{CNVName}' found. Loading...",app=app)
+                ierr = await RunPSSE(psspy.case, CNVPath)  # Load the CNV File 
+                self.LoadedDYRFile = None  # Loading a case clears the dynamics data
+                CheckPSSEError(ierr, f"[SUCCESS] CNV file '{CNVName}' loaded successfully.", f"[ERROR] Failed to load CNV file '{CNVName}'", app)
             else:
-                bsprint(f"File '{Config.CNVFile.name}' not found or ignored. Converting case '{Config.SAVFile.name}'",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
+                bsprint(f"File '{CNVName}' not found or ignored. Converting case '{SAVName}'",app=app)
                 bsprint(f"Importing conversion script in {Config.ConvCodeFile.name}",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
+                if app:
+                    await asyncio.sleep(SleepTime)
                 
-                # We read the file content in ConvCodeFile
-                with open(Config.ConvCodeFile,"r") as file:
-                    exec(file.read())
+                # We read and compile the file content in ConvCodeFile (off the event loop, cached until the file changes)
+                ConvCode = await asyncio.to_thread(LoadConvCode, str(Config.ConvCodeFile),
+                                                  ConvCodeFileStat.st_mtime if ConvCodeFileStat is not None else None)
+                exec(ConvCode)
                 
-                bsprint(f"Saving the CNV File '{Config.CNVFile.name}'",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                ierr = psspy.save(str(Config.CNVFile))
-                if ierr == 0:
-                    bsprint(f"[SUCCESS] Converted case saved to '{Config.CNVFile.name}'.",app=app)
-                    await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                else:
-                    # if app:
-                    #     raise Exception(f"[ERROR] Failed to save CNV file '{Config.CNVFile.name}'. Error code: {ierr}")
-                    # else:
-                        raise RuntimeError(f"[ERROR] Failed to save CNV file '{Config.CNVFile.name}'. Error code: {ierr}")
+                bsprint(f"Saving the CNV File '{CNVName}'",app=app)
+                PendingPSSECalls.append((psspy.save, (CNVPath,), f"[SUCCESS] Converted case saved to '{CNVName}'.", f"[ERROR] Failed to save CNV file '{CNVName}'"))
+                if not CreateSNPFile:
+                    await RunAndCheckPSSECalls(PendingPSSECalls, app)
+                    PendingPSSECalls = []
 
 
 
@@ -210,49 +410,32 @@ class PSSE:
             #  SNP File Handling
             # ==========================
             bsprint("Checking and Loading SNP File...",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            if os.path.exists(Config.SNPFile) and not Config.IgnoreSNPFile:
-                bsprint(f"SNP file '{Config.SNPFile.name}' found. Loading...",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                ierr = psspy.rstr(str(Config.SNPFile))  # Load the SNP File 
-                if ierr == 0:
-                    bsprint(f"[SUCCESS] Snapshot file '{Config.SNPFile.name}' loaded successfully.",app=app)
-                    await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                else:
-                    # if app:
-                    #     raise Exception(f"[ERROR] Failed to load SNP file '{Config.SNPFile.name}'. Error code: {ierr}")
-                    # else:
-                        raise RuntimeError(f"[ERROR] Failed to load SNP file '{Config.SNPFile.name}'. Error code: {ierr}")
+            if app:
+                await asyncio.sleep(SleepTime)
+            if not CreateSNPFile:
+                bsprint(f"SNP file '{SNPName}' found. Loading...",app=app)
+                ierr = await RunPSSE(psspy.rstr, SNPPath)  # Load the SNP File 
+                CheckPSSEError(ierr, f"[SUCCESS] Snapshot file '{SNPName}' loaded successfully.", f"[ERROR] Failed to load SNP file '{SNPName}'", app)
             else:
-                bsprint(f"File '{Config.SNPFile.name}' not found or ignored. Creating new SNP file...",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                bsprint(f"Loading DYRE file '{Config.DYRFile}'",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                ierr = psspy.dyre_new_2([1, 1, 1, 1], str(Config.DYRFile))
-                if ierr == 0:
-                    bsprint(f"[SUCCESS] Dynamics data from file '{Config.DYRFile.name}' loaded successfully.",app=app)
-                    await asyncio.sleep(app.bsprintasynciotime if app else 0)
+                bsprint(f"File '{SNPName}' not found or ignored. Creating new SNP file...",app=app)
+                if self.LoadedDYRFile == DYRPath:
+                    # The case was converted in memory: the dynamics data loaded above is still there
+                    bsprint(f"Dynamics data from file '{DYRName}' already loaded.",app=app)
                 else:
-                    # if app:
-                    #     raise Exception(f"[ERROR] Failed to load DYRE file '{Config.DYRFile.name}'. Error code: {ierr}")
-                    # else:
-                        raise RuntimeError(f"[ERROR] Failed to load DYRE file '{Config.DYRFile.name}'. Error code: {ierr}")
+                    bsprint(f"Loading DYRE file '{DYRPath}'",app=app)
+                    PendingPSSECalls.append((psspy.dyre_new_2, ([1, 1, 1, 1], DYRPath), f"[SUCCESS] Dynamics data from file '{DYRName}' loaded successfully.", f"[ERROR] Failed to load DYRE file '{DYRName}'"))
                 
-                bsprint (f" Saving snapshot to '{Config.SNPFile}'",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                ierr = psspy.snap([-1, -1, -1, -1, -1], str(Config.SNPFile))
-                if ierr == 0:
-                    bsprint(f"[SUCCESS] Snapshot saved to '{Config.SNPFile.name}'.",app=app)
-                    await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                else:
-                    # if app:
-                    #     raise Exception(f"[ERROR] Failed to save SNP file '{Config.SNPFile.name}'. Error code: {ierr}")
-                    # else:
-                        raise RuntimeError(f"[ERROR] Failed to save SNP file '{Config.SNPFile.name}'. Error code: {ierr}")
+                bsprint (f" Saving snapshot to '{SNPPath}'",app=app)
+                PendingPSSECalls.append((psspy.snap, ([-1, -1, -1, -1, -1], SNPPath), f"[SUCCESS] Snapshot saved to '{SNPName}'.", f"[ERROR] Failed to save SNP file '{SNPName}'"))
+
+                # One PSSE job for the held back CNV save (if any), the DYR loading (if needed) and the snapshot
+                await RunAndCheckPSSECalls(PendingPSSECalls, app)
+                self.LoadedDYRFile = DYRPath
 
 
             bsprint("[SUCCESS] PSSE Initialization Completed Successfully.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+            if app:
+                await asyncio.sleep(SleepTime)
 
             #█ █▄ █ █ ▀█▀ █ ▄▀█ █   █ ▀█ ▄▀█ ▀█▀ █ █▀█ █▄ █   █▀▀ █▀█ █▀▄▀█ █▀█ █   █▀▀ ▀█▀ █▀▀ █▀▄
             #█ █ ▀█ █  █  █ █▀█ █▄▄ █ █▄ █▀█  █  █ █▄█ █ ▀█   █▄▄ █▄█ █ ▀ █ █▀▀ █▄▄ ██▄  █  ██▄ █▄▀ ▄
@@ -260,12 +443,11 @@ class PSSE:
 
         except Exception as e:
             bsprint(f"[ERROR] An unexpected error occurred: {e}",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
             if DebugPrint:
                 bsprint("[DEBUG] Exception details:", app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
                 bsprint(str(e),app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
+            if app:
+                await asyncio.sleep(SleepTime)
             
             if app:
                 raise
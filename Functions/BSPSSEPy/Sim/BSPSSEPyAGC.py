@@ -3,6 +3,7 @@ import pandas as pd
 import psse3601
 import psspy
 from .BSPSSEPyGenFunctions import GetGenInfo
+from .BSPSSEPyAGCKernel import AGCStep
 from .BSPSSEPyChannels import FetchChannelValue, FetchChannelValuesFromOUTFile
 from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import bsprint
 import asyncio
@@ -195,49 +196,60 @@ async def AGCControl(
 
     
     # **Adjust Each Generator's Setpoint**
-    for idx, GeneratorRow in BSPSSEPyGen[BSPSSEPyGen["BSPSSEPyStatus"] == 3].iterrows():
-        EffectiveAGCAlpha = GeneratorRow.get("EffectiveAGCAlpha", 0)
-        EffectiveBias = GeneratorRow.get("EffectiveBias", 0)
-            
-        if EffectiveAGCAlpha > 0:
-            CurrentSetpoint = await GetGenInfo("PGEN", GenName=GeneratorRow["MCNAME"], DebugPrint=DebugPrint, app=app)
+    AGCGenerators = BSPSSEPyGen[(BSPSSEPyGen["BSPSSEPyStatus"] == 3) & (BSPSSEPyGen["EffectiveAGCAlpha"] > 0)]
 
-            # Compute AGC adjustment based on frequency deviation
-            Adjustment = -EffectiveAGCAlpha * AverageFrequencyDeviation * EffectiveBias * (TimeStep / AGCTimeConstant)
-            NewSetpoint = max(0, CurrentSetpoint + Adjustment)  # Ensure non-negative setpoint
+    if not AGCGenerators.empty:
+        # Fetch the current PGEN of all generators with a single PSSE call
+        PSSEGenData = await GetGenInfo(["MCNAME", "PGEN"], DebugPrint=DebugPrint, app=app)
+        PGENByName = dict(zip(PSSEGenData["MCNAME"], PSSEGenData["PGEN"]))
 
-            if DebugPrint:
-                bsprint(f"[DEBUG] Generator {GeneratorRow['MCNAME']} at Bus {GeneratorRow['NUMBER']}:", app=app)
-                bsprint(f"        Current Setpoint={CurrentSetpoint:.2f} MW, Adjustment={Adjustment:.2f} MW, New Setpoint={NewSetpoint:.2f} MW", app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        CurrentSetpoints = np.array([PGENByName[GenName] for GenName in AGCGenerators["MCNAME"]], dtype=np.float64)
+        EffectiveAGCAlphas = AGCGenerators["EffectiveAGCAlpha"].to_numpy(dtype=np.float64)
+        EffectiveBiases = AGCGenerators["EffectiveBias"].to_numpy(dtype=np.float64)
+        Adjustments = np.empty_like(CurrentSetpoints)
+        NewSetpoints = np.empty_like(CurrentSetpoints)
 
-            # Update generator setpoint in PSSE
-            GeneratorName = GeneratorRow["MCNAME"]
-            GeneratorID = GeneratorRow["ID"]
-            BusNumber = GeneratorRow["NUMBER"]
+        # Compute AGC adjustments based on frequency deviation (all generators at once)
+        AGCStep(CurrentSetpoints, EffectiveAGCAlphas, EffectiveBiases, float(AverageFrequencyDeviation), float(TimeStep), float(AGCTimeConstant), Adjustments, NewSetpoints)
 
-            # Set the corresponding alpha to EffectiveAGCAlpha in my BSPSSEPyAGCDF dataframe --> for GUI purposes here
-            BSPSSEPyAGCDF.loc[BSPSSEPyAGCDF["Gen Name"] == GeneratorRow["MCNAME"], "Alpha"] = EffectiveAGCAlpha
+    for i, (idx, GeneratorRow) in enumerate(AGCGenerators.iterrows()):
+        EffectiveAGCAlpha = EffectiveAGCAlphas[i]
+        CurrentSetpoint = CurrentSetpoints[i]
+        Adjustment = Adjustments[i]
+        NewSetpoint = NewSetpoints[i]
 
-            ierr, GeneratorMVA_Base = psspy.macdat(BusNumber, GeneratorID, 'MBASE')
-            if ierr == 0 and DebugPrint:
-                bsprint(f"[DEBUG] Retrieved MVA Base for Generator at Bus {BusNumber}, ID {GeneratorID}: {GeneratorMVA_Base} MVA", app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            elif ierr != 0:
-                bsprint(f"[ERROR] Could not retrieve MVA Base for Generator at Bus {BusNumber}, ID {GeneratorID}. Error code: {ierr}", app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        if DebugPrint:
+            bsprint(f"[DEBUG] Generator {GeneratorRow['MCNAME']} at Bus {GeneratorRow['NUMBER']}:", app=app)
+            bsprint(f"        Current Setpoint={CurrentSetpoint:.2f} MW, Adjustment={Adjustment:.2f} MW, New Setpoint={NewSetpoint:.2f} MW", app=app)
+            await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
-            Adjustment_pu = Adjustment / GeneratorMVA_Base
-            ierr = psspy.increment_gref(BusNumber, GeneratorID, Adjustment)  # Apply AGC adjustment
+        # Update generator setpoint in PSSE
+        GeneratorName = GeneratorRow["MCNAME"]
+        GeneratorID = GeneratorRow["ID"]
+        BusNumber = GeneratorRow["NUMBER"]
 
-            if ierr == 0:
-                BSPSSEPyGen.at[idx, "PGEN"] = NewSetpoint
-                BSPSSEPyAGCDF.loc[BSPSSEPyAGCDF['Gen Name']==GeneratorName, 'ΔPᴳ'] = NewSetpoint
-                if DebugPrint:
-                    bsprint(f"[DEBUG] Successfully updated {GeneratorName} setpoint - AGC.")
-            elif ierr != 0:
-                bsprint(f"[ERROR] Updating setpoint for Generator {GeneratorName} (ID = {GeneratorID}) at Bus {BusNumber}, ierr={ierr}", app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        # Set the corresponding alpha to EffectiveAGCAlpha in my BSPSSEPyAGCDF dataframe --> for GUI purposes here
+        BSPSSEPyAGCDF.loc[BSPSSEPyAGCDF["Gen Name"] == GeneratorRow["MCNAME"], "Alpha"] = EffectiveAGCAlpha
+
+        ierr, GeneratorMVA_Base = psspy.macdat(BusNumber, GeneratorID, 'MBASE')
+        if ierr == 0 and DebugPrint:
+            bsprint(f"[DEBUG] Retrieved MVA Base for Generator at Bus {BusNumber}, ID {GeneratorID}: {GeneratorMVA_Base} MVA", app=app)
+            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        elif ierr != 0:
+            bsprint(f"[ERROR] Could not retrieve MVA Base for Generator at Bus {BusNumber}, ID {GeneratorID}. Error code: {ierr}", app=app)
+            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+
+        Adjustment_pu = Adjustment / GeneratorMVA_Base
+        ierr = psspy.increment_gref(BusNumber, GeneratorID, Adjustment)  # Apply AGC adjustment
+
+        if ierr == 0:
+            BSPSSEPyGen.at[idx, "PGEN"] = NewSetpoint
+            BSPSSEPyAGCDF.loc[BSPSSEPyAGCDF['Gen Name']==GeneratorName, 'ΔPᴳ'] = NewSetpoint
+            if DebugPrint:
+                bsprint(f"[DEBUG] Successfully updated {GeneratorName} setpoint - AGC.")
+        elif ierr != 0:
+            bsprint(f"[ERROR] Updating setpoint for Generator {GeneratorName} (ID = {GeneratorID}) at Bus {BusNumber}, ierr={ierr}", app=app)
+            await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
 
     if DebugPrint:
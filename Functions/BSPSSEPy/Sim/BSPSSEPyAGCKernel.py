@@ -0,0 +1,44 @@
+# ===========================================================
+#   BSPSSEPy Application - AGC Kernel
+# ===========================================================
+#   This module holds the numeric part of the AGC step (setpoint
+#   adjustments for all participating generators at once). It is
+#   compiled with Numba when Numba is installed; otherwise the
+#   same code runs as plain Python/NumPy.
+#
+#   Last Updated: BSPSSEPy Ver 0.4 (11 Feb 2025)
+#   Copyright (c) 2024-2025, Ilyas Farhat
+#   Contact: ilyas.farhat@outlook.com
+# ===========================================================
+
+import numpy as np
+from Functions.BSPSSEPy.BSPSSEPyNumba import njit
+
+
+@njit(cache=True)
+def AGCStep(CurrentSetpoint, EffectiveAGCAlpha, EffectiveBias, AverageFrequencyDeviation, TimeStep, AGCTimeConstant, Adjustment, NewSetpoint):
+    """
+    Computes the AGC setpoint adjustment of every participating generator.
+
+    Parameters:
+        CurrentSetpoint (np.ndarray[float64]): Current active power output (PGEN) in MW.
+        EffectiveAGCAlpha (np.ndarray[float64]): Effective AGC participation factors.
+        EffectiveBias (np.ndarray[float64]): Effective bias of each generator.
+        AverageFrequencyDeviation (float): Average system frequency deviation (p.u.).
+        TimeStep (float): BSPSSEPy time step in seconds.
+        AGCTimeConstant (float): Time constant for the first-order AGC adjustment in seconds.
+        Adjustment (np.ndarray[float64]): Output - setpoint adjustment in MW (filled in place).
+        NewSetpoint (np.ndarray[float64]): Output - new (non-negative) setpoint in MW (filled in place).
+    """
+    for i in range(CurrentSetpoint.shape[0]):
+        Adjustment[i] = -EffectiveAGCAlpha[i] * AverageFrequencyDeviation * EffectiveBias[i] * (TimeStep / AGCTimeConstant)
+        NewSetpoint[i] = max(0.0, CurrentSetpoint[i] + Adjustment[i])  # Ensure non-negative setpoint
+
+
+def WarmUpAGCKernel():
+    """
+    Calls AGCStep once with empty arrays so that Numba compiles (or loads from its cache) the kernel
+    before the simulation starts instead of at the first AGC step.
+    """
+    Empty = np.zeros(0, dtype=np.float64)
+    AGCStep(Empty, Empty, Empty, 0.0, 1.0, 60.0, np.zeros(0, dtype=np.float64), np.zeros(0, dtype=np.float64))
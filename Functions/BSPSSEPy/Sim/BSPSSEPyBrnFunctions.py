@@ -5,11 +5,17 @@
 #    - Handles cases for single/multiple keys and specific/all branches.
 #
 # 2. GetBranchInfoPSSE: Fetches branch-related data directly from PSSE using the PSSE library. This function is called by GetBranchInfo.
+#    - GetBrnInfoPSSEBatch fetches several keys at once (one PSSE call per data type); GetBranchInfo uses it directly.
 #
 # 3. BranchTrip: Trips a branch based on its ID, name, or bus connections and updates the BSPSSEPyBrn DataFrame.
 #
 # 4. BranchClose: Closes a branch based on its ID, name, or bus connections and updates the BSPSSEPyBrn DataFrame.
 #
+# GetBranchInfo and BranchTrip also have plain (non-async) forms, GetBrnInfoSync and BrnTripSync, for callers that do not
+# need to go through the event loop (BranchClose stays async: it awaits the bus functions).
+# GetBrnInfoBatch selects several branches by name in one pass and BrnTripRow trips a branch from such a row, for callers
+# that act on many branches at once.
+#
 # This module ensures dynamic interaction with PSSE for real-time data, while allowing extended tracking and simulation-specific metadata updates through the BSPSSEPyBrn DataFrame.
 #
 # Key Features:
@@ -30,14 +36,113 @@
 import psspy
 import dyntools
 import pandas as pd
+import numpy as np
 from .BSPSSEPyBusFunctions import *
+from .BSPSSEPyBrnKernel import FindBranchRow
 from Functions.BSPSSEPy.BSPSSEPyDictionary import *
-from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import bsprint
-import asyncio
+from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import bsprint, DebugEnabled
 
 # from Functions.BSPSSEPy.BSPSSEPyFunctionsDictionary import *
 
-async def GetBrnInfo(BrnKeys,  # The key(s) for the required information of the Branch
+# Branch identification data: does not change during a run, so it is read from BSPSSEPyBrn (when given) instead of PSSE
+BrnStaticKeys = ("ID", "BRANCHNAME", "FROMNUMBER", "FROMNAME", "TONUMBER", "TONAME")
+
+# psspy function fetching the branch data of each data type (as returned by psspy.abrntypes)
+BrnInfoPSSEFunctions = {
+    'I': psspy.abrnint,   # Integer data
+    'R': psspy.abrnreal,  # Real data
+    'C': psspy.abrnchar,  # Character data
+    'X': psspy.abrncplx,  # Complex data
+}
+
+# Data type of each branch info string (abrnString --> 'I', 'R', 'C' or 'X'). The types never change, so each string is
+# looked up with psspy.abrntypes only once (on first use: psspy cannot be queried before PSSE is initialized)
+BrnInfoPSSETypes = {}
+
+# BSPSSEPyBrn columns updated by every branch action (BrnTrip/BrnClose)
+BrnActionColumns = ("BSPSSEPyStatus", "BSPSSEPyLastAction", "BSPSSEPyLastActionTime", "BSPSSEPySimulationNotes", "STATUS")
+
+# Branch data already fetched from PSSE ((abrnString, BranchEntry) --> list), reused by GetBrnInfoPSSE until the branch
+# data in PSSE may have changed (see ClearBrnInfoPSSECache)
+BrnInfoPSSECache = {}
+
+# Branch name --> row position in the PSSE branch data (None for names used by more than one branch). The branch names
+# and their order only change when a new case is loaded
+BrnNamePositions = {}
+
+
+def ClearBrnInfoPSSECache(NewCase=False):
+    """
+    Empties the cache of branch data fetched from PSSE.
+
+    Parameters:
+        NewCase (bool): Also forget the branch name positions (a new case was loaded in PSSE).
+
+    Notes:
+        - Must be called after every action that can change the branch data in PSSE: branch/bus trip or close,
+          simulation time step (psspy.run) and loading a new case.
+        - The identification data (BrnStaticKeys) does not change within a case, so it is kept until NewCase; only
+          the dynamic data (status, flows, ...) is fetched again from PSSE.
+    """
+    if NewCase:
+        BrnInfoPSSECache.clear()
+        BrnNamePositions.clear()
+        return
+
+    for CacheKey in [CacheKey for CacheKey in BrnInfoPSSECache if CacheKey[0] not in BrnStaticKeys]:
+        del BrnInfoPSSECache[CacheKey]
+
+
+def GetBrnBSPSSEPyColumns(BSPSSEPyBrn):
+    """
+    Returns the BSPSSEPyBrn columns that GetBrnInfo reads from the DataFrame instead of PSSE.
+
+    Parameters:
+        BSPSSEPyBrn (pd.DataFrame): The BSPSSEPyBrn DataFrame containing branch data.
+
+    Returns:
+        list of str: The identification columns (BrnStaticKeys) and the columns that are not PSSE keys (BrnInfoDic).
+
+    Notes:
+        - The list is computed once and kept in BSPSSEPyBrn.attrs with the number of columns it was computed for, so
+          it is computed again when columns are added to the DataFrame.
+    """
+    Cached = BSPSSEPyBrn.attrs.get("BSPSSEPyOnlyColumns")
+    if Cached is None or Cached[0] != len(BSPSSEPyBrn.columns):
+        Columns = [key for key in BSPSSEPyBrn.columns if key in BrnStaticKeys or key not in BrnInfoDic]
+        Cached = (len(BSPSSEPyBrn.columns), Columns)
+        BSPSSEPyBrn.attrs["BSPSSEPyOnlyColumns"] = Cached
+    return Cached[1]
+
+
+def GetBrnNamePosition(BranchName, BranchNames):
+    """
+    Returns the row position of a branch in the PSSE branch data from its name (hash lookup instead of a column scan).
+
+    Parameters:
+        BranchName (str): Name of the branch (stripped).
+        BranchNames (iterable of str): The BRANCHNAME column of the PSSE branch data (used to build the lookup once).
+
+    Returns:
+        int or None: Row position of the branch, or None if the name is not found or is used by several branches.
+    """
+    if not BrnNamePositions:
+        for Position, Name in enumerate(BranchNames):
+            BrnNamePositions[Name] = None if Name in BrnNamePositions else Position
+    return BrnNamePositions.get(BranchName)
+
+
+async def GetBrnInfo(BrnKeys, BranchName=None, FromBus=None, ToBus=None, BSPSSEPyBrn=None, DebugPrint=False, app=None):
+    """
+    Retrieves information about branches based on the specified keys.
+
+    Async form of GetBrnInfoSync (same arguments and return value), kept for the callers running in the event loop.
+    """
+    return GetBrnInfoSync(BrnKeys, BranchName=BranchName, FromBus=FromBus, ToBus=ToBus, BSPSSEPyBrn=BSPSSEPyBrn, DebugPrint=DebugPrint, app=app)
+
+
+
+def GetBrnInfoSync(BrnKeys,  # The key(s) for the required information of the Branch
                BranchName=None,  # Branch Name (optional)
                FromBus=None,  # From Bus Number or Name (optional)
                ToBus=None,  # To Bus Number or Name (optional)
@@ -76,10 +181,12 @@ async def GetBrnInfo(BrnKeys,  # The key(s) for the required information of the
         - The function combines PSSE and BSPSSEPyBrn data if both are available for comprehensive results.
         - Filtering logic is applied based on BranchName, FromBus, and ToBus.
     """
+    # Debug messages are only built when they are shown
+    DebugPrint = DebugEnabled(DebugPrint, app)
+
     # Debug logging
     if DebugPrint:
         bsprint(f"[DEBUG] Retrieving branch info for BrnKeys: {BrnKeys}, BranchName: {BranchName}, FromBus: {FromBus}, ToBus: {ToBus}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
     # Ensure BrnKeys is a list
     if isinstance(BrnKeys, str):
@@ -104,62 +211,81 @@ async def GetBrnInfo(BrnKeys,  # The key(s) for the required information of the
 
     # Separate PSSE and BSPSSEPyBrn keys
     ValidPSSEKeys = BrnInfoDic.keys()
-    ValidBSPSSEPyKeys = [] if BSPSSEPyBrn is None else BSPSSEPyBrn.columns
+    UseBSPSSEPyBrn = BSPSSEPyBrn is not None and not BSPSSEPyBrn.empty
+    ValidBSPSSEPyKeys = GetBrnBSPSSEPyColumns(BSPSSEPyBrn) if UseBSPSSEPyBrn else ()
 
-    # Add PSSE Keys needed for basic branch operations
+    # Add PSSE Keys needed for basic branch operations. Identification keys already in BSPSSEPyBrn are not fetched from
+    # PSSE; the other (dynamic) keys, e.g., STATUS, always come from PSSE
     _BrnKeys = ["BRANCHNAME", "FROMNUMBER", "FROMNAME", "TONUMBER", "TONAME"]
-    _BrnKeysPSSE = list(_BrnKeys)
-    for key in BrnKeys:
-        if key in ValidPSSEKeys and key not in _BrnKeysPSSE:
+    _BrnKeysPSSE = []
+    for key in _BrnKeys + BrnKeys:
+        if key in ValidPSSEKeys and key not in _BrnKeysPSSE and not (key in BrnStaticKeys and key in ValidBSPSSEPyKeys):
             _BrnKeysPSSE.append(key)
     
 
 
     if DebugPrint:
         bsprint(f"[DEBUG] Fetching PSSE data for keys: {_BrnKeysPSSE}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-
 
-    # Ensure no duplicate columns are fetched from PSSE if BSPSSEPyBrn is provided
-    if BSPSSEPyBrn is not None and not BSPSSEPyBrn.empty:
-        # Remove overlapping keys from the PSSE fetch list
-        ValidBSPSSEPyKeys = [key for key in ValidBSPSSEPyKeys if key not in _BrnKeysPSSE]
 
+    # No duplicate columns: ValidBSPSSEPyKeys only holds the identification keys (not fetched from PSSE above) and the
+    # columns that PSSE does not have
     if DebugPrint:
         bsprint(f"[DEBUG] Adjusted BSPSSEPy keys to fetch: {ValidBSPSSEPyKeys}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
-    # Fetch PSSE data for the required keys
-    PSSEData = {}
-    for PSSEKey in _BrnKeysPSSE:
-        PSSEData[PSSEKey] = await GetBrnInfoPSSE(PSSEKey, DebugPrint=DebugPrint,app=app)
+    # Fetch PSSE data for the required keys (one PSSE call per data type)
+    PSSEData = GetBrnInfoPSSEBatch(_BrnKeysPSSE, DebugPrint=DebugPrint, app=app) if _BrnKeysPSSE else {}
+
+    # Row position of the branch selected by name (None if no name is given, or if it is unknown or duplicated)
+    BranchPosition = None
+    if BranchName:
+        BranchNames = BSPSSEPyBrn["BRANCHNAME"].to_numpy() if "BRANCHNAME" in ValidBSPSSEPyKeys else PSSEData.get("BRANCHNAME")
+        if BranchNames is not None:
+            BranchPosition = GetBrnNamePosition(BranchName, BranchNames)
+            # The position map is built once per case: make sure this row holds the branch
+            if BranchPosition is not None and (BranchPosition >= len(BranchNames) or BranchNames[BranchPosition] != BranchName):
+                BranchPosition = None
+
+    if BranchPosition is not None:
+        # Single branch selected by name: only its row is built
+        Rows = [BranchPosition]
+        PSSEDataDF = pd.DataFrame(
+            {PSSEKey: Values if Values is None else [Values[BranchPosition]] for PSSEKey, Values in PSSEData.items()},
+            index=BSPSSEPyBrn.index[Rows] if UseBSPSSEPyBrn else Rows,
+        )
+        if UseBSPSSEPyBrn:
+            ValidBSPSSEPyBrn = BSPSSEPyBrn.iloc[Rows][ValidBSPSSEPyKeys]
+    else:
+        # PSSE data as column arrays (numeric data converted once, without per-element boxing), wrapped by the DataFrame
+        # without another copy
+        PSSEDataDF = pd.DataFrame(
+            {PSSEKey: Values if Values is None else np.asarray(Values) for PSSEKey, Values in PSSEData.items()},
+            copy=False,
+        )
+        if UseBSPSSEPyBrn:
+            ValidBSPSSEPyBrn = BSPSSEPyBrn[ValidBSPSSEPyKeys]
 
     # Combine PSSEData and BSPSSEPyBrn (if provided) into a single DataFrame
-    if BSPSSEPyBrn is not None and not BSPSSEPyBrn.empty:
-        ValidBSPSSEPyBrn = BSPSSEPyBrn[ValidBSPSSEPyKeys]
-        PSSEDataDF = pd.DataFrame(PSSEData)
-        CombinedData = pd.concat([PSSEDataDF, ValidBSPSSEPyBrn], axis=1)
+    if UseBSPSSEPyBrn:
+        if PSSEData:
+            CombinedData = pd.concat([PSSEDataDF, ValidBSPSSEPyBrn], axis=1)
+        else:
+            CombinedData = ValidBSPSSEPyBrn
     else:
-        CombinedData = pd.DataFrame(PSSEData)
+        CombinedData = PSSEDataDF
 
     if DebugPrint:
         bsprint(f"[DEBUG] Combined Data:\n{CombinedData}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
     
 
     # Filter CombinedData based on BranchName, FromBus, and ToBus
-    if BranchName:
-        CombinedData = CombinedData[CombinedData["BRANCHNAME"].str.strip() == BranchName]
+    if BranchPosition is not None:
+        pass  # Already reduced to the row of the branch
+    elif BranchName:
+        # Unknown or duplicated branch name: scan the names (branch names from PSSE are already stripped)
+        CombinedData = CombinedData[CombinedData["BRANCHNAME"] == BranchName]
     elif FromBus and ToBus:
-        if isinstance(FromBus, (int, float)):
-            FromBusKey = "FROMNUMBER"
-        else:
-            FromBusKey = "FROMNAME"
-        if isinstance(ToBus, (int, float)):
-            ToBusKey = "TONUMBER"
-        else:
-            ToBusKey = "TONAME"
-
+        # FromBusKey/ToBusKey were resolved with the input normalization above
         CombinedData = CombinedData[
             (CombinedData[FromBusKey] == FromBus) & 
             (CombinedData[ToBusKey] == ToBus)
@@ -167,7 +293,6 @@ async def GetBrnInfo(BrnKeys,  # The key(s) for the required information of the
 
     if DebugPrint:
         bsprint(f"[DEBUG] Filtered Data:\n{CombinedData}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
     # Handle cases based on the number of BrnKeys
     if len(BrnKeys) == 1:
@@ -178,25 +303,47 @@ async def GetBrnInfo(BrnKeys,  # The key(s) for the required information of the
 
 
 
+def GetBrnInfoBatch(BrnKeys, BranchNames, BSPSSEPyBrn=None, DebugPrint=False, app=None):
+    """
+    Retrieves information about several branches, selected by name, in one pass.
+
+    Arguments:
+        BrnKeys (str or list of str): The key(s) for the required information (same keys as GetBrnInfo).
+        BranchNames (list of str): Names of the branches to select.
+        BSPSSEPyBrn (pd.DataFrame, optional): The BSPSSEPyBrn DataFrame containing branch data. Defaults to None.
+        DebugPrint (bool, optional): Enable detailed debug output. Defaults to False.
+
+    Returns:
+        pd.DataFrame: Rows of the selected branches (in the PSSE branch order) with the requested keys and BRANCHNAME.
+
+    Notes:
+        - The data of all branches is fetched once (see GetBrnInfoSync) and the rows are selected with a single
+          np.isin pass, instead of one GetBrnInfo call (and PSSE fetch) per branch.
+    """
+    if isinstance(BrnKeys, str):
+        BrnKeys = [BrnKeys]
+    BrnKeys = [key.strip() for key in BrnKeys]
+    if "BRANCHNAME" not in BrnKeys:
+        BrnKeys.append("BRANCHNAME")
+
+    AllBranches = GetBrnInfoSync(BrnKeys, BSPSSEPyBrn=BSPSSEPyBrn, DebugPrint=DebugPrint, app=app)
+    BranchNames = np.asarray([str(BranchName).strip() for BranchName in BranchNames], dtype=object)
+    return AllBranches[np.isin(AllBranches["BRANCHNAME"].to_numpy(dtype=object), BranchNames)]
+
+
+
 async def GetBrnInfoPSSE(abrnString,  # Requested Info string - Check available strings in BrnInfoDic
                   BranchEntry=1,  # 1 entry for each branch, 2 --> two-way entry (each branch in both directions)
                   DebugPrint=False,  # Print debug information
                   app=None):
     """
-    This function returns the requested information about the branch of interest.
-    If no branch is specified, it will return the information about all branches.
+    This function returns the requested information about all branches.
 
     Arguments:
         abrnString: str
             Requested Info string - Check available strings in BrnInfoDic.
         BranchEntry: int
             1 entry for each branch, 2 --> two-way entry (each branch in both directions).
-        # BranchName: str
-        #     Branch Name (optional).
-        # FromBus: str or int
-        #     From Bus Number or Name (optional).
-        # ToBus: str or int
-        #     To Bus Number or Name (optional).
         DebugPrint: bool
             Print debug information (default = False).
 
@@ -205,104 +352,206 @@ async def GetBrnInfoPSSE(abrnString,  # Requested Info string - Check available
             A list of the requested information if found, otherwise None.
 
     Notes:
-        # - If no branch is specified, information about all branches is returned.
-        # - To select a branch, use either BranchName or (FromBus and ToBus). If multiple branches
-        #   connect the two buses, use the branch name.
+        - Single-string form of GetBrnInfoPSSEBatch.
+    """
+    BrnData = GetBrnInfoPSSEBatch([abrnString], BranchEntry=BranchEntry, DebugPrint=DebugPrint, app=app)
+    return BrnData[abrnString]
+
+
+
+def GetBrnInfoPSSEBatch(abrnStrings,  # Requested Info strings - Check available strings in BrnInfoDic
+                  BranchEntry=1,  # 1 entry for each branch, 2 --> two-way entry (each branch in both directions)
+                  DebugPrint=False,  # Print debug information
+                  app=None):
+    """
+    This function returns the requested information about all branches for several info strings at once.
+
+    The data type of the strings is looked up once (one psspy.abrntypes call for all new strings, kept in
+    BrnInfoPSSETypes), then the strings of the same type are fetched together with one
+    psspy.abrnint/abrnreal/abrnchar/abrncplx call per type.
+
+    Arguments:
+        abrnStrings: list of str
+            Requested Info strings - Check available strings in BrnInfoDic.
+        BranchEntry: int
+            1 entry for each branch, 2 --> two-way entry (each branch in both directions).
+        DebugPrint: bool
+            Print debug information (default = False).
+
+    Returns:
+        dict:
+            abrnString --> list of the requested information (None if it could not be retrieved), in the order of abrnStrings.
     """
+    # Debug messages are only built when they are shown
+    DebugPrint = DebugEnabled(DebugPrint, app)
 
     if DebugPrint:
-        bsprint(f"[DEBUG] Requested branch information for abrnString: '{abrnString}'",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        bsprint(f"[DEBUG] BranchEntry: {BranchEntry}",app=app) #, BranchName: {BranchName}, FromBus: {FromBus}, ToBus: {ToBus}")
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-
-    # Check if abrnString exists in BrnInfoDic
-    if abrnString not in BrnInfoDic:
-        bsprint(f"[ERROR] Invalid abrnString '{abrnString}'. Check BrnInfoDic for valid options.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return None
+        bsprint(f"[DEBUG] Requested branch information for abrnStrings: {abrnStrings}",app=app)
+        bsprint(f"[DEBUG] BranchEntry: {BranchEntry}",app=app)
+
+    BrnData = dict.fromkeys(abrnStrings)
+    MissingStrings = []
+    for abrnString in BrnData:
+        # Check if abrnString exists in BrnInfoDic
+        if abrnString not in BrnInfoDic:
+            bsprint(f"[ERROR] Invalid abrnString '{abrnString}'. Check BrnInfoDic for valid options.",app=app)
+        # Reuse the data fetched earlier if the branch data in PSSE has not changed since
+        elif (abrnString, BranchEntry) in BrnInfoPSSECache:
+            BrnData[abrnString] = BrnInfoPSSECache[(abrnString, BranchEntry)]
+        else:
+            MissingStrings.append(abrnString)
+
+    if not MissingStrings:
+        return BrnData
 
-    # Determine subsystem and entry flag
-    abrnSID = -1  # Assume entire system unless specified
-    abrnFlag = 2  # Default flag for all branches
+    # Fetch the data type of the requested strings not looked up yet
+    UntypedStrings = [abrnString for abrnString in MissingStrings if abrnString not in BrnInfoPSSETypes]
+    if UntypedStrings:
+        ierr, dataTypes = psspy.abrntypes(UntypedStrings)
+        if ierr != 0:
+            bsprint(f"[ERROR] Failed to fetch data type for abrnStrings {UntypedStrings}. PSSE error code: {ierr}",app=app)
+            return BrnData
+        BrnInfoPSSETypes.update(zip(UntypedStrings, dataTypes))
+
+    # Group the strings by data type
+    StringsByType = {}
+    for abrnString in MissingStrings:
+        StringsByType.setdefault(BrnInfoPSSETypes[abrnString], []).append(abrnString)
 
-    # Set up the query parameters
+    # Set up the query parameters (entire system, all branches)
     parameters = {
-        'sid': abrnSID,
-        'flag': abrnFlag,
+        'sid': -1,
+        'flag': 2,
         'entry': BranchEntry,
-        'string': [abrnString]
     }
 
-    # # Filter branches based on provided parameters
-    # if BranchName:
-    #     parameters['BRANCHNAME'] = BranchName
-    #     if DebugPrint:
-    #         bsprint(f"[DEBUG] Filtering branches by BranchName: {BranchName}")
-    # elif FromBus and ToBus:
-    #     parameters['FROMBUS'] = FromBus
-    #     parameters['TO'] = ToBus
-    #     if DebugPrint:
-    #         bsprint(f"[DEBUG] Filtering branches by FromBus: {FromBus} and ToBus: {ToBus}")
-
-    # Fetch the data type for the requested string
-    ierr, dataType = psspy.abrntypes([abrnString])
-    if ierr != 0:
-        bsprint(f"[ERROR] Failed to fetch data type for abrnString '{abrnString}'. PSSE error code: {ierr}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return None
-
     # Retrieve data based on the type
-    try:
-        if dataType[0] == 'I':  # Integer data
-            ierr, data = psspy.abrnint(**parameters)
-        elif dataType[0] == 'R':  # Real data
-            ierr, data = psspy.abrnreal(**parameters)
-        elif dataType[0] == 'C':  # Character data
-            ierr, data = psspy.abrnchar(**parameters)
-        elif dataType[0] == 'X':  # Complex data
-            ierr, data = psspy.abrncplx(**parameters)
-        else:
-            bsprint(f"[ERROR] Unsupported data type '{dataType[0]}' for abrnString '{abrnString}'.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            return None
+    for dataType, TypeStrings in StringsByType.items():
+        abrnFunction = BrnInfoPSSEFunctions.get(dataType)
+        if abrnFunction is None:
+            bsprint(f"[ERROR] Unsupported data type '{dataType}' for abrnStrings {TypeStrings}.",app=app)
+            continue
 
-        
-        # Check if data is a list containing a single nested list
-        if isinstance(data, list) and len(data) == 1 and isinstance(data[0], list):
-            data = data[0]  # Flatten the list
+        try:
+            ierr, data = abrnFunction(string=TypeStrings, **parameters)
+        except Exception as e:
+            bsprint(f"[ERROR] Exception occurred while retrieving data: {e}",app=app)
+            continue
 
-        # Check if data is a list
-        if isinstance(data, list):
-            # Check if the list contains strings
-            if all(isinstance(item, str) for item in data):
-                # Strip whitespace from each string in the list
-                data = [item.strip() for item in data]
+        if ierr != 0:
+            bsprint(f"[ERROR] Failed to retrieve data for abrnStrings {TypeStrings}. PSSE error code: {ierr}",app=app)
+            continue
 
+        # One list of values per requested string
+        for abrnString, Values in zip(TypeStrings, data):
+            # Strip whitespace from character data
+            if all(isinstance(item, str) for item in Values):
+                Values = [item.strip() for item in Values]
 
-        if ierr != 0:
-            bsprint(f"[ERROR] Failed to retrieve data for abrnString '{abrnString}'. PSSE error code: {ierr}",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            return None
+            BrnInfoPSSECache[(abrnString, BranchEntry)] = Values
+            BrnData[abrnString] = Values
 
-        if DebugPrint:
-            bsprint(f"[DEBUG] Successfully retrieved data for '{abrnString}': {data[0]}",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return data
+            if DebugPrint:
+                bsprint(f"[DEBUG] Successfully retrieved data for '{abrnString}': {Values[0] if Values else Values}",app=app)
 
-    except Exception as e:
-        bsprint(f"[ERROR] Exception occurred while retrieving data: {e}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return None
+    return BrnData
 
     
 
 
 
+def FindBrnRow(BSPSSEPyBrn, BranchFromBus, BranchToBus, BranchID):
+    """
+    Finds the row of a branch in BSPSSEPyBrn from its bus numbers and circuit ID (single pass, see FindBranchRow).
+
+    Arguments:
+        BSPSSEPyBrn: pd.DataFrame
+            The pandas DataFrame containing BSPSSEPy branch data.
+        BranchFromBus, BranchToBus: int
+            The "from" and "to" bus numbers of the branch.
+        BranchID: str
+            The circuit ID of the branch.
+
+    Returns:
+        int or None:
+            Row position of the branch in BSPSSEPyBrn, or None if it is not found.
+    """
+    IDs = BSPSSEPyBrn["ID"]
+    if isinstance(IDs.dtype, pd.CategoricalDtype):
+        # Compare the category codes (the ID is not in the categories --> no branch has it)
+        if BranchID not in IDs.cat.categories:
+            return None
+        IDCodes = IDs.cat.codes.to_numpy()
+        IDCode = IDs.cat.categories.get_loc(BranchID)
+    else:
+        IDCodes = (IDs == BranchID).to_numpy(dtype=np.int8)
+        IDCode = 1
+
+    Position = FindBranchRow(
+        BSPSSEPyBrn["FROMNUMBER"].to_numpy(dtype=np.int64),
+        BSPSSEPyBrn["TONUMBER"].to_numpy(dtype=np.int64),
+        IDCodes, BranchFromBus, BranchToBus, IDCode,
+    )
+    return None if Position < 0 else int(Position)
+
+
+
+def SetBrnActionRow(BSPSSEPyBrn, BranchPosition, Values):
+    """
+    Writes the result of a branch action to one row of BSPSSEPyBrn, one scalar (.iat) write per column.
+
+    Arguments:
+        BSPSSEPyBrn: pd.DataFrame
+            The pandas DataFrame containing BSPSSEPy branch data.
+        BranchPosition: int
+            Row position of the branch (see FindBrnRow).
+        Values: tuple
+            New values of the BrnActionColumns (same order).
+    """
+    Columns = BSPSSEPyBrn.columns
+    for Column, Value in zip(BrnActionColumns, Values):
+        BSPSSEPyBrn.iat[BranchPosition, Columns.get_loc(Column)] = Value
+
+
+
+def VerifyBrnStatus(BranchFromBus, BranchToBus, BranchID, BranchName, ExpectedStatus, app=None):
+    """
+    Reads the status of one branch from PSSE and reports it if it differs from the expected one (debug check).
+
+    Arguments:
+        BranchFromBus, BranchToBus: int
+            The "from" and "to" bus numbers of the branch.
+        BranchID: str
+            The circuit ID of the branch.
+        BranchName: str
+            The name of the branch (for the messages).
+        ExpectedStatus: int
+            Status the branch should have (1 --> in service, 0 --> out of service).
+    """
+    ierr, Status = psspy.brnint(BranchFromBus, BranchToBus, BranchID, 'STATUS')
+    if ierr != 0:
+        bsprint(f"[DEBUG] Could not read the status of branch '{BranchName}'. PSSE error code: {ierr}",app=app)
+    elif Status != ExpectedStatus:
+        bsprint(f"[DEBUG] Branch '{BranchName}' has status {Status} in PSSE (expected {ExpectedStatus}).",app=app)
+    else:
+        bsprint(f"[DEBUG] Branch '{BranchName}' status in PSSE: {Status}",app=app)
+
+
+
 async def BrnTrip(t, BSPSSEPyBrn, BranchID=None, BranchName=None, BranchFromBus=None, BranchToBus=None, DebugPrint=False,app=None):
     """
     Trips a branch based on its ID, name, or bus connection and updates extended info columns.
 
+    Async form of BrnTripSync (same arguments and return value), used through the BSPSSEPy functions dictionary.
+    """
+    return BrnTripSync(t, BSPSSEPyBrn, BranchID=BranchID, BranchName=BranchName, BranchFromBus=BranchFromBus, BranchToBus=BranchToBus, DebugPrint=DebugPrint, app=app)
+
+
+
+def BrnTripSync(t, BSPSSEPyBrn, BranchID=None, BranchName=None, BranchFromBus=None, BranchToBus=None, DebugPrint=False,app=None):
+    """
+    Trips a branch based on its ID, name, or bus connection and updates extended info columns.
+
     Arguments:
         t: float
             Current simulation time.
@@ -323,6 +572,9 @@ async def BrnTrip(t, BSPSSEPyBrn, BranchID=None, BranchName=None, BranchFromBus=
         int:
             ierr: The status of the action applied (ierr = 0 --> success!).
     """
+    # Debug messages are only built when they are shown
+    DebugPrint = DebugEnabled(DebugPrint, app)
+
     # Initial debug message
     if DebugPrint:
         bsprint(f"[DEBUG] BranchTrip called with inputs:\n"
@@ -331,11 +583,10 @@ async def BrnTrip(t, BSPSSEPyBrn, BranchID=None, BranchName=None, BranchFromBus=
               f"  FromBus: {BranchFromBus}\n"
               f"  ToBus: {BranchToBus}\n"
               f"  Simulation Time: {t}s\n",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
     # Resolve BranchName if only bus info is provided
     if not BranchName and (BranchFromBus and BranchToBus):
-        BranchName = await GetBrnInfo(
+        BranchName = GetBrnInfoSync(
             BrnKeys=["BRANCHNAME"],
             FromBus=BranchFromBus,
             ToBus=BranchToBus,
@@ -345,10 +596,9 @@ async def BrnTrip(t, BSPSSEPyBrn, BranchID=None, BranchName=None, BranchFromBus=
         )
         if not BranchName:
             bsprint(f"[ERROR] Could not identify branch between buses {BranchFromBus} and {BranchToBus}.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
             return None
     # Fetch branch details
-    BranchRow = await GetBrnInfo(
+    BranchRow = GetBrnInfoSync(
         BrnKeys=["FROMNUMBER", "TONUMBER", "ID", "STATUS", "BRANCHNAME"],
         BranchName=BranchName,
         BSPSSEPyBrn=BSPSSEPyBrn,
@@ -359,15 +609,40 @@ async def BrnTrip(t, BSPSSEPyBrn, BranchID=None, BranchName=None, BranchFromBus=
     if BranchRow is None or len(BranchRow) == 0:
         bsprint(f"[ERROR] Branch not found for ID={BranchID}, Name={BranchName}, "
               f"FromBus={BranchFromBus}, ToBus={BranchToBus}.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
         return None
 
+    # Trip the branch from its row (first row read once as a plain tuple)
+    return BrnTripRow(t, BSPSSEPyBrn, next(BranchRow.itertuples(index=False)), DebugPrint=DebugPrint, app=app)
+
+
+def BrnTripRow(t, BSPSSEPyBrn, Row, DebugPrint=False, app=None):
+    """
+    Trips a branch already resolved to its row and updates extended info columns (second half of BrnTripSync).
+
+    Arguments:
+        t: float
+            Current simulation time.
+        BSPSSEPyBrn: pd.DataFrame
+            The pandas DataFrame containing BSPSSEPy branch data.
+        Row: namedtuple
+            Branch row with the FROMNUMBER, TONUMBER, ID, STATUS and BRANCHNAME fields, e.g., from
+            GetBrnInfoBatch(...).itertuples(index=False).
+        DebugPrint: bool
+            Enable detailed debug output (default = False).
+
+    Returns:
+        int:
+            ierr: The status of the action applied (ierr = 0 --> success!).
+    """
+    # Debug messages are only built when they are shown
+    DebugPrint = DebugEnabled(DebugPrint, app)
+
     # Extract branch information
-    BranchFromBus = BranchRow["FROMNUMBER"].iloc[0]
-    BranchToBus = BranchRow["TONUMBER"].iloc[0]
-    BranchID = BranchRow["ID"].iloc[0]
-    BranchName = BranchRow["BRANCHNAME"].iloc[0]
-    BranchStatus = int(BranchRow["STATUS"].iloc[0])
+    BranchFromBus = int(Row.FROMNUMBER)
+    BranchToBus = int(Row.TONUMBER)
+    BranchID = Row.ID
+    BranchName = Row.BRANCHNAME
+    BranchStatus = int(Row.STATUS)
 
     # Debug message with resolved values
     if DebugPrint:
@@ -377,54 +652,44 @@ async def BrnTrip(t, BSPSSEPyBrn, BranchID=None, BranchName=None, BranchFromBus=
               f"  FromBus: {BranchFromBus}\n"
               f"  ToBus: {BranchToBus}\n"
               f"  Status: {'Closed' if BranchStatus == 1 else 'Tripped'}\n",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
     # Check if the branch is already tripped
     if BranchStatus != 1:
         bsprint(f"[INFO] Branch '{BranchName}' is already tripped.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
         return 0
 
     # Attempt to trip the branch
     try:
         if DebugPrint:
             bsprint(f"[DEBUG] Attempting to trip branch '{BranchName}' between buses {BranchFromBus} and {BranchToBus}.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
         ierr = psspy.dist_branch_trip(BranchFromBus, BranchToBus, BranchID)
+        ClearBrnInfoPSSECache()
 
         if ierr != 0:
             bsprint(f"[ERROR] Failed to trip branch '{BranchName}'. PSSE error code: {ierr}",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
             return ierr
 
-        # Ensure proper matching for FromBus and ToBus in BSPSSEPyBrn
-        FromBusCondition = BSPSSEPyBrn["FROMNUMBER"].apply(str) == str(BranchFromBus)
-        ToBusCondition = BSPSSEPyBrn["TONUMBER"].apply(str) == str(BranchToBus)
-        IDCondition = BSPSSEPyBrn["ID"] == BranchID
-
-        NewStatus = await GetBrnInfo("STATUS", BranchName=BranchName, DebugPrint=DebugPrint, app=app)
+        # dist_branch_trip succeeded: the branch is now out of service (no system-wide STATUS fetch needed)
+        NewStatus = 0
+        if DebugPrint:
+            VerifyBrnStatus(BranchFromBus, BranchToBus, BranchID, BranchName, NewStatus, app=app)
 
-        if not(BSPSSEPyBrn is None or BSPSSEPyBrn.empty):
+        BranchPosition = None if BSPSSEPyBrn is None or BSPSSEPyBrn.empty else FindBrnRow(BSPSSEPyBrn, BranchFromBus, BranchToBus, BranchID)
+        if BranchPosition is not None:
             # Update the BSPSSEPyBrn DataFrame
-            BSPSSEPyBrn.loc[
-                FromBusCondition & ToBusCondition & IDCondition,
-                ["BSPSSEPyStatus", "BSPSSEPyLastAction", "BSPSSEPyLastActionTime", "BSPSSEPySimulationNotes", "STATUS"]
-            ] = ["Tripped", "Trip", t, "Branch successfully tripped.", NewStatus]
+            SetBrnActionRow(BSPSSEPyBrn, BranchPosition, ("Tripped", "Trip", t, "Branch successfully tripped.", NewStatus))
 
         if DebugPrint:
             bsprint(f"[SUCCESS] Successfully tripped branch '{BranchName}'. Updated BSPSSEPyBrn DataFrame.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
         return ierr
 
     except KeyError as e:
         bsprint(f"[ERROR] Missing key during BranchTrip operation: {e}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
         return None
     except Exception as e:
         bsprint(f"[ERROR] Unexpected error during BranchTrip: {e}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
         return None
 
 
@@ -452,6 +717,9 @@ async def BrnClose(t, BSPSSEPyBrn=None, BSPSSEPyBus=None, BranchID=None, BranchN
         int:
             ierr: The status of the action applied (ierr = 0 --> success!).
     """
+    # Debug messages are only built when they are shown
+    DebugPrint = DebugEnabled(DebugPrint, app)
+
     if DebugPrint:
         bsprint(f"[DEBUG] BranchClose called with inputs:\n"
               f"  BranchID: {BranchID}\n"
@@ -459,11 +727,10 @@ async def BrnClose(t, BSPSSEPyBrn=None, BSPSSEPyBus=None, BranchID=None, BranchN
               f"  FromBus: {BranchFromBus}\n"
               f"  ToBus: {BranchToBus}\n"
               f"  Simulation Time: {t}s\n",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
     # Resolve BranchName if only bus info is provided
     if not BranchName and (BranchFromBus and BranchToBus):
-        BranchName = await GetBrnInfo(
+        BranchName = GetBrnInfoSync(
             BrnKeys=["BRANCHNAME"],
             FromBus=BranchFromBus,
             ToBus=BranchToBus,
@@ -473,11 +740,10 @@ async def BrnClose(t, BSPSSEPyBrn=None, BSPSSEPyBus=None, BranchID=None, BranchN
         )
         if not BranchName:
             bsprint(f"[ERROR] Could not identify branch between buses {BranchFromBus} and {BranchToBus}.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
             return None
 
     # Fetch branch details
-    BranchRow = await GetBrnInfo(
+    BranchRow = GetBrnInfoSync(
         BrnKeys=["FROMNUMBER", "TONUMBER", "ID", "STATUS", "BRANCHNAME", "GenControlled"],
         BranchName=BranchName,
         BSPSSEPyBrn=BSPSSEPyBrn,
@@ -488,16 +754,16 @@ async def BrnClose(t, BSPSSEPyBrn=None, BSPSSEPyBus=None, BranchID=None, BranchN
     if BranchRow is None or len(BranchRow) == 0:
         bsprint(f"[ERROR] Branch not found for ID={BranchID}, Name={BranchName}, "
               f"FromBus={BranchFromBus}, ToBus={BranchToBus}.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
         return None
 
-    # Extract branch information
-    BranchFromBus = int(BranchRow["FROMNUMBER"].iloc[0])
-    BranchToBus = int(BranchRow["TONUMBER"].iloc[0])
-    BranchID = BranchRow["ID"].iloc[0]
-    BranchName = BranchRow["BRANCHNAME"].iloc[0]
-    BranchStatus = int(BranchRow["STATUS"].iloc[0])
-    BrnGenControlled = BranchRow["GenControlled"].values[0]
+    # Extract branch information (first row read once as a plain tuple)
+    Row = next(BranchRow.itertuples(index=False))
+    BranchFromBus = int(Row.FROMNUMBER)
+    BranchToBus = int(Row.TONUMBER)
+    BranchID = Row.ID
+    BranchName = Row.BRANCHNAME
+    BranchStatus = int(Row.STATUS)
+    BrnGenControlled = Row.GenControlled
 
 
     if DebugPrint:
@@ -508,12 +774,10 @@ async def BrnClose(t, BSPSSEPyBrn=None, BSPSSEPyBus=None, BranchID=None, BranchN
               f"  ToBus: {BranchToBus}\n"
               f"  Status: {'Closed' if BranchStatus == 1 else 'Tripped'}\n"
               f"  GenControlled: {BrnGenControlled}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
     # Check if the branch is already closed
     if BranchStatus == 1:
         bsprint(f"[INFO] Branch '{BranchName}' is already closed.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
         return 0
 
     # Ensure both buses are operational
@@ -525,66 +789,53 @@ async def BrnClose(t, BSPSSEPyBrn=None, BSPSSEPyBus=None, BranchID=None, BranchN
             if FromBusTYPE == 4:  # Tripped
                 if DebugPrint:
                     bsprint(f"[DEBUG] FromBus {BranchFromBus} is tripped. Attempting to close it.",app=app)
-                    await asyncio.sleep(app.bsprintasynciotime if app else 0)
                 ierr = await BusClose(t, BusNumber=BranchFromBus, BSPSSEPyBus=BSPSSEPyBus, DebugPrint=DebugPrint,app=app)
                 if ierr != 0:
                     bsprint(f"[ERROR] Failed to close FromBus {BranchToBus}. Aborting Trn close.",app=app)
-                    await asyncio.sleep(app.bsprintasynciotime if app else 0)
                     return ierr
 
             if ToBusTYPE == 4:  # Tripped
                 if DebugPrint:
                     bsprint(f"[DEBUG] ToBus {BranchToBus} is tripped. Attempting to close it.",app=app)
-                    await asyncio.sleep(app.bsprintasynciotime if app else 0)
                 ierr = await BusClose(t, BusNumber=BranchToBus, BSPSSEPyBus = BSPSSEPyBus, DebugPrint=DebugPrint,app=app)
                 if ierr != 0:
                     bsprint(f"[ERROR] Failed to close ToBus {BranchToBus}. Aborting Trn close.",app=app)
-                    await asyncio.sleep(app.bsprintasynciotime if app else 0)
                     return ierr
 
 
             if DebugPrint:
                 bsprint(f"[DEBUG] Attempting to close branch '{BranchName}' between buses {BranchFromBus} and {BranchToBus}.",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
             ierr = psspy.dist_branch_close(BranchFromBus, BranchToBus, BranchID)
+            ClearBrnInfoPSSECache()
 
             if ierr != 0:
                 bsprint(f"[ERROR] Failed to close branch '{BranchName}'. PSSE error code: {ierr}",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
                 return ierr
 
-            NewStatus = await GetBrnInfo("STATUS", BranchName=BranchName, DebugPrint=DebugPrint,app=app)
+            # dist_branch_close succeeded: the branch is now in service (no system-wide STATUS fetch needed)
+            NewStatus = 1
+            if DebugPrint:
+                VerifyBrnStatus(BranchFromBus, BranchToBus, BranchID, BranchName, NewStatus, app=app)
 
 
-            # Ensure proper matching for FromBus and ToBus in BSPSSEPyBrn
-            FromBusCondition = BSPSSEPyBrn["FROMNUMBER"].apply(str) == str(BranchFromBus)
-            ToBusCondition = BSPSSEPyBrn["TONUMBER"].apply(str) == str(BranchToBus)
-            IDCondition = BSPSSEPyBrn["ID"] == BranchID
-            
-            if not(BSPSSEPyBrn is None or BSPSSEPyBrn.empty):
+            BranchPosition = None if BSPSSEPyBrn is None or BSPSSEPyBrn.empty else FindBrnRow(BSPSSEPyBrn, BranchFromBus, BranchToBus, BranchID)
+            if BranchPosition is not None:
                 # Update the BSPSSEPyBrn DataFrame
-                BSPSSEPyBrn.loc[
-                    FromBusCondition & ToBusCondition & IDCondition,
-                    ["BSPSSEPyStatus", "BSPSSEPyLastAction", "BSPSSEPyLastActionTime", "BSPSSEPySimulationNotes", "STATUS"]
-                ] = ["Closed", "Close", t, "Branch successfully closed.", NewStatus]
+                SetBrnActionRow(BSPSSEPyBrn, BranchPosition, ("Closed", "Close", t, "Branch successfully closed.", NewStatus))
 
             if DebugPrint:
                 bsprint(f"[SUCCESS] Successfully closed branch '{BranchName}'. Updated BSPSSEPyBrn DataFrame.",app=app)
-                await asyncio.sleep(app.bsprintasynciotime if app else 0)
             return ierr
 
 
         except KeyError as e:
             bsprint(f"[ERROR] Missing key during BranchClose operation: {e}",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
             return None
         except Exception as e:
             bsprint(f"[ERROR] Unexpected error during BranchClose: {e}",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
             return None
         
     else:
         bsprint(f"[ERROR] This branch is tied to a generator. Don't attempt to close it manually. It can be controlled through GenEnable function to model generator phases.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
         return -999
\ No newline at end of file
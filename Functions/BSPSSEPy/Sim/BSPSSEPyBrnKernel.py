@@ -0,0 +1,46 @@
+# ===========================================================
+#   BSPSSEPy Application - Branch Lookup Kernel
+# ===========================================================
+#   This module holds the scan used to find the row of a branch
+#   (from bus, to bus, circuit ID) in the BSPSSEPyBrn columns in a
+#   single pass. It is compiled with Numba when Numba is
+#   installed; otherwise the same code runs as plain Python/NumPy.
+#
+#   Last Updated: BSPSSEPy Ver 0.4 (11 Feb 2025)
+#   Copyright (c) 2024-2025, Ilyas Farhat
+#   Contact: ilyas.farhat@outlook.com
+# ===========================================================
+
+import numpy as np
+from Functions.BSPSSEPy.BSPSSEPyNumba import njit
+
+
+@njit(cache=True)
+def FindBranchRow(FromNumbers, ToNumbers, IDCodes, FromBus, ToBus, IDCode):
+    """
+    Finds the row of a branch from its bus numbers and circuit ID.
+
+    Parameters:
+        FromNumbers (np.ndarray[int64]): "From" bus number of every branch.
+        ToNumbers (np.ndarray[int64]): "To" bus number of every branch.
+        IDCodes (np.ndarray[int]): Integer code of the circuit ID of every branch (e.g., category codes).
+        FromBus (int): "From" bus number of the branch.
+        ToBus (int): "To" bus number of the branch.
+        IDCode (int): Integer code of the circuit ID of the branch.
+
+    Returns:
+        int: Row position of the first matching branch, or -1 if there is none.
+    """
+    for i in range(FromNumbers.shape[0]):
+        if FromNumbers[i] == FromBus and ToNumbers[i] == ToBus and IDCodes[i] == IDCode:
+            return i
+    return -1
+
+
+def WarmUpBrnKernel():
+    """
+    Calls FindBranchRow once with empty arrays so that Numba compiles (or loads from its cache) the kernel
+    before the first branch action.
+    """
+    Empty = np.zeros(0, dtype=np.int64)
+    FindBranchRow(Empty, Empty, np.zeros(0, dtype=np.int8), 0, 0, 0)
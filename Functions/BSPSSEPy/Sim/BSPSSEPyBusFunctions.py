@@ -5,11 +5,16 @@
 #    - Handles cases for single/multiple keys and specific/all buses.
 #
 # 2. GetBusInfoPSSE: Fetches bus-related data directly from PSSE using the PSSE library.
+#    - GetBusInfoPSSEBatch fetches several keys at once (one PSSE call per data type); GetBusInfo uses it directly.
+#    - The data is cached until the bus data in PSSE may have changed (see ClearBusInfoPSSECache).
 #
 # 3. BusTrip: Trips a bus (sets its status in PSSE to 4) and updates the BSPSSEPyBus dataFrame.
 #
 # 4. BusClose: Resets a bus to its original type (restores the type from BSPSSEPyType in BSPSSEPyBus) and updates the BSPSSEPyBus dataFrame.
 #
+# BusTrip, BusClose and ChangeBusType are thin wrappers around BusAction, which holds the shared lookup, PSSE change and
+# BSPSSEPyBus update.
+#
 # This module ensures dynamic interaction with PSSE for real-time data, while allowing extended tracking and simulation-specific metadata updates through the BSPSSEPyBus dataFrame.
 #
 # Key Features:
@@ -28,12 +33,114 @@
 
 import psspy
 import pandas as pd
+import numpy as np
 from Functions.BSPSSEPy.BSPSSEPyDictionary import *
 from .BSPSSEPyDefaultVariables import *
 import numbers
 from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import bsprint
 import asyncio
 
+# Bus identification data: does not change during a run, so it is kept cached until a new case is loaded
+BusStaticKeys = ("NAME", "NUMBER")
+
+# Valid PSSE bus info strings (set once at import instead of a BusInfoDic view per call)
+BusInfoPSSEKeys = frozenset(BusInfoDic)
+
+# Data type of each bus info string (abusString --> 'I', 'R', 'C' or 'X'). The types never change, so all strings are
+# looked up with a single psspy.abustypes call (on first use: psspy cannot be queried before PSSE is initialized)
+BusInfoPSSETypes = {}
+
+# psspy function fetching the bus data of each data type (as returned by psspy.abustypes)
+BusInfoPSSEFunctions = {
+    'I': psspy.abusint,   # Integer data
+    'R': psspy.abusreal,  # Real data
+    'C': psspy.abuschar,  # Character data
+    'X': psspy.abuscplx,  # Complex data
+}
+
+# psspy single-bus function reading each bus info string that has one (busint: integer data, busdat: real data)
+BusInfoPSSESingleFunctions = {
+    'TYPE': psspy.busint,
+    'AREA': psspy.busint,
+    'ZONE': psspy.busint,
+    'OWNER': psspy.busint,
+    'BASE': psspy.busdat,
+    'PU': psspy.busdat,
+    'KV': psspy.busdat,
+    'ANGLE': psspy.busdat,
+    'ANGLED': psspy.busdat,
+}
+
+# Bus data already fetched from PSSE (abusString --> list), reused by GetBusInfoPSSE until the bus data in PSSE may
+# have changed (see ClearBusInfoPSSECache)
+BusInfoPSSECache = {}
+
+
+# BSPSSEPyBus columns updated by every bus action (BusTrip/BusClose/ChangeBusType)
+BusActionColumns = ("BSPSSEPyStatus", "BSPSSEPyLastAction", "BSPSSEPyLastActionTime", "BSPSSEPySimulationNotes", "TYPE")
+
+# Bus number --> row position in the PSSE bus data. The bus numbers, names and their order only change when a new case
+# is loaded
+BusNumberPositions = {}
+
+# Bus name --> row position in the PSSE bus data (None for names used by more than one bus)
+BusNamePositions = {}
+
+
+def ClearBusInfoPSSECache(NewCase=False):
+    """
+    Empties the cache of bus data fetched from PSSE.
+
+    Parameters:
+        NewCase (bool): Also forget the identification data (a new case was loaded in PSSE).
+
+    Notes:
+        - Must be called after every action that can change the bus data in PSSE: bus trip, close or type change,
+          simulation time step (psspy.run) and loading a new case.
+        - The identification data (BusStaticKeys) does not change within a case, so it is kept until NewCase.
+    """
+    if NewCase:
+        BusInfoPSSECache.clear()
+        BusNumberPositions.clear()
+        BusNamePositions.clear()
+        return
+
+    for abusString in [abusString for abusString in BusInfoPSSECache if abusString not in BusStaticKeys]:
+        del BusInfoPSSECache[abusString]
+
+
+def GetBusNumberPosition(BusNumber, BusNumbers):
+    """
+    Returns the row position of a bus in the PSSE bus data from its number (hash lookup instead of a column scan).
+
+    Parameters:
+        BusNumber (int): Bus Number.
+        BusNumbers (list of int): NUMBER data of all buses (used to build the position map on first use).
+
+    Returns:
+        int or None: Row position of the bus, or None if the number is unknown.
+    """
+    if not BusNumberPositions:
+        BusNumberPositions.update((Number, Position) for Position, Number in enumerate(BusNumbers))
+    return BusNumberPositions.get(BusNumber)
+
+
+def GetBusNamePosition(BusName, BusNames):
+    """
+    Returns the row position of a bus in the PSSE bus data from its name (hash lookup instead of a column scan).
+
+    Parameters:
+        BusName (str): Bus Name (stripped).
+        BusNames (list of str): NAME data of all buses (used to build the position map on first use).
+
+    Returns:
+        int or None: Row position of the bus, or None if the name is unknown or used by several buses.
+    """
+    if not BusNamePositions:
+        for Position, Name in enumerate(BusNames):
+            BusNamePositions[Name] = None if Name in BusNamePositions else Position
+    return BusNamePositions.get(BusName)
+
 
 async def GetBusInfo(BusKeys, # The key(s) for the required information of the bus
                Bus=None,    # Bus identifier --> could be BusName or BusNumber (optional)
@@ -73,7 +180,8 @@ async def GetBusInfo(BusKeys, # The key(s) for the required information of the b
     """
     if DebugPrint:
         bsprint(f"[DEBUG] Retrieving bus info for BusKeys: {BusKeys}, Bus: {Bus}, BusName: {BusName}, BusNumber: {BusNumber}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
 
         
     # Ensure BusKeys is a list
@@ -95,66 +203,126 @@ async def GetBusInfo(BusKeys, # The key(s) for the required information of the b
 
 
     # Separate PSSE and BSPSSEPyBus keys
-    ValidPSSEKeys = BusInfoDic.keys()
-    ValidBSPSSEPyKeys = [] if BSPSSEPyBus is None else BSPSSEPyBus.columns
+    ValidPSSEKeys = BusInfoPSSEKeys
+    UseBSPSSEPyBus = BSPSSEPyBus is not None and not BSPSSEPyBus.empty
+    ValidBSPSSEPyKeys = BSPSSEPyBus.columns if UseBSPSSEPyBus else []
 
 
-    # Add PSSE Keys needed for basic Bus operations
+    # Add PSSE Keys needed for basic Bus operations. Identification keys already in BSPSSEPyBus are not fetched from
+    # PSSE; the other (dynamic) keys, e.g., TYPE, always come from PSSE
     _BusKeys = ["NAME", "NUMBER"]
-    _BusKeysPSSE = list(_BusKeys)
-    for key in BusKeys:
-        if key in ValidPSSEKeys and key not in _BusKeysPSSE:
+    _BusKeysPSSE = []
+    for key in _BusKeys + BusKeys:
+        if key in ValidPSSEKeys and key not in _BusKeysPSSE and not (key in BusStaticKeys and key in ValidBSPSSEPyKeys):
             _BusKeysPSSE.append(key)
 
     if DebugPrint:
         bsprint(f"[DEBUG] Fetching PSSE data for keys: {_BusKeysPSSE}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-
-
-    # Ensure no duplicate columns are fetched from PSSE if BSPSSEPyBrn is provided
-    if BSPSSEPyBus is not None and not BSPSSEPyBus.empty:
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
+
+    # Single bus selected by name or number with PSSE keys only: the values are read at the position of the bus,
+    # without building the DataFrame of all buses
+    if (BusName or BusNumber) and all(key in ValidPSSEKeys for key in BusKeys):
+        BusNumbers = await GetBusInfoPSSE("NUMBER", DebugPrint=DebugPrint, app=app)
+        BusPosition = None
+        if BusNumbers is not None and BusName:
+            BusNames = await GetBusInfoPSSE("NAME", DebugPrint=DebugPrint, app=app)
+            BusPosition = None if BusNames is None else GetBusNamePosition(BusName, BusNames)
+            if BusPosition is not None and (BusPosition >= len(BusNames) or BusNames[BusPosition] != BusName):
+                BusPosition = None
+        elif BusNumbers is not None:
+            BusPosition = GetBusNumberPosition(BusNumber, BusNumbers)
+            if BusPosition is not None and (BusPosition >= len(BusNumbers) or BusNumbers[BusPosition] != BusNumber):
+                BusPosition = None
+        if BusPosition is not None:
+            BusValues = {}
+            for PSSEKey in BusKeys:
+                # Keys not fetched yet for all buses are read with the single-bus psspy API when it has them
+                Value = None
+                if PSSEKey not in BusInfoPSSECache and PSSEKey in BusInfoPSSESingleFunctions:
+                    Value = GetBusInfoPSSESingle(BusNumbers[BusPosition], PSSEKey)
+                if Value is None:
+                    Values = await GetBusInfoPSSE(PSSEKey, DebugPrint=DebugPrint, app=app)
+                    if Values is None:
+                        break
+                    Value = Values[BusPosition]
+                BusValues[PSSEKey] = Value
+            else:
+                if len(BusKeys) == 1:
+                    return BusValues[BusKeys[0]]
+                return pd.DataFrame({PSSEKey: [Value] for PSSEKey, Value in BusValues.items()}, index=[BusPosition])
+
+
+    # Ensure no duplicate columns are fetched from PSSE if BSPSSEPyBus is provided
+    if UseBSPSSEPyBus:
         # Remove overlapping keys from the PSSE fetch list
         ValidBSPSSEPyKeys = [key for key in ValidBSPSSEPyKeys if key not in _BusKeysPSSE]
 
     if DebugPrint:
         bsprint(f"[DEBUG] Adjusted BSPSSEPy keys to fetch: {ValidBSPSSEPyKeys}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-
-
-    # Fetch PSSE data for the required keys
-    PSSEdata = {}
-    for PSSEKey in _BusKeysPSSE:
-        PSSEdata[PSSEKey] = await GetBusInfoPSSE(PSSEKey, DebugPrint=DebugPrint,app=app)
-
-
-    # Combine PSSEdata and BSPSSEPyTrn (if provided) into a single dataFrame
-    if BSPSSEPyBus is not None and not BSPSSEPyBus.empty:
-        ValidBSPSSEPyTrn = BSPSSEPyBus[ValidBSPSSEPyKeys]
-        PSSEdataDF = pd.DataFrame(PSSEdata)
-        Combineddata = pd.concat([PSSEdataDF, ValidBSPSSEPyTrn], axis=1)
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
+
+
+    # Fetch PSSE data for the required keys (one PSSE call per data type)
+    PSSEdata = GetBusInfoPSSEBatch(_BusKeysPSSE, DebugPrint=DebugPrint, app=app) if _BusKeysPSSE else {}
+
+
+    # Row position of the bus selected by name or number (hash lookup; None if no bus is given, or if it is unknown or
+    # its name is used by several buses)
+    BusPosition = None
+    if BusName or BusNumber:
+        IDKey, IDValue = ("NAME", BusName) if BusName else ("NUMBER", BusNumber)
+        IDColumn = BSPSSEPyBus[IDKey].to_numpy() if IDKey in ValidBSPSSEPyKeys else PSSEdata.get(IDKey)
+        if IDColumn is not None:
+            BusPosition = (GetBusNamePosition if BusName else GetBusNumberPosition)(IDValue, IDColumn)
+            # The position maps follow the PSSE bus order: make sure this row holds the bus
+            if BusPosition is not None and (BusPosition >= len(IDColumn) or IDColumn[BusPosition] != IDValue):
+                BusPosition = None
+
+    # Combine PSSEdata and BSPSSEPyBus (if provided) into a single dataFrame, built once from one column dict (no
+    # intermediate dataFrame and concat)
+    if BusPosition is not None:
+        # Single bus: only its row is built
+        Rows = [BusPosition]
+        Columns = {PSSEKey: Values if Values is None else [Values[BusPosition]] for PSSEKey, Values in PSSEdata.items()}
+        if UseBSPSSEPyBus:
+            for key in ValidBSPSSEPyKeys:
+                Columns[key] = BSPSSEPyBus[key].iloc[Rows]
+        Combineddata = pd.DataFrame(Columns, index=BSPSSEPyBus.index[Rows] if UseBSPSSEPyBus else Rows)
+    elif UseBSPSSEPyBus:
+        Columns = dict(PSSEdata)
+        for key in ValidBSPSSEPyKeys:
+            Columns[key] = BSPSSEPyBus[key]
+        Combineddata = pd.DataFrame(Columns, index=BSPSSEPyBus.index)
     else:
         Combineddata = pd.DataFrame(PSSEdata)
 
     if DebugPrint:
         bsprint(f"[DEBUG] Combined data:\n{Combineddata}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
 
 
-    # Filter Combineddata based on TrnName, FromBus, and ToBus
-    if BusName:
-        Combineddata = Combineddata[Combineddata["NAME"].str.strip() == BusName]
+    # Filter Combineddata based on BusName or BusNumber (one vectorized compare; bus names from PSSE are already stripped)
+    if BusPosition is not None:
+        pass  # Already reduced to the row of the bus
+    elif BusName:
+        Combineddata = Combineddata.iloc[np.flatnonzero(Combineddata["NAME"].to_numpy() == BusName)]
     elif BusNumber:
-        Combineddata = Combineddata[(Combineddata["NUMBER"] == BusNumber)]
+        Combineddata = Combineddata.iloc[np.flatnonzero(Combineddata["NUMBER"].to_numpy() == BusNumber)]
     
     if DebugPrint:
         bsprint(f"[DEBUG] Filtered data:\n{Combineddata}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
 
 
     # Handle cases based on the number of BrnKeys
     if len(BusKeys) == 1:
         Key = BusKeys[0]
-        return Combineddata[Key].iloc[0] if len(Combineddata) == 1 else Combineddata[Key]
+        return Combineddata.iat[0, Combineddata.columns.get_loc(Key)] if len(Combineddata) == 1 else Combineddata[Key]
     else:
         return Combineddata[BusKeys]
 
@@ -172,166 +340,201 @@ async def GetBusInfoPSSE(abusString,  # Requested info string - Check available
 
     Returns:
         list or None: A list of the requested information if found, otherwise None.
+
+    Notes:
+        - Single-string form of GetBusInfoPSSEBatch.
+        - The returned list is shared with BusInfoPSSECache and must not be modified by the caller.
     """
-    if DebugPrint:
-        bsprint(f"[DEBUG] Requested bus information for abusString: '{abusString}'",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+    BusData = GetBusInfoPSSEBatch([abusString], DebugPrint=DebugPrint, app=app)
+    if DebugPrint and app:
+        await asyncio.sleep(app.bsprintasynciotime)
+    return BusData[abusString]
 
-    # Validate abusString
-    if abusString not in BusInfoDic:
-        bsprint(f"[ERROR] Invalid abusString '{abusString}'. Check BusInfoDic for valid options.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return None
 
-    try:
-        # Fetch data type for the key
-        ierr, datatype = psspy.abustypes([abusString])
-        if ierr != 0:
-            bsprint(f"[ERROR] Failed to fetch data type for abusString '{abusString}'. PSSE error code: {ierr}",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            return None
-
-        # Retrieve data based on type
-        if datatype[0] == 'I':
-            ierr, data = psspy.abusint(-1, 2, [abusString])
-        elif datatype[0] == 'R':
-            ierr, data = psspy.abusreal(-1, 2, [abusString])
-        elif datatype[0] == 'C':
-            ierr, data = psspy.abuschar(-1, 2, [abusString])
-        elif datatype[0] == 'X':
-            ierr, data = psspy.abuscplx(-1, 2, [abusString])
+def GetBusInfoPSSEBatch(abusStrings,  # Requested info strings - Check available strings in BusInfoDic
+                   DebugPrint=False,    # Print debug information
+                   app=None):
+    """
+    Retrieves specific bus information from PSSE for several info strings at once.
+
+    The strings not in BusInfoPSSECache are grouped by data type (BusInfoPSSETypes) and fetched with one
+    psspy.abusint/abusreal/abuschar/abuscplx call per type.
+
+    Parameters:
+        abusStrings (list of str): Requested information keys.
+        DebugPrint (bool, optional): Enable detailed debug output. Default is False.
+
+    Returns:
+        dict: abusString --> list of the requested information (None if it could not be retrieved), in the order of
+              abusStrings.
+
+    Notes:
+        - The returned lists are shared with BusInfoPSSECache and must not be modified by the caller.
+    """
+    if DebugPrint:
+        bsprint(f"[DEBUG] Requested bus information for abusStrings: {abusStrings}",app=app)
+
+    BusData = dict.fromkeys(abusStrings)
+    MissingStrings = []
+    for abusString in BusData:
+        # Reuse the data fetched earlier if the bus data in PSSE has not changed since (only valid strings are cached,
+        # so cached strings need no validation)
+        Values = BusInfoPSSECache.get(abusString)
+        if Values is not None:
+            BusData[abusString] = Values
+        # Validate abusString
+        elif abusString not in BusInfoPSSEKeys:
+            bsprint(f"[ERROR] Invalid abusString '{abusString}'. Check BusInfoDic for valid options.",app=app)
         else:
-            bsprint(f"[ERROR] Unsupported data type '{datatype[0]}' for abusString '{abusString}'.",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            return None
+            MissingStrings.append(abusString)
 
-        # Check if data is a list containing a single nested list
-        if isinstance(data, list) and len(data) == 1 and isinstance(data[0], list):
-            data = data[0]  # Flatten the list
+    if not MissingStrings:
+        return BusData
 
-        # Check if data is a list
-        if isinstance(data, list):
-            # Check if the list contains strings
-            if all(isinstance(item, str) for item in data):
-                # Strip whitespace from each string in the list
-                data = [item.strip() for item in data]
+    # Fetch the data type of all the keys at once on first use
+    if not BusInfoPSSETypes:
+        ierr, datatype = psspy.abustypes(list(BusInfoDic))
+        if ierr == 0:
+            BusInfoPSSETypes.update(zip(BusInfoDic, datatype))
 
+    # Fetch the data type of the keys the bulk lookup did not give (looked up only once)
+    UntypedStrings = [abusString for abusString in MissingStrings if abusString not in BusInfoPSSETypes]
+    if UntypedStrings:
+        ierr, datatype = psspy.abustypes(UntypedStrings)
+        if ierr != 0:
+            bsprint(f"[ERROR] Failed to fetch data type for abusStrings {UntypedStrings}. PSSE error code: {ierr}",app=app)
+            return BusData
+        BusInfoPSSETypes.update(zip(UntypedStrings, datatype))
+
+    # Group the strings by data type
+    StringsByType = {}
+    for abusString in MissingStrings:
+        StringsByType.setdefault(BusInfoPSSETypes[abusString], []).append(abusString)
+
+    # Retrieve data based on type (entire system, all buses)
+    for datatype, TypeStrings in StringsByType.items():
+        abusFunction = BusInfoPSSEFunctions.get(datatype)
+        if abusFunction is None:
+            bsprint(f"[ERROR] Unsupported data type '{datatype}' for abusStrings {TypeStrings}.",app=app)
+            continue
+
+        try:
+            ierr, data = abusFunction(-1, 2, TypeStrings)
+        except Exception as e:
+            bsprint(f"[ERROR] Exception occurred while retrieving data: {e}",app=app)
+            continue
 
         if ierr != 0:
-            bsprint(f"[ERROR] Failed to retrieve data for abusString '{abusString}'. PSSE error code: {ierr}",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            return None
+            bsprint(f"[ERROR] Failed to retrieve data for abusStrings {TypeStrings}. PSSE error code: {ierr}",app=app)
+            continue
 
-        if DebugPrint:
-            bsprint(f"[DEBUG] Successfully retrieved data for '{abusString}': {data}",app=app)
-            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        # One list of values per requested string
+        for abusString, Values in zip(TypeStrings, data):
+            # Strip whitespace from each string in the list (only character data holds strings, so the items do not
+            # need to be checked one by one)
+            if datatype == 'C':
+                Values = list(map(str.strip, Values))
 
-        return data
+            BusInfoPSSECache[abusString] = Values
+            BusData[abusString] = Values
 
-    except Exception as e:
-        bsprint(f"[ERROR] Exception occurred while retrieving data: {e}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return None
+            if DebugPrint:
+                bsprint(f"[DEBUG] Successfully retrieved data for '{abusString}': {Values}",app=app)
 
+    return BusData
 
-async def BusTrip(t, BSPSSEPyBus=None, Bus = None, BusNumber=None, BusName=None, DebugPrint=False,app=None):
+
+def GetBusInfoPSSESingle(BusNumber, abusString):
     """
-    Trips a bus (sets its status to 4) and updates the BSPSSEPyBus dataFrame.
+    Retrieves specific information about a single bus from PSSE.
 
     Parameters:
-        t (float): Current simulation time.
-        BSPSSEPyBus (pd.dataFrame): dataFrame containing bus data.
-        Bus (int or str, optional): could be Bus Number of Bus Name.
-        BusNumber (int, optional): Bus Number.
-        BusName (str, optional): Bus Name.
-        DebugPrint (bool, optional): Enable detailed debug output. Default is False.
+        BusNumber (int): Bus Number.
+        abusString (str): Requested information key (one of BusInfoPSSESingleFunctions).
 
     Returns:
-        int: PSSE error code (0 for success).
+        int, float or None: The requested information, or None if PSSE could not return it.
+
+    Notes:
+        - Uses the single-bus psspy.busint/busdat APIs instead of fetching the data of all buses.
     """
+    ierr, Value = BusInfoPSSESingleFunctions[abusString](int(BusNumber), abusString)
+    return Value if ierr == 0 else None
 
-    DefaultInt, DefaultReal, DefaultChar = BSPSSEPyDefaultVariablesFun()
 
+def FindBusRow(BSPSSEPyBus, BusNumber):
+    """
+    Finds the row of a bus in BSPSSEPyBus from its number.
 
-    # Initial debug message
-    if DebugPrint:
-        bsprint(f"[DEBUG] BusTrip called with inputs:\n"
-              f"  Bus: {Bus}\n"
-              f"  BusName: {BusName}\n"
-              f"  BusNumber: {BusNumber}\n"
-              f"  Simulation Time: {t}s\n",
-              app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        
+    Parameters:
+        BSPSSEPyBus (pd.dataFrame): dataFrame containing bus data.
+        BusNumber (int): Bus Number.
 
-    # Identify the bus row based on name or number
-    if isinstance(Bus, numbers.Number):
-        BusNumber = Bus
-    else:
-        BusName = Bus
+    Returns:
+        int or None: Row position of the bus in BSPSSEPyBus, or None if it is not found.
 
+    Notes:
+        - BSPSSEPyBus is built in the PSSE bus order, so the position from BusNumberPositions is tried first; the
+          NUMBER column is only scanned if that row holds another bus.
+    """
+    Numbers = BSPSSEPyBus["NUMBER"]
+    Position = BusNumberPositions.get(BusNumber)
+    if Position is not None and Position < len(Numbers) and Numbers.iat[Position] == BusNumber:
+        return Position
+    Rows = np.flatnonzero(Numbers.to_numpy() == BusNumber)
+    return int(Rows[0]) if len(Rows) else None
 
-    # Resolve BusNumber if BusName is given
-    if BusName:
-        BusNumber = await GetBusInfo("NUMBER", Bus = BusName, BSPSSEPyBus=BSPSSEPyBus, DebugPrint=DebugPrint, app=app)
-    elif not BusNumber:
-        bsprint("[ERROR] Either BusName or BusNumber must be provided.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return None
-    
-    BusRow = await GetBusInfo(
-        BusKeys=["NAME", "NUMBER", "TYPE"],
-        Bus = BusNumber,
-        BSPSSEPyBus=BSPSSEPyBus,
-        DebugPrint=DebugPrint,
-        app=app
-    )
 
-    # Ensure the bus exists in the dataFrame
-    if BusRow.empty:
-        bsprint(f"[ERROR] Bus with Name '{BusName}' or Number '{BusNumber}' not found.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return None
-    
-    BusNumber = BusRow["NUMBER"].iloc[0]
-    BusName = BusRow["NAME"].iloc[0]
-    BusType = BusRow["TYPE"].iloc[0]
+def GetBusActionColumnPositions(BSPSSEPyBus):
+    """
+    Returns the positions of the BusActionColumns in BSPSSEPyBus.
 
-    # Debug message with resolved values
-    if DebugPrint:
-        bsprint(f"[DEBUG] Resolved Bus details:\n"
-              f"  BusName: {BusName}\n"
-              f"  BusNumber: {BusNumber}\n"
-              f"  BusType: {BusType}\n",
-              app=app
-             )
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-    
-    
-    # Change bus status in PSSE to 4 (tripped)
-    ierr = psspy.bus_chng_4(BusNumber, 0,
-            [4, DefaultInt, DefaultInt, DefaultInt],
-            [DefaultReal, DefaultReal, DefaultReal, DefaultReal, DefaultReal, DefaultReal, DefaultReal],
-            DefaultChar)
+    Parameters:
+        BSPSSEPyBus (pd.dataFrame): dataFrame containing bus data.
 
-    if ierr != 0:
-        bsprint(f"[ERROR] Failed to trip bus with Number '{BusNumber}'. PSSE error code: {ierr}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return ierr
+    Returns:
+        tuple of int: Column positions, in the BusActionColumns order.
 
-    NewType = await GetBusInfo("TYPE", Bus = BusNumber, DebugPrint=DebugPrint,app=app)
+    Notes:
+        - The positions are looked up once and kept in BSPSSEPyBus.attrs with the number of columns they were looked
+          up for, so they are looked up again when columns are added to the dataFrame.
+    """
+    Cached = BSPSSEPyBus.attrs.get("BusActionColumnPositions")
+    if Cached is None or Cached[0] != len(BSPSSEPyBus.columns):
+        Cached = (len(BSPSSEPyBus.columns), tuple(BSPSSEPyBus.columns.get_loc(Column) for Column in BusActionColumns))
+        BSPSSEPyBus.attrs["BusActionColumnPositions"] = Cached
+    return Cached[1]
 
-    if not(BSPSSEPyBus is None or BSPSSEPyBus.empty):
-        # Update the BSPSSEPyBus dataFrame to reflect the action
-        BSPSSEPyBus.loc[(BSPSSEPyBus["NUMBER"] == BusNumber) & (BSPSSEPyBus["NAME"] == BusName), [
-            "BSPSSEPyStatus", "BSPSSEPyLastAction", "BSPSSEPyLastActionTime", "BSPSSEPySimulationNotes", "TYPE"
-        ]] = ["Tripped", "Trip", t, "Bus successfully tripped.", NewType]
 
-    if DebugPrint:
-        bsprint(f"[SUCCESS] Bus with Number '{BusNumber}', Name '{BusName}' successfully tripped.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+def SetBusActionRow(BSPSSEPyBus, BusPosition, Values):
+    """
+    Writes the result of a bus action to one row of BSPSSEPyBus, one scalar (.iat) write per column.
 
-    return ierr
+    Parameters:
+        BSPSSEPyBus (pd.dataFrame): dataFrame containing bus data.
+        BusPosition (int): Row position of the bus (see FindBusRow).
+        Values (tuple): New values of the BusActionColumns (same order).
+    """
+    for ColumnPosition, Value in zip(GetBusActionColumnPositions(BSPSSEPyBus), Values):
+        BSPSSEPyBus.iat[BusPosition, ColumnPosition] = Value
+
+
+async def BusTrip(t, BSPSSEPyBus=None, Bus = None, BusNumber=None, BusName=None, DebugPrint=False,app=None):
+    """
+    Trips a bus (sets its status to 4) and updates the BSPSSEPyBus dataFrame.
+
+    Parameters:
+        t (float): Current simulation time.
+        BSPSSEPyBus (pd.dataFrame): dataFrame containing bus data.
+        Bus (int or str, optional): could be Bus Number of Bus Name.
+        BusNumber (int, optional): Bus Number.
+        BusName (str, optional): Bus Name.
+        DebugPrint (bool, optional): Enable detailed debug output. Default is False.
+
+    Returns:
+        int: PSSE error code (0 for success).
+    """
+    return await BusAction(t, "Trip", BSPSSEPyBus=BSPSSEPyBus, Bus=Bus, BusNumber=BusNumber, BusName=BusName, DebugPrint=DebugPrint, app=app)
 
 
 async def BusClose(t, BSPSSEPyBus=None, Bus = None, BusNumber=None, BusName=None, DebugPrint=False, app=None):
@@ -349,100 +552,68 @@ async def BusClose(t, BSPSSEPyBus=None, Bus = None, BusNumber=None, BusName=None
     Returns:
         int: PSSE error code (0 for success).
     """
-    DefaultInt, DefaultReal, DefaultChar = BSPSSEPyDefaultVariablesFun()
-
+    return await BusAction(t, "Close", BSPSSEPyBus=BSPSSEPyBus, Bus=Bus, BusNumber=BusNumber, BusName=BusName, DebugPrint=DebugPrint, app=app)
 
-    # Initial debug message
-    if DebugPrint:
-        bsprint(f"[DEBUG] BusClose called with inputs:\n"
-              f"  Bus: {Bus}\n"
-              f"  BusName: {BusName}\n"
-              f"  BusNumber: {BusNumber}\n"
-              f"  Simulation Time: {t}s\n",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        
 
-    # Identify the bus row based on name or number
-    if isinstance(Bus, numbers.Number):
-        BusNumber = Bus
-    else:
-        BusName = Bus
+async def ChangeBusType(t, NewBusType, BSPSSEPyBus=None, Bus = None, BusNumber=None, BusName=None, DebugPrint=False, app=None):
+    """
+    This function allows for changing bus types manually during the simulation.
 
+    Parameters:
+        t (float): Current simulation time.
+        NewBusType (int): 1,2,3,4
+        BSPSSEPyBus (pd.dataFrame): dataFrame containing bus data.
+        Bus (int or str, optional): could be Bus Number of Bus Name.
+        BusNumber (int, optional): Bus Number.
+        BusName (str, optional): Bus Name.
+        DebugPrint (bool, optional): Enable detailed debug output. Default is False.
 
-    # Resolve BusNumber if BusName is given
-    if BusName:
-        BusNumber = await GetBusInfo("NUMBER", Bus = BusName, BSPSSEPyBus=BSPSSEPyBus, DebugPrint=DebugPrint,app=app)
-    elif not BusNumber:
-        bsprint("[ERROR] Either BusName or BusNumber must be provided.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return None
-    
-    BusRow = await GetBusInfo(
-        BusKeys=["NAME", "NUMBER", "TYPE", "BSPSSEPyType_0"],
-        Bus = BusNumber,
-        BSPSSEPyBus=BSPSSEPyBus,
-        DebugPrint=DebugPrint,
-        app=app
-    )
+    Returns:
+        int: PSSE error code (0 for success).
+    """
+    return await BusAction(t, "ModifyType", NewBusType=NewBusType, BSPSSEPyBus=BSPSSEPyBus, Bus=Bus, BusNumber=BusNumber, BusName=BusName, DebugPrint=DebugPrint, app=app)
 
-    # Ensure the bus exists in the dataFrame
-    if BusRow.empty:
-        bsprint(f"[ERROR] Bus with Name '{BusName}' or Number '{BusNumber}' not found.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return None
-    
-    BusNumber = BusRow["NUMBER"].iloc[0]
-    # BusNumber = BusRow["NUMBER"].values[0]
-    BusName = BusRow["NAME"].iloc[0]
-    BusType = BusRow["TYPE"].iloc[0]
-    BusType_0 = BusRow["BSPSSEPyType_0"].iloc[0]
 
-    # Debug message with resolved values
-    if DebugPrint:
-        bsprint(f"[DEBUG] Resolved Bus details:\n"
-              f"  BusName: {BusName}\n"
-              f"  BusNumber: {BusNumber}\n"
-              f"  BusType: {BusType}\n"
-              f"  BusType_0: {BusType_0}\n",
-              app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-    
-    
-    # Change bus status in PSSE to 4 (tripped)
-    ierr = psspy.bus_chng_4(BusNumber, 0,
-            [BusType_0, DefaultInt, DefaultInt, DefaultInt],
-            [DefaultReal, DefaultReal, DefaultReal, DefaultReal, DefaultReal, DefaultReal, DefaultReal],
-            DefaultChar)
-    
-    NewType = await GetBusInfo("TYPE", Bus=BusNumber, DebugPrint=DebugPrint,app=app)
+# psspy.bus_chng_4 arguments left at the PSSE defaults by every bus action (built once by GetBusChangeDefaults)
+BusChangeDefaults = None
 
-    if ierr != 0:
-        bsprint(f"[ERROR] Failed to close bus with Number '{BusNumber}'. PSSE error code: {ierr}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        return ierr
 
-    if not(BSPSSEPyBus is None or BSPSSEPyBus.empty):
-        # Update the BSPSSEPyBus dataFrame to reflect the action
-        BSPSSEPyBus.loc[(BSPSSEPyBus["NUMBER"] == BusNumber) & (BSPSSEPyBus["NAME"] == BusName), [
-            "BSPSSEPyStatus", "BSPSSEPyLastAction", "BSPSSEPyLastActionTime", "BSPSSEPySimulationNotes", "TYPE"
-        ]] = ["Closed", "Close", t, "Bus successfully Closed.", NewType]
+def GetBusChangeDefaults():
+    """
+    Returns the psspy.bus_chng_4 arguments that the bus actions leave at the PSSE default values.
 
-    if DebugPrint:
-        bsprint(f"[SUCCESS] Bus with Number '{BusNumber}', Name '{BusName}' successfully closed.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+    Returns:
+        tuple:
+            - DefaultIntTail (tuple): The three default integers following the bus type.
+            - DefaultReals (list): The seven default reals.
+            - DefaultChar (str): The default bus name.
 
-    return ierr
+    Notes:
+        - Built on the first bus action (the defaults come from PSSE, see BSPSSEPyDefaultVariablesFun) and reused.
+    """
+    global BusChangeDefaults
+    if BusChangeDefaults is None:
+        DefaultInt, DefaultReal, DefaultChar = BSPSSEPyDefaultVariablesFun()
+        BusChangeDefaults = ((DefaultInt,) * 3, [DefaultReal] * 7, DefaultChar)
+    return BusChangeDefaults
 
 
+# Bus actions (BSPSSEPyLastAction --> calling function, past tense used in the messages, BSPSSEPySimulationNotes)
+BusActions = {
+    "Trip":       ("BusTrip",       "tripped",  "Bus successfully tripped."),
+    "Close":      ("BusClose",      "closed",   "Bus successfully Closed."),
+    "ModifyType": ("ChangeBusType", "modified", "BusType modified successfully."),
+}
 
 
-async def ChangeBusType(t, NewBusType, BSPSSEPyBus=None, Bus = None, BusNumber=None, BusName=None, DebugPrint=False, app=None):
+async def BusAction(t, Action, NewBusType=None, BSPSSEPyBus=None, Bus = None, BusNumber=None, BusName=None, DebugPrint=False, app=None):
     """
-    This function allows for changing bus types manually during the simulation.
+    Changes the type of a bus in PSSE and updates the BSPSSEPyBus dataFrame (shared by BusTrip, BusClose and ChangeBusType).
 
     Parameters:
         t (float): Current simulation time.
-        NewBusType (int): 1,2,3,4
+        Action (str): "Trip" (type 4), "Close" (original type, BSPSSEPyType_0) or "ModifyType" (NewBusType).
+        NewBusType (int, optional): 1,2,3,4 (only used by "ModifyType").
         BSPSSEPyBus (pd.dataFrame): dataFrame containing bus data.
         Bus (int or str, optional): could be Bus Number of Bus Name.
         BusNumber (int, optional): Bus Number.
@@ -452,18 +623,21 @@ async def ChangeBusType(t, NewBusType, BSPSSEPyBus=None, Bus = None, BusNumber=N
     Returns:
         int: PSSE error code (0 for success).
     """
-    DefaultInt, DefaultReal, DefaultChar = BSPSSEPyDefaultVariablesFun()
+    FunctionName, ActionDone, ActionNotes = BusActions[Action]
+    DefaultIntTail, DefaultReals, DefaultChar = GetBusChangeDefaults()
 
 
     # Initial debug message
     if DebugPrint:
-        bsprint(f"[DEBUG] BusClose called with inputs:\n"
-              f"  BusType: {NewBusType}\n"
-              f"  Bus: {Bus}\n"
+        bsprint(f"[DEBUG] {FunctionName} called with inputs:\n"
+              + (f"  BusType: {NewBusType}\n" if Action == "ModifyType" else "")
+              + f"  Bus: {Bus}\n"
               f"  BusName: {BusName}\n"
               f"  BusNumber: {BusNumber}\n"
-              f"  Simulation Time: {t}s\n",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+              f"  Simulation Time: {t}s\n",
+              app=app)
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
         
 
     # Identify the bus row based on name or number
@@ -473,17 +647,18 @@ async def ChangeBusType(t, NewBusType, BSPSSEPyBus=None, Bus = None, BusNumber=N
         BusName = Bus
 
 
-    # Resolve BusNumber if BusName is given
-    if BusName:
-        BusNumber = await GetBusInfo("NUMBER", Bus = BusName, BSPSSEPyBus=BSPSSEPyBus, DebugPrint=DebugPrint,app=app)
-    elif not BusNumber:
+    if not BusName and not BusNumber:
         bsprint("[ERROR] Either BusName or BusNumber must be provided.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
         return None
-    
+
+    # Fetch the bus details in one call (selected by name if given, otherwise by number). The original type is only
+    # stored in BSPSSEPyBus, so a trip does not ask for it
     BusRow = await GetBusInfo(
-        BusKeys=["NAME", "NUMBER", "TYPE", "BSPSSEPyType_0"],
-        Bus = BusNumber,
+        BusKeys=["NAME", "NUMBER", "TYPE"] if Action == "Trip" else ["NAME", "NUMBER", "TYPE", "BSPSSEPyType_0"],
+        BusName=BusName,
+        BusNumber=BusNumber,
         BSPSSEPyBus=BSPSSEPyBus,
         DebugPrint=DebugPrint,
         app=app
@@ -492,14 +667,14 @@ async def ChangeBusType(t, NewBusType, BSPSSEPyBus=None, Bus = None, BusNumber=N
     # Ensure the bus exists in the dataFrame
     if BusRow.empty:
         bsprint(f"[ERROR] Bus with Name '{BusName}' or Number '{BusNumber}' not found.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
         return None
     
     BusNumber = BusRow["NUMBER"].iloc[0]
-    # BusNumber = BusRow["NUMBER"].values[0]
     BusName = BusRow["NAME"].iloc[0]
     BusType = BusRow["TYPE"].iloc[0]
-    BusType_0 = BusRow["BSPSSEPyType_0"].iloc[0]
+    BusType_0 = None if Action == "Trip" else BusRow["BSPSSEPyType_0"].iloc[0]
 
     # Debug message with resolved values
     if DebugPrint:
@@ -507,32 +682,38 @@ async def ChangeBusType(t, NewBusType, BSPSSEPyBus=None, Bus = None, BusNumber=N
               f"  BusName: {BusName}\n"
               f"  BusNumber: {BusNumber}\n"
               f"  BusType: {BusType}\n"
-              f"  BusType_0: {BusType_0}\n"
-             ,app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+              + (f"  BusType_0: {BusType_0}\n" if Action != "Trip" else ""),
+              app=app)
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
     
     
-    # Change bus status in PSSE to 4 (tripped)
+    # Change bus type in PSSE (4 --> tripped)
+    TargetType = 4 if Action == "Trip" else BusType_0 if Action == "Close" else NewBusType
     ierr = psspy.bus_chng_4(BusNumber, 0,
-            [NewBusType, DefaultInt, DefaultInt, DefaultInt],
-            [DefaultReal, DefaultReal, DefaultReal, DefaultReal, DefaultReal, DefaultReal, DefaultReal],
+            [TargetType, *DefaultIntTail],
+            DefaultReals,
             DefaultChar)
-    
-    NewType = await GetBusInfo("TYPE", Bus=BusNumber, DebugPrint=DebugPrint,app=app)
+    ClearBusInfoPSSECache()
 
     if ierr != 0:
-        bsprint(f"[ERROR] Failed to close bus with Number '{BusNumber}'. PSSE error code: {ierr}",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        bsprint(f"[ERROR] Failed to {'trip' if Action == 'Trip' else 'close'} bus with Number '{BusNumber}'. PSSE error code: {ierr}",app=app)
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
         return ierr
 
+    NewType = GetBusInfoPSSESingle(BusNumber, "TYPE")
+
     if not(BSPSSEPyBus is None or BSPSSEPyBus.empty):
         # Update the BSPSSEPyBus dataFrame to reflect the action
-        BSPSSEPyBus.loc[(BSPSSEPyBus["NUMBER"] == BusNumber) & (BSPSSEPyBus["NAME"] == BusName), [
-            "BSPSSEPyStatus", "BSPSSEPyLastAction", "BSPSSEPyLastActionTime", "BSPSSEPySimulationNotes", "TYPE"
-        ]] = ["Closed", "ModifyType", t, "BusType modified successfully.", NewType] if NewType != 4 else ["Tripped", "ModifyType", t, "BusType modified successfully.", NewType]
+        BusPosition = FindBusRow(BSPSSEPyBus, BusNumber)
+        if BusPosition is not None:
+            BusStatus = "Tripped" if Action == "Trip" or (Action == "ModifyType" and NewType == 4) else "Closed"
+            SetBusActionRow(BSPSSEPyBus, BusPosition, (BusStatus, Action, t, ActionNotes, NewType))
 
     if DebugPrint:
-        bsprint(f"[SUCCESS] Bus with Number '{BusNumber}', Name '{BusName}' successfully modified.",app=app)
-        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+        bsprint(f"[SUCCESS] Bus with Number '{BusNumber}', Name '{BusName}' successfully {ActionDone}.",app=app)
+        if app:
+            await asyncio.sleep(app.bsprintasynciotime)
 
-    return ierr
\ No newline at end of file
+    return ierr
@@ -11,6 +11,9 @@
 
 import psspy
 
+# PSSE default values never change within a process: they are retrieved once and reused
+DefaultVariablesCache = None
+
 def BSPSSEPyDefaultVariablesFun(DebugPrint=False):
     """
     Retrieves the default integer, real, and character values from PSSE.
@@ -33,14 +36,16 @@ def BSPSSEPyDefaultVariablesFun(DebugPrint=False):
           parameter values unchanged when modifying only specific attributes.
         - Additional default types such as strings and complex numbers can be 
           added in the future if required.
+        - The values are queried from PSSE on the first call only (cached in DefaultVariablesCache).
     """
+    global DefaultVariablesCache
 
     # ==========================
     #  Retrieve Default Values
     # ==========================
-    DefaultInt = psspy.getdefaultint()
-    DefaultReal = psspy.getdefaultreal()
-    DefaultChar = psspy.getdefaultchar()
+    if DefaultVariablesCache is None:
+        DefaultVariablesCache = (psspy.getdefaultint(), psspy.getdefaultreal(), psspy.getdefaultchar())
+    DefaultInt, DefaultReal, DefaultChar = DefaultVariablesCache
     # DefaultString = psspy._s
     # DefaultComplex = psspy._c
 
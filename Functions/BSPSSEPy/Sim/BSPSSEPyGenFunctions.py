@@ -20,6 +20,7 @@
 #       Contact the developer at ilyas.farhat@outlook.com
 
 import psspy
+import numpy as np
 import pandas as pd
 from Functions.BSPSSEPy.BSPSSEPyDictionary import *
 from .BSPSSEPyChannels import FetchChannelValue
@@ -259,7 +260,7 @@ async def GetGenInfoPSSE(amachstring, # Requested info string - check available
 
 async def ExtendBSPSSEPyGenDataFrame(
         BSPSSEPyGen,
-        ConfigTable,
+        Generators,
         SimConfig,
         BSPSSEPyTrn,
         BSPSSEPyBus,
@@ -278,7 +279,7 @@ async def ExtendBSPSSEPyGenDataFrame(
 
     Parameters:
         BSPSSEPyGen  (pd.DataFrame): The dataframe containing generator data.
-        ConfigTable (list): A list of dictionaries with generator configurations, where each dictionary has the keys "Generator Name", "Bus Name", "Status", "Load Name", "Cranking Time", "Ramp Rate", "Generator Type", "Cranking Load Array".
+        Generators (GeneratorsTable): Column-wise generator configurations (Config.Generators), built from GeneratorsConfig with the keys "Generator Name", "Bus Name", "Status", "Load Name", "Cranking Time", "Ramp Rate", "Generator Type", "Cranking Load Array".
     Returns:
         pd.DataFrame: The updated dataframe with the new columns and assigned values.
 
@@ -289,7 +290,7 @@ async def ExtendBSPSSEPyGenDataFrame(
 
 
 
-        Status (str, optional): Default value for the "Generator Status" column if not in ConfigTable.
+        Status (str, optional): Default value for the "Generator Status" column if not in Generators.
         LoadName (str, optional): Default value for the "Generator Load Name" column.
         CrankingTime (float, optional): Default value for the "Generator Cranking Time" column.
         RampRate (float, optional): Default value for the "Generator Ramp Rate" column.
@@ -321,6 +322,8 @@ async def ExtendBSPSSEPyGenDataFrame(
         "GenLoadName": GenLoadName,
         "GenCrankingTime": GenCrankingTime,
         "GenRampRate": GenRampRate,
+        "GenCrankingTimeSec": GenCrankingTime * 60,  # seconds
+        "GenRampRateSec": GenRampRate / 60,  # MW/s
         "BSPSSEPyGenType": BSPSSEPyGenType,
         "GenCrankingLoadPowerArray": GenCrankingLoadPowerArray,
         "AGCAlpha": AGCAlpha,
@@ -347,10 +350,17 @@ async def ExtendBSPSSEPyGenDataFrame(
                 await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
 
-    for Config in ConfigTable:
-        GenName = Config.get("Generator Name")
+    # Effective Bias = Bias Scaling * (1/R + D) for all generators at once
+    # (uniform fields come back as scalars, so broadcast the result to one value per generator)
+    EffectiveBiasArray = np.broadcast_to(
+        Generators.Field("BiasScaling") * ((1 / np.asarray(Generators.Field("EffectiveSpeedDroop"), dtype=np.float64)) + Generators.Field("LoadDampConstant")),
+        (len(Generators),),
+    )
+
+    for GenIndex in range(len(Generators)):
+        GenName = Generators.GenName[GenIndex]
         # GeneratorID = Config.get("Generator ID")
-        BusName = Config.get("Bus Name")
+        BusName = Generators.BusName[GenIndex]
 
         if DebugPrint:
             bsprint(f"[DEBUG] Processing configuration for Generator Name: {GenName}, Bus Name: {BusName}",app=app)
@@ -379,22 +389,24 @@ async def ExtendBSPSSEPyGenDataFrame(
             bsprint(f"[DEBUG] Generator index to update: {list(GeneratorIndices)}",app=app)
             await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
-        # Extract configuration values or use defaults
-        BSPSSEPyGenType = Config.get("Generator Type", BSPSSEPyGenType)
-        BSPSSEPyStatus = 3 if BSPSSEPyGenType == "BS" else Config.get("Status", BSPSSEPyStatus)
-        GenLoadName = Config.get("Load Name", GenLoadName)
-        GenCrankingTime = Config.get("Cranking Time", GenCrankingTime)
-        GenRampRate = Config.get("Ramp Rate", GenRampRate)
-        GenCrankingLoadPowerArray = Config.get("Cranking Load Array", GenCrankingLoadPowerArray)
-        AGCAlpha = Config.get("AGC Participation Factor", AGCAlpha)
-        LoadDampConstant = Config.get("Load Damping Constant", LoadDampConstant)
-        EffectiveSpeedDroop = Config.get("Effective Speed Droop", EffectiveSpeedDroop)
-        BiasScaling = Config.get("Bias Scaling", BiasScaling)
-        POPF = Config.get("POPF", POPF)
-        QOPF = Config.get("QOPF", QOPF)
-        UseGenRampRate = Config.get("UseGenRampRate", False)
-        LoadEnabledResponse = Config.get("Load Enabled Response", False)
-        LERPF = Config.get("LERPF", -1)
+        # Extract configuration values (missing keys were already filled with defaults by BuildGeneratorsTable)
+        BSPSSEPyGenType = Generators.GenType[GenIndex]
+        BSPSSEPyStatus = int(Generators.Status[GenIndex])
+        GenLoadName = Generators.LoadName[GenIndex]
+        GenCrankingTime = float(Generators.CrankingTime[GenIndex])
+        GenRampRate = float(Generators.RampRate[GenIndex])
+        GenCrankingTimeSec = float(Generators.CrankingTimeSec[GenIndex])
+        GenRampRateSec = float(Generators.RampRateMWPerSec[GenIndex])
+        GenCrankingLoadPowerArray = Generators.CrankingLoadArray[GenIndex]
+        AGCAlpha = float(Generators.AGCAlpha[GenIndex])
+        LoadDampConstant = float(Generators.LoadDampConstant[GenIndex])
+        EffectiveSpeedDroop = float(Generators.EffectiveSpeedDroop[GenIndex])
+        BiasScaling = float(Generators.BiasScaling[GenIndex])
+        POPF = float(Generators.POPF[GenIndex])
+        QOPF = float(Generators.QOPF[GenIndex])
+        UseGenRampRate = bool(Generators.UseGenRampRate[GenIndex])
+        LoadEnabledResponse = bool(Generators.LoadEnabledResponse[GenIndex])
+        LERPF = float(Generators.LERPF[GenIndex])
 
 
         # if DebugPrint:
@@ -455,13 +467,15 @@ async def ExtendBSPSSEPyGenDataFrame(
             "GenLoadName": GenLoadName,
             "GenCrankingTime": GenCrankingTime,
             "GenRampRate": GenRampRate,
+            "GenCrankingTimeSec": GenCrankingTimeSec,
+            "GenRampRateSec": GenRampRateSec,
             "BSPSSEPyGenType": BSPSSEPyGenType,
             "GenCrankingLoadPowerArray": GenCrankingLoadPowerArray,
             "AGCAlpha": AGCAlpha,
             "LoadDampConstant": LoadDampConstant,  # D
             "EffectiveSpeedDroop": EffectiveSpeedDroop,  # R
             "BiasScaling": BiasScaling,  # Bias Scaling (Effective Bias = Bias * Bias Scaling)
-            "EffectiveBias": BiasScaling * ((1 / EffectiveSpeedDroop) + LoadDampConstant),
+            "EffectiveBias": float(EffectiveBiasArray[GenIndex]),
             "POPF": POPF,
             "QOPF": QOPF,
             "UseGenRampRate": UseGenRampRate,
@@ -900,9 +914,9 @@ async def GenEnable(
         
         
         # Check if Cranking time is met!
-        if t < BSPSSEPyGenRow["GenCrankingTime"].values[0]*60 + BSPSSEPyGenRow["BSPSSEPyLastActionTime"].values[0]:
+        if t < BSPSSEPyGenRow["GenCrankingTimeSec"].values[0] + BSPSSEPyGenRow["BSPSSEPyLastActionTime"].values[0]:
             if DebugPrint:
-                bsprint(f"[DEBUG] Gen {GenName} is still cranking. (Cranking ends at t = {BSPSSEPyGenRow['GenCrankingTime'].values[0]*60 + BSPSSEPyGenRow['BSPSSEPyLastActionTime'].values[0]} - remaining {BSPSSEPyGenRow['GenCrankingTime'].values[0]*60 + BSPSSEPyGenRow['BSPSSEPyLastActionTime'].values[0] - t}s)",app=app)
+                bsprint(f"[DEBUG] Gen {GenName} is still cranking. (Cranking ends at t = {BSPSSEPyGenRow['GenCrankingTimeSec'].values[0] + BSPSSEPyGenRow['BSPSSEPyLastActionTime'].values[0]} - remaining {BSPSSEPyGenRow['GenCrankingTimeSec'].values[0] + BSPSSEPyGenRow['BSPSSEPyLastActionTime'].values[0] - t}s)",app=app)
                 await asyncio.sleep(app.bsprintasynciotime if app else 0)
             UpdatedActionStatus = 1
             return UpdatedActionStatus
@@ -1098,7 +1112,7 @@ async def GenEnable(
             if DebugPrint:
                 bsprint(f"[DEBUG] Using explicit ramp-rate for generator: {GenName} - Ramp Rate: {BSPSSEPyGenRow['GenRampRate'].values[0]} MW/min",app=app)
                 await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            GenRampRateSec = BSPSSEPyGenRow["GenRampRate"].values[0]/60         # convert the ramp rate to MW/sec
+            GenRampRateSec = BSPSSEPyGenRow["GenRampRateSec"].values[0]         # ramp rate in MW/sec (converted once at load)
 
             if GenP > GenPOPF:
                 GenRampRateSec = -GenRampRateSec
@@ -1425,7 +1439,7 @@ async def GenUpdate(
         if DebugPrint:
             bsprint(f"[DEBUG] Using explicit ramp-rate for generator: {GenName} - Ramp Rate: {BSPSSEPyGenRow['GenRampRate'].values[0]} MW/min",app=app)
             await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        GenRampRateSec = BSPSSEPyGenRow["GenRampRate"].values[0]/60         # convert the ramp rate to MW/sec
+        GenRampRateSec = BSPSSEPyGenRow["GenRampRateSec"].values[0]         # ramp rate in MW/sec (converted once at load)
 
         if GenP > GenPSetPoint:
             GenRampRateSec = -GenRampRateSec
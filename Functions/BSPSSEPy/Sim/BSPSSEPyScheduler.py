@@ -0,0 +1,79 @@
+# ===========================================================
+#   BSPSSEPy Application - Action Scheduler
+# ===========================================================
+#   This module keeps the rows of the control sequence that are
+#   still waiting to be executed in a binary min-heap ordered by
+#   (action time, sequence position). At every BSPSSEPy time step
+#   only the actions that are due are popped, instead of scanning
+#   the whole control sequence.
+#
+#   Last Updated: BSPSSEPy Ver 0.4 (11 Feb 2025)
+#   Copyright (c) 2024-2025, Ilyas Farhat
+#   Contact: ilyas.farhat@outlook.com
+# ===========================================================
+
+import heapq
+import math
+
+
+class BSPSSEPyActionScheduler:
+    """
+    Min-heap of pending control sequence rows.
+
+    Every entry is a tuple (ActionTime, SeqNo, RowIndex) where:
+        - ActionTime (float): Planned action time in seconds (without the time shift).
+          It is -inf when ControlSequenceAsIs is enabled (action times are ignored).
+        - SeqNo (int): Position of the row in the control sequence (ties are executed in order).
+        - RowIndex: Index label of the row in BSPSSEPySequence.
+
+    Notes:
+        - The time shift (self.TimeShift in Sim.Run) applies to all actions equally, so it is
+          added when comparing against the current time and the heap order never changes.
+    """
+
+    def __init__(self, BSPSSEPySequence, ControlSequenceAsIs=False):
+        """
+        Builds the heap from the control sequence.
+
+        Parameters:
+            BSPSSEPySequence (pd.DataFrame): The control sequence ("Action Time" in minutes).
+            ControlSequenceAsIs (bool): If True, actions are executed in their listed order regardless of their action time.
+        """
+        if ControlSequenceAsIs:
+            ActionTimes = [-math.inf] * len(BSPSSEPySequence)
+        else:
+            ActionTimes = (BSPSSEPySequence["Action Time"] * 60).tolist()
+
+        self.Heap = [
+            (ActionTime, SeqNo, RowIndex)
+            for SeqNo, (ActionTime, RowIndex) in enumerate(zip(ActionTimes, BSPSSEPySequence.index))
+        ]
+        heapq.heapify(self.Heap)
+
+    def __len__(self):
+        return len(self.Heap)
+
+    def PopReady(self, CurrentSimTime, TimeShift=0):
+        """
+        Pops the next entry whose action time (plus the time shift) has elapsed.
+
+        Parameters:
+            CurrentSimTime (float): Current simulation time in seconds.
+            TimeShift (float): Accumulated delay applied to all action times (seconds).
+
+        Returns:
+            tuple or None: (ActionTime, SeqNo, RowIndex) of the due entry, or None if no entry is due.
+        """
+        if self.Heap and self.Heap[0][0] + TimeShift <= CurrentSimTime:
+            return heapq.heappop(self.Heap)
+        return None
+
+    def Defer(self, Entries):
+        """
+        Pushes back entries that were due but could not be started (e.g., their element is busy).
+
+        Parameters:
+            Entries (list): Entries previously returned by PopReady.
+        """
+        for Entry in Entries:
+            heapq.heappush(self.Heap, Entry)
@@ -24,9 +24,12 @@ from .BSPSSEPyTrnFunctions import *
 from Functions.BSPSSEPy.BSPSSEPyDictionary import *
 from Functions.BSPSSEPy.BSPSSEPyFunctionsDictionary import *
 from .BSPSSEPyAGC import *
+from .BSPSSEPyAGCKernel import WarmUpAGCKernel
 from .BSPSSEPyChannels import GetAvgFrequency
+from .BSPSSEPyScheduler import BSPSSEPyActionScheduler
 from Functions.BSPSSEPy.App.BSPSSEPyAppHelperFunctions import bsprint, ProgressBarUpdate
 import asyncio
+import numpy as np
 
 
 class Sim:
@@ -127,6 +130,12 @@ class Sim:
             "ActionEndTime": None,    # Time when the action ended
         }
         
+        # ==========================
+        #  AGC Kernel Warm-up
+        # ==========================
+        # Compiles (or loads from the Numba cache) the AGC kernel now instead of at the first AGC step.
+        WarmUpAGCKernel()
+
         self.DashBoardStyle = 0 # this is the basic output format 
         # self.DashBoardStyle = 1 # this is the rich output format (nice interface with tables and progress bar)
 
@@ -199,7 +208,7 @@ class Sim:
                 DefaultReal,  # Acceleration factor for network solution
                 DefaultReal,  # Convergence tolerance for network solution
                 self.Config.SimulationTimeStep,  # Simulation Time step (DELT)
-                self.Config.Simulationfreqfilter,  # Filter time constant for bus frequency deviations
+                self.Config.SimParams.FreqFilter,  # Filter time constant for bus frequency deviations
                 DefaultReal,  # Intermediate simulation mode time step threshold
                 DefaultReal,  # Large (island frequency) mode time step threshold
                 DefaultReal,  # Large (island frequency) mode acceleration factor
@@ -286,6 +295,10 @@ class Sim:
         # ==========================
         #  Retrieve and Initialize Branch Information
         # ==========================
+        # A new case was loaded in PSSE: branch and bus data cached by an earlier run is no longer valid
+        ClearBrnInfoPSSECache(NewCase=True)
+        ClearBusInfoPSSECache(NewCase=True)
+
         # Get data from PSSE for basic branch information
         BSPSSEPyBrn = await GetBrnInfo(BrnKeys=["ID", "BRANCHNAME", "FROMNUMBER", "FROMNAME", "TONUMBER", "TONAME", "STATUS"],
             DebugPrint=self.DebugPrint,
@@ -306,6 +319,11 @@ class Sim:
         BSPSSEPyBrn["BSPSSEPySimulationNotes"] = "Initialized"
         BSPSSEPyBrn["GenControlled"] = False
 
+        # Branch names and IDs are compared against single values on every branch action: as categories, the
+        # comparisons run on integer codes
+        BSPSSEPyBrn["BRANCHNAME"] = BSPSSEPyBrn["BRANCHNAME"].astype("category")
+        BSPSSEPyBrn["ID"] = BSPSSEPyBrn["ID"].astype("category")
+
         # Assign to the class attribute
         self.BSPSSEPyBrn = BSPSSEPyBrn
 
@@ -441,7 +459,7 @@ class Sim:
         self.BSPSSEPyGen, self.BSPSSEPyLoad = await ExtendBSPSSEPyGenDataFrame(
             BSPSSEPyGen=BSPSSEPyGen,
             BSPSSEPyBus=self.BSPSSEPyBus,
-            ConfigTable=self.Config.GeneratorsConfig,
+            Generators=self.Config.Generators,
             SimConfig=self.Config,
             BSPSSEPyLoad=self.BSPSSEPyLoad,
             BSPSSEPyTrn=self.BSPSSEPyTrn,
@@ -533,12 +551,15 @@ class Sim:
         # ==========================
         bsprint("Tripping all branches...",app=app)
         await asyncio.sleep(app.bsprintasynciotime if app else 0)
-        for BranchRowIndex, BranchrowDF in self.BSPSSEPyBrn.iterrows():
-            BranchName = BranchrowDF['BRANCHNAME']
+        # All branch rows resolved in one pass (tripping a branch does not change the status of the others)
+        BranchRows = GetBrnInfoBatch(["FROMNUMBER", "TONUMBER", "ID", "STATUS", "BRANCHNAME"], self.BSPSSEPyBrn["BRANCHNAME"],
+                                     BSPSSEPyBrn=self.BSPSSEPyBrn, DebugPrint=self.DebugPrint, app=app)
+        for BranchRow in BranchRows.itertuples(index=False):
+            BranchName = BranchRow.BRANCHNAME
             if self.DebugPrint:
                 bsprint(f"[DEBUG] Attempting to trip branch: {BranchName}",app=app)
                 await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            await BrnTrip(t = 0, BSPSSEPyBrn=self.BSPSSEPyBrn, BranchName=BranchName, DebugPrint=self.DebugPrint,app=app)
+            BrnTripRow(t = 0, BSPSSEPyBrn=self.BSPSSEPyBrn, Row=BranchRow, DebugPrint=self.DebugPrint,app=app)
             if self.DebugPrint:
                 bsprint(f"[DEBUG] Successfully tripped branch: {BranchName}",app=app)
                 await asyncio.sleep(app.bsprintasynciotime if app else 0)
@@ -593,6 +614,56 @@ class Sim:
 
     
     
+    async def AddAction(self, Row, RowIndex, ActionTime, app=None):
+        """
+        Adds a control sequence row (and, if BypassTiedActions is enabled, its tied actions) to self.Actions.
+
+        Parameters:
+            Row (pd.Series): The control sequence row of the action.
+            RowIndex: Index label of the row in BSPSSEPySequence.
+            ActionTime (float): Start time of the action in seconds (time shift included).
+            app (BSPSSEPyApp, optional): The application instance for GUI logging.
+        """
+        NewAction = {
+            "UID": Row["UID"],
+            "ElementIDValue": Row["Identification Value"],
+            "ElementIDType": Row["Identification Type"],
+            "ElementType": Row["Device Type"],
+            "Action": Row["Action Type"],
+            "StartTime": ActionTime,
+            "EndTime": -1,
+            "ActionStatus": Row["Action Status"],  # 0: Not started, 1: In progress, 2: Completed
+            "BSPSSEPySequenceRowIndex": RowIndex,  # Add the row index
+        }
+        self.Actions.append(NewAction)
+
+        # Check if self.Config.BypassTiedActions is True → Add all tied actions linked to the current action
+        if self.Config.BypassTiedActions:
+            TiedActions = self.Config.BSPSSEPySequence[self.Config.BSPSSEPySequence["Tied Action"] == Row["UID"]]
+            for _, tied_row in TiedActions.iterrows():
+                # Ensure tied action is not already in the execution queue
+                if not any(action["UID"] == tied_row["UID"] for action in self.Actions):
+                    TiedAction = {
+                        "UID": tied_row["UID"],
+                        "ElementIDValue": tied_row["Identification Value"],
+                        "ElementIDType": tied_row["Identification Type"],
+                        "ElementType": tied_row["Device Type"],
+                        "Action": tied_row["Action Type"],
+                        "StartTime": ActionTime,  # Same start time as parent action
+                        "EndTime": -1,
+                        "ActionStatus": tied_row["Action Status"],  # 0: Not started, 1: In progress, 2: Completed
+                        "BSPSSEPySequenceRowIndex": tied_row.name,  # Row index
+                    }
+                    self.Actions.append(TiedAction)
+
+                    if self.DebugPrint:
+                        bsprint(f"[DEBUG] Added tied action alongside parent: {TiedAction}", app=app)
+                        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+
+        if self.DebugPrint:
+            bsprint(f"[DEBUG] Added new action: {NewAction}",app=app)
+            await asyncio.sleep(app.bsprintasynciotime if app else 0)
+
     async def Run(self,app=None):
         """
         Executes the dynamic simulation in fixed time steps until completion.
@@ -638,6 +709,31 @@ class Sim:
         
         # Track the time shift due to execution delays
         self.TimeShift = 0  
+
+        # Derived simulation quantities (computed once in ConfigInit)
+        SimParams = self.Config.SimParams
+        TimeStep = self.Config.BSPSSEPyTimeStep
+
+        # ==========================
+        #  Enforce Action Locking
+        # ==========================
+        # ControlSequenceAsIs executes the actions one by one in their listed order --> EnforceActionLock must be True
+        if self.Config.ControlSequenceAsIs and not self.EnforceActionLock:
+            if app:
+                # Need a code to perform this request, for now, it will simply ignore it.
+                self.EnforceActionLock = True
+                bsprint('[WARNING] "EnforceActionLock" is set to False while "ControlSequenceAsIs" is True. "EnforceActionLock" has been overridden to True.', app=app)
+                await asyncio.sleep(app.bsprintasynciotime if app else 0)
+            else:
+                if str.lower(input("EnforceActionLock is False and ControlSequenceAsIs is True. EnforceActionLock Should be True. Overridde?  [y/n]:")) in ["y", "yes", "ok", "true", "t", "1"]:
+                    self.EnforceActionLock = True
+                else:
+                    bsprint('[ERROR] Since ControlSequenceAsIs is enabled, EnforceActionLock must be enabled. Exiting...',app=app)
+                    await asyncio.sleep(app.bsprintasynciotime if app else 0)
+                    sys.exit(0)
+
+        # Pending actions ordered by (action time, position in the control sequence)
+        Scheduler = BSPSSEPyActionScheduler(self.Config.BSPSSEPySequence, ControlSequenceAsIs=self.Config.ControlSequenceAsIs)
         
         
         # ==========================
@@ -648,9 +744,8 @@ class Sim:
             AccountedForDelay = False
             AllActionsExecuted = True #Always assume we are done!
             
-            CurrentSimTime >= self.Config.BSPSSEPyHardTimeLimit*60
             if app:
-                ProgressBarUpdate(app.TopBarProgressBar, CurrentSimTime, self.Config.BSPSSEPyHardTimeLimit*60, App=app, label=app.TopBarProgressBarLabel)
+                ProgressBarUpdate(app.TopBarProgressBar, CurrentSimTime, SimParams.HardTimeLimitSec, App=app, label=app.TopBarProgressBarLabel)
                 await asyncio.sleep(0)
 
             # await asyncio.sleep(0.1)
@@ -677,146 +772,42 @@ class Sim:
             # ==========================
             #  Check for New Actions
             # ==========================
-            # Iterate over BSPSSEPySequence to check for new actions
-            for RowIndex, Row in self.Config.BSPSSEPySequence.iterrows():
-                ActionTime = (Row["Action Time"] * 60) + self.TimeShift  # Convert to seconds + Apply time shift
-
-                # Check if ControlSequenceAsIs Flag is enabled --> ignore action-time 
-                if self.Config.ControlSequenceAsIs:
-                    # ==========================
-                    #  Enforce Action Locking
-                    # ==========================
-                    if not self.EnforceActionLock:
-                        if app:
-                            # Need a code to perform this request, for now, it will simply ignore it.
-                            self.EnforceActionLock = True
-                            bsprint('[WARNING] "EnforceActionLock" is set to False while "ControlSequenceAsIs" is True. "EnforceActionLock" has been overridden to True.', app=app)
-                            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                        else:
-                            if str.lower(input("EnforceActionLock is False and ControlSequenceAsIs is True. EnforceActionLock Should be True. Overridde?  [y/n]:")) in ["y", "yes", "ok", "true", "t", "1"]:
-                                self.EnforceActionLock = True
-                            else:
-                                bsprint('[ERROR] Since ControlSequenceAsIs is enabled, EnforceActionLock must be enabled. Exiting...',app=app)
-                                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                                if app:
-                                    raise Exception("Error in Sim.Run function!")
-                                else:
-                                    sys.exit(0)
+            # Pop the due actions from the scheduler (rows that cannot start yet are deferred to the next time step)
+            if not (self.EnforceActionLock and any(action["ActionStatus"] in [0, 1] for action in self.Actions)):
+                DeferredEntries = []
+                while (Entry := Scheduler.PopReady(CurrentSimTime, self.TimeShift)) is not None:
+                    RowIndex = Entry[2]
+                    Row = self.Config.BSPSSEPySequence.loc[RowIndex]
+
+                    # Completed/failed actions are never scheduled again
+                    if Row["Action Status"] in [2, -999]:
+                        continue
+
+                    # Element is already being handled by another action --> retry next time step
+                    if any(action["ElementIDValue"] == Row["Identification Value"] for action in self.Actions):
+                        DeferredEntries.append(Entry)
+                        continue
+
+                    if self.DebugPrint and self.Config.ControlSequenceAsIs:
+                        bsprint("[DEBUG] ControlSequenceAsIs is enabled. Skipping action-time validation.",app=app)
+                        await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
-                    # Add new actions if they are not already in the queue
-                    if (not any(action["ElementIDValue"] == Row["Identification Value"] for action in self.Actions)) and (Row["Action Status"] not in [2,-999]):
-                        if self.DebugPrint:
-                            bsprint("[DEBUG] ControlSequenceAsIs is enabled. Skipping action-time validation.",app=app)
-                            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                        if self.EnforceActionLock and any(action["ActionStatus"] in [0, 1] for action in self.Actions):                            
-                            if self.DebugPrint:
-                                bsprint("[DEBUG] EnforceActionLock active. Skipping new action due to ongoing actions.",app=app)
-                                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                            continue
-
-                        # Add action to queue
-                        NewAction = {
-                            "UID": Row["UID"],
-                            "ElementIDValue": Row["Identification Value"],
-                            "ElementIDType": Row["Identification Type"],
-                            "ElementType": Row["Device Type"],
-                            "Action": Row["Action Type"],
-                            "StartTime": ActionTime,
-                            "EndTime": -1,
-                            "ActionStatus": Row["Action Status"],  # 0: Not started, 1: In progress, 2: Completed
-                            "BSPSSEPySequenceRowIndex": RowIndex,  # Add the row index
-                        }
-                        self.Actions.append(NewAction)
-                        
-                        # Check if self.Config.BypassTiedActions is True → Add all tied actions linked to the current action
-                        if self.Config.BypassTiedActions:
-                            TiedActions = self.Config.BSPSSEPySequence[self.Config.BSPSSEPySequence["Tied Action"] == Row["UID"]]
-                            for _, tied_row in TiedActions.iterrows():
-                                # Ensure tied action is not already in the execution queue
-                                if not any(action["UID"] == tied_row["UID"] for action in self.Actions):
-                                    TiedAction = {
-                                        "UID": tied_row["UID"],
-                                        "ElementIDValue": tied_row["Identification Value"],
-                                        "ElementIDType": tied_row["Identification Type"],
-                                        "ElementType": tied_row["Device Type"],
-                                        "Action": tied_row["Action Type"],
-                                        "StartTime": ActionTime,  # Same start time as parent action
-                                        "EndTime": -1,
-                                        "ActionStatus": tied_row["Action Status"],  # 0: Not started, 1: In progress, 2: Completed
-                                        "BSPSSEPySequenceRowIndex": tied_row.name,  # Row index
-                                    }
-                                    self.Actions.append(TiedAction)
-
-                                    if self.DebugPrint:
-                                        bsprint(f"[DEBUG] Added tied action alongside parent: {TiedAction}", app=app)
-                                        await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                        
+                    ActionTime = (Row["Action Time"] * 60) + self.TimeShift  # Convert to seconds + Apply time shift
+                    await self.AddAction(Row, RowIndex, ActionTime, app=app)
 
-                        if self.DebugPrint:
-                            bsprint(f"[DEBUG] Added new action: {NewAction}",app=app)
+                    # If EnforceActionLock is true, no new actions are added while this one is in progress
+                    if self.EnforceActionLock:
+                        if self.DebugPrint and len(Scheduler) > 0:
+                            bsprint("[DEBUG] EnforceActionLock active. Skipping new action due to ongoing actions.",app=app)
                             await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                
-                
-                
-                else: # ControlSequenceAsIs Flag is disabled --> Standard time-based execution
-                    # ==========================
-                    #  Handle Time-Based Execution
-                    # ==========================
+                        break
 
-                    # Check if the action should start and is not already added to self.Actions
-                    if (CurrentSimTime >= ActionTime) and (not any(action["ElementIDValue"] == Row["Identification Value"] for action in self.Actions)) and (Row["Action Status"] not in [2,-999]):
-
-                        # If EnforceActionLock is true and an action is already in progress, skip adding new actions
-                        if self.EnforceActionLock and any(action["ActionStatus"] in [0, 1] for action in self.Actions):
-                            if self.DebugPrint:
-                                bsprint("[DEBUG] EnforceActionLock active. Skipping new action due to ongoing actions.",app=app)
-                                await asyncio.sleep(app.bsprintasynciotime if app else 0)
-                            continue
-
-                        # Add the new action to self.Actions
-                        NewAction = {
-                            "UID": Row["UID"],
-                            "ElementIDValue": Row["Identification Value"],
-                            "ElementIDType": Row["Identification Type"],
-                            "ElementType": Row["Device Type"],
-                            "Action": Row["Action Type"],
-                            "StartTime": ActionTime,
-                            "EndTime": -1,
-                            "ActionStatus": Row["Action Status"],  # 0: Not started, 1: In progress, 2: Completed
-                            "BSPSSEPySequenceRowIndex": RowIndex,  # Add the row index
-                        }
-                        self.Actions.append(NewAction)
-
-                        # Check if self.Config.BypassTiedActions is True → Add all tied actions linked to the current action
-                        if self.Config.BypassTiedActions:
-                            TiedActions = self.Config.BSPSSEPySequence[self.Config.BSPSSEPySequence["Tied Action"] == Row["UID"]]
-                            for _, tied_row in TiedActions.iterrows():
-                                # Ensure tied action is not already in the execution queue
-                                if not any(action["UID"] == tied_row["UID"] for action in self.Actions):
-                                    TiedAction = {
-                                        "UID": tied_row["UID"],
-                                        "ElementIDValue": tied_row["Identification Value"],
-                                        "ElementIDType": tied_row["Identification Type"],
-                                        "ElementType": tied_row["Device Type"],
-                                        "Action": tied_row["Action Type"],
-                                        "StartTime": ActionTime,  # Same start time as parent action
-                                        "EndTime": -1,
-                                        "ActionStatus": tied_row["Action Status"],  # 0: Not started, 1: In progress, 2: Completed
-                                        "BSPSSEPySequenceRowIndex": tied_row.name,  # Row index
-                                    }
-                                    self.Actions.append(TiedAction)
-
-                                    if self.DebugPrint:
-                                        bsprint(f"[DEBUG] Added tied action alongside parent: {TiedAction}", app=app)
-                                        await asyncio.sleep(app.bsprintasynciotime if app else 0)
+                Scheduler.Defer(DeferredEntries)
+            elif self.DebugPrint:
+                bsprint("[DEBUG] EnforceActionLock active. Skipping new action due to ongoing actions.",app=app)
+                await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
-                        
-                        if self.DebugPrint:
-                            bsprint(f"[DEBUG] Added new action: {NewAction}",app=app)
-                            await asyncio.sleep(app.bsprintasynciotime if app else 0)
-            
-            # for RowIndex, Row in self.Config.BSPSSEPySequence.iterrows():
-            if any(Row["Action Status"] not in [2,-999] for RowIndex, Row in self.Config.BSPSSEPySequence.iterrows()):
+            if (~self.Config.BSPSSEPySequence["Action Status"].isin([2, -999])).any():
                 # we still have some actions to do!
                 AllActionsExecuted = False
                     
@@ -824,6 +815,7 @@ class Sim:
             # ==========================
             #  Execute Actions
             # ==========================
+            AvgFreq = None  # Average frequency at the current time step (fetched on first use)
             for action in self.Actions:
                 if self.DebugPrint:
                     bsprint(f"[DEBUG] Processing action: {action}",app=app)
@@ -832,14 +824,16 @@ class Sim:
                 if action["ActionStatus"] != 2:  # Action is pending or in progress
                     # Handle frequency safety margin if enabled
                     if self.Config.EnforceFrequencySafetyMargin:
-                        AvgFreq = await GetAvgFrequency(self.BSPSSEPyGen, self.Config.Channels, DebugPrint=self.DebugPrint)
-                        if (self.Config.FreqSafetyMarginMin - AvgFreq) > 1e-3 or (AvgFreq - self.Config.FreqSafetyMarginMax) > 1e-3:
+                        # Channel values only change when psspy.run is called --> read them once per time step
+                        if AvgFreq is None:
+                            AvgFreq = await GetAvgFrequency(self.BSPSSEPyGen, self.Config.Channels, DebugPrint=self.DebugPrint)
+                        if AvgFreq < SimParams.FreqSafetyLow or AvgFreq > SimParams.FreqSafetyHigh:
                             if self.DebugPrint:
                                 bsprint(f"[DEBUG] Frequency deviation detected. Action delayed. (f_avg = {AvgFreq} Hz)", app=app)
                                 await asyncio.sleep(app.bsprintasynciotime if app else 0)
                             
                             if self.Config.AccountForActionExecutionDelays and not AccountedForDelay:
-                                self.TimeShift += self.Config.BSPSSEPyTimeStep # Increment by self.Config.BSPSSEPyTimeStep
+                                self.TimeShift += TimeStep # Increment by self.Config.BSPSSEPyTimeStep
                                 AccountedForDelay = True
                             continue  # Skip this action for now
 
@@ -948,7 +942,7 @@ class Sim:
                     BSPSSEPyGen=self.BSPSSEPyGen,
                     BSPSSEPyAGCDF = self.BSPSSEPyAGCDF,
                     Channels =self.Config.Channels,
-                    TimeStep=self.Config.BSPSSEPyTimeStep,
+                    TimeStep=TimeStep,
                     AGCTimeConstant=60.0,
                     Deadband=0.001, #Hz and Hz/s for rate of dev
                     DebugPrint=self.DebugPrint,
@@ -962,9 +956,9 @@ class Sim:
             #  Update Simulation Time
             # ==========================
             # Determine the next simulation time step to run
-            NextSimTime = CurrentSimTime + self.Config.BSPSSEPyTimeStep
+            NextSimTime = CurrentSimTime + TimeStep
             CutPrintMessagesFlag = False
-            if self.Config.BSPSSEPyHardTimeLimitFlag and CurrentSimTime >= self.Config.BSPSSEPyHardTimeLimit*60:
+            if self.Config.BSPSSEPyHardTimeLimitFlag and CurrentSimTime >= SimParams.HardTimeLimitSec:
                 CutPrintMessagesFlag = True
                 self.EndSimulationFlag = True
             elif not self.Config.BSPSSEPyHardTimeLimitFlag and FrequencyRegulated and AllActionsExecuted:
@@ -972,7 +966,7 @@ class Sim:
                 self.EndSimulationFlag = True
 
             # Print message only every BSPSSEPyProgressPrintTime minutes
-            if ((int(CurrentSimTime) // (self.Config.BSPSSEPyProgressPrintTime*60) != int(LastPrintedTime) // (self.Config.BSPSSEPyProgressPrintTime*60) and not CutPrintMessagesFlag) or CurrentSimTime == 0) & (self.DashBoardStyle == 0):
+            if ((int(CurrentSimTime) // SimParams.ProgressPrintSec != int(LastPrintedTime) // SimParams.ProgressPrintSec and not CutPrintMessagesFlag) or CurrentSimTime == 0) & (self.DashBoardStyle == 0):
                 if app == None:
                     bsprint(f"running simulation from {CurrentSimTime/60} to {CurrentSimTime/60 + self.Config.BSPSSEPyProgressPrintTime} minutes", app=app)
                     await asyncio.sleep(app.bsprintasynciotime if app else 0)
@@ -983,6 +977,8 @@ class Sim:
                     1000,                 # Number of time steps between channel value prints
                     50,                   # Number of time steps between writing output channel values
                     0)                    # Number of time steps between plotting CRT channels
+            ClearBrnInfoPSSECache()  # Branch data fetched from PSSE is only valid within one time step
+            ClearBusInfoPSSECache()  # Same for the bus data
 
             # Update the current simulation time
             CurrentSimTime = NextSimTime
@@ -998,6 +994,13 @@ class Sim:
         await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
 
+def _BusList(Buses):
+    """
+    Returns the monitored buses as a list of Python ints (psspy does not accept NumPy integer scalars).
+    """
+    return Buses.tolist() if isinstance(Buses, np.ndarray) else [int(bus) for bus in Buses]
+
+
 async def SetupVoltageFrequencyChannels(Config, DebugPrint = False, app=None):
     """
     Sets up voltage and frequency monitoring channels in PSSE.
@@ -1028,7 +1031,7 @@ async def SetupVoltageFrequencyChannels(Config, DebugPrint = False, app=None):
     bsprint("Setting up voltage channels...",app=app)
     await asyncio.sleep(app.bsprintasynciotime if app else 0)
 
-    for bus in Config.BusesToMonitor_Voltage:
+    for bus in _BusList(Config.BusesToMonitor_Voltage):
         # Add monitoring for voltage magnitude and angle
         ierr = psspy.voltage_and_angle_channel([-1, -1, -1, bus])
 
@@ -1085,7 +1088,7 @@ async def SetupVoltageFrequencyChannels(Config, DebugPrint = False, app=None):
     # ==========================
     bsprint("Setting up frequency channels...",app=app)
     await asyncio.sleep(app.bsprintasynciotime if app else 0)
-    for bus in Config.BusesToMonitor_Frequency:
+    for bus in _BusList(Config.BusesToMonitor_Frequency):
         # Add monitoring for frequency deviation
         ierr = psspy.bus_frequency_channel([-1, bus])
         if ierr == 0: